@@ -22,15 +22,11 @@
 # https://www.sphinx-doc.org/en/master/usage/configuration.html#project-information
 
 import importlib.metadata
-from html.parser import HTMLParser
-import json
+import os
 from pathlib import Path
 import posixpath
-import re
-import shutil
 import types
 import urllib.parse
-import zipfile
 
 from docutils import nodes
 from sphinx.application import Sphinx
@@ -40,12 +36,25 @@ from sphinxcontrib.doxylink.doxylink import Entry
 from myst_nb.sphinx_ import SphinxNbRenderer
 from myst_parser.mdit_to_docutils.base import token_line
 
+from lousd.buildhelpers import (
+    DEFAULT_ARCHIVE_COMPRESSLEVEL,
+    MANIFEST_FILE_NAME,
+    build_archives,
+    iter_asset_folders,
+    prepare_notebooks,
+    sync_trees,
+)
+
 
 project = 'Learn OpenUSD'
 copyright = '2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved'
 author = 'NVIDIA'
 release = importlib.metadata.version("lousd")
 
+# Flag the Notebooks executed by the build as documentation pages, whose large code snippets are paged through chunk
+# files of the `_static` directory rather than inlined:
+os.environ.setdefault("LOUSD_DOCS_BUILD", "1")
+
 # -- General configuration ---------------------------------------------------
 # https://www.sphinx-doc.org/en/master/usage/configuration.html#general-configuration
 
@@ -57,6 +66,7 @@ extensions = [
     'sphinx_copybutton',
     'sphinx_tippy',
     'lousd.directives',
+    'lousd.glossary',
 ]
 
 # Skip all URLs that don't match glossary term pattern
@@ -201,44 +211,41 @@ def setup_translators(app: Sphinx):
 
 
 def copy_asset_folders(app, exception):
+    """Incrementally copy the _assets folders of the docs into the HTML output."""
     if exception is not None:
         return
     
     source_dir = Path(app.srcdir)
     build_dir = Path(app.outdir)
     
-    for assets_path in source_dir.rglob('_assets'):
-        if assets_path.is_dir():
-            # Skip if the assets path is within _build directory
-            try:
-                assets_path.relative_to(source_dir / '_build')
-                continue  # Skip this path as it's in _build
-            except ValueError:
-                pass  # Not in _build, continue processing
-            
-            # Get the relative path from source directory
-            rel_path = assets_path.relative_to(source_dir)
-            dst_assets = build_dir / rel_path
-            
-            # Copy the assets folder
-            shutil.copytree(assets_path, dst_assets, dirs_exist_ok=True)
-            print(f"Copied {assets_path} to {dst_assets}")
+    # _build is pruned from the walk, and only new or changed files are copied, based on a manifest of the last sync
+    pairs = [
+        (assets_path, build_dir / assets_path.relative_to(source_dir))
+        for assets_path in iter_asset_folders(source_dir)
+    ]
+    result = sync_trees(pairs, build_dir / MANIFEST_FILE_NAME)
+    print(
+        f"Synchronized {len(pairs)} asset folders: {result.copied} copied, "
+        f"{result.unchanged} unchanged, {result.deleted} deleted"
+    )
 
 
 def create_exercises_archives(app, exception):
+    """Build the downloadable exercise archives, only rebuilding those whose content changed."""
+    if exception is not None:
+        return
+
     exercises_dir = Path(app.srcdir) / 'exercise_content'
     build_static_dir = Path(app.outdir) / '_static'
     
-    for exercises in exercises_dir.iterdir():
-        if exercises.is_dir():
-            # Create zip file for exercises
-            zip_file_name = f"{exercises.name}-exercise-files.zip".replace("_", "-")
-            zip_file_path = build_static_dir / zip_file_name
-            with zipfile.ZipFile(zip_file_path, 'w') as zip_file:
-                for file in exercises.rglob('*'):
-                    if file.is_file():
-                        zip_file.write(file, file.relative_to(exercises.parent))
-            print(f"Created {zip_file_path}")
+    jobs = [
+        (exercises, build_static_dir / f"{exercises.name}-exercise-files.zip".replace("_", "-"))
+        for exercises in sorted(exercises_dir.iterdir())
+        if exercises.is_dir()
+    ]
+    built = build_archives(jobs, compresslevel=app.config.exercise_archives_compresslevel)
+    for (_, zip_file_path), was_built in zip(jobs, built):
+        print(f"{'Created' if was_built else 'Up to date'}: {zip_file_path}")
 
 def prepare_executed_notebooks(app, exception):
     """Post-process executed notebooks: fix image paths."""
@@ -253,283 +260,24 @@ def prepare_executed_notebooks(app, exception):
         print(f"No notebooks directory found at {notebooks_dir}, skipping notebook preparation")
         return
     
-    # Copy images directory from HTML build to jupyter_execute
-    html_images = build_dir / '_images'
-    print(html_images)
-    nb_images = notebooks_dir / 'images'
-    if html_images.exists():
-        shutil.copytree(html_images, nb_images, dirs_exist_ok=True)
-        print(f"Copied {html_images} to {nb_images}")
+    # Sync images from the HTML build, and exercise_content so relative paths work at runtime. Both trees are synced
+    # together, as the manifest deletes the trees which are no longer synced:
+    pairs = [
+        (src, notebooks_dir / dst)
+        for src, dst in ((build_dir / '_images', 'images'), (source_dir / 'exercise_content', 'exercise_content'))
+        if src.is_dir()
+    ]
+    result = sync_trees(pairs, notebooks_dir / MANIFEST_FILE_NAME)
+    print(f"Synchronized notebook assets: {result.copied} copied, {result.unchanged} unchanged, {result.deleted} deleted")
     
-    # Find all notebooks
-    notebooks = list(notebooks_dir.rglob('*.ipynb'))
-    if not notebooks:
-        return
-    
-    print(f"Preparing {len(notebooks)} executed notebooks...")
-    
-    # Regex patterns
-    image_pattern = re.compile(r'!\[([^\]]*)\]\(([^)]+)\)')
-    
-    for nb_path in sorted(notebooks):
-        # Load notebook
-        with open(nb_path, 'r', encoding='utf-8') as f:
-            nb_data = json.load(f)
-        
-        # Calculate depth for image path rewriting
-        rel_path = nb_path.relative_to(notebooks_dir)
-        depth = len(rel_path.parent.parts)
-        image_prefix = '../' * depth + 'images/'
-        
-        modified = False
-        
-        # Process each cell
-        for cell in nb_data.get('cells', []):
-            if cell.get('cell_type') != 'markdown':
-                continue
-            
-            source = cell.get('source', [])
-            if isinstance(source, str):
-                source = [source]
-            
-            new_source = []
-            for line in source:
-                # Fix image paths
-                def replace_image(match):
-                    alt_text = match.group(1)
-                    img_path = match.group(2)
-                    # Only rewrite relative paths (not http/https)
-                    if not img_path.startswith(('http://', 'https://')):
-                        # Extract filename from path
-                        filename = Path(img_path).name
-                        new_path = image_prefix + filename
-                        return f'![{alt_text}]({new_path})'
-                    return match.group(0)
-                
-                line = image_pattern.sub(replace_image, line)
-                new_source.append(line)
-            
-            if new_source != source:
-                cell['source'] = new_source
-                modified = True
-        
-        # Save if modified
+    # Notebooks unchanged since they were last prepared are skipped, the others are prepared in parallel
+    results = prepare_notebooks(notebooks_dir)
+    for rel_path, modified in sorted(results.items()):
         if modified:
-            with open(nb_path, 'w', encoding='utf-8') as f:
-                json.dump(nb_data, f, indent=1, ensure_ascii=False)
             print(f"  Prepared {rel_path}")
-        
-    # Copy exercise_content into notebooks dir so relative paths work at runtime
-    exercise_src = source_dir / 'exercise_content'
-    if exercise_src.is_dir():
-        exercise_dst = notebooks_dir / 'exercise_content'
-        shutil.copytree(exercise_src, exercise_dst, dirs_exist_ok=True)
-        print(f"Copied {exercise_src} to {exercise_dst}")
-
+    print(f"Prepared {len(results)} executed notebooks")
 
 
-def extract_glossary_from_html(app, exception):
-    """Extract glossary data from the rendered HTML file for interactive graph visualization."""
-    if exception is not None:
-        return
-    
-    glossary_html_file = Path(app.outdir) / 'glossary.html'
-    
-    if not glossary_html_file.exists():
-        print("Warning: glossary.html not found, skipping graph data extraction")
-        return
-    
-    class GlossaryHTMLParser(HTMLParser):
-        def __init__(self):
-            super().__init__()
-            self.glossary_data = {}
-            self.current_term = None
-            self.current_aka = None
-            self.in_dd = False
-            self.in_aka_para = False
-            self.in_further_reading_para = False
-            self.description_html = []
-            self.current_links = []
-            self.capture_html = False
-            self.html_buffer = []
-            
-        def handle_starttag(self, tag, attrs):
-            attrs_dict = dict(attrs)
-            
-            # Start of a term
-            if tag == 'dt' and 'id' in attrs_dict and attrs_dict['id'].startswith('term-'):
-                self.current_term = None
-                self.current_aka = None
-                self.description_html = []
-                self.current_links = []
-                
-            # Start of definition
-            elif tag == 'dd':
-                self.in_dd = True
-                self.capture_html = False
-                
-            # Paragraph in definition
-            elif tag == 'p' and self.in_dd:
-                self.html_buffer = []
-                self.capture_html = True
-                
-            # Links in Further Reading
-            elif tag == 'a' and self.in_further_reading_para:
-                link_url = attrs_dict.get('href', '')
-                self.current_link_url = link_url
-                self.current_link_text = []
-                
-            # Capture HTML for description (but not the <p> tag itself)
-            if self.capture_html and not self.in_aka_para and not self.in_further_reading_para and tag != 'p':
-                self.html_buffer.append(self.get_starttag_text())
-                
-        def handle_endtag(self, tag):
-            if tag == 'dt':
-                pass
-                
-            elif tag == 'dd':
-                # Save the term
-                if self.current_term and self.description_html:
-                    self.glossary_data[self.current_term] = {
-                        'title': self.current_term,
-                        'aka': self.current_aka,
-                        'description_html': ''.join(self.description_html),
-                        'links': self.current_links.copy()
-                    }
-                self.in_dd = False
-                
-            elif tag == 'p':
-                if self.capture_html:
-                    # Check if this paragraph had metadata
-                    if not self.in_aka_para and not self.in_further_reading_para:
-                        # Wrap content in <p> tags for proper paragraph spacing
-                        para_content = ''.join(self.html_buffer).strip()
-                        if para_content:
-                            self.description_html.append(f'<p>{para_content}</p>')
-                    self.html_buffer = []
-                    self.capture_html = False
-                    self.in_aka_para = False
-                    self.in_further_reading_para = False
-                    
-            elif tag == 'a' and self.in_further_reading_para and hasattr(self, 'current_link_url'):
-                link_text = ''.join(self.current_link_text)
-                self.current_links.append({
-                    'text': link_text,
-                    'url': self.current_link_url
-                })
-                
-            # Capture HTML for description (but not the </p> tag itself)
-            if self.capture_html and not self.in_aka_para and not self.in_further_reading_para and tag != 'p':
-                self.html_buffer.append(f'</{tag}>')
-                
-        def handle_data(self, data):
-            # Extract term name from dt
-            if not self.in_dd and data.strip() and not self.current_term:
-                # Skip if it's just '#'  (headerlink)
-                if data.strip() != '#':
-                    self.current_term = data.strip()
-                    
-            # Check for metadata markers
-            if self.capture_html:
-                stripped_data = data.strip()
-                
-                if 'Also Known As:' in data:
-                    self.in_aka_para = True
-                    self.html_buffer = []  # Clear buffer for this para
-                    
-                elif 'Further Reading' in data:
-                    self.in_further_reading_para = True
-                    self.html_buffer = []  # Clear buffer for this para
-                    
-                # Capture link text
-                elif self.in_further_reading_para and hasattr(self, 'current_link_text'):
-                    self.current_link_text.append(data)
-                    
-                # Capture aka text (in emphasis tags)
-                elif self.in_aka_para:
-                    if stripped_data and stripped_data != 'Also Known As:':
-                        self.current_aka = stripped_data
-                        
-                # Capture description HTML
-                elif not self.in_aka_para and not self.in_further_reading_para:
-                    self.html_buffer.append(data)
-    
-    # Parse the glossary HTML
-    with open(glossary_html_file, 'r', encoding='utf-8') as f:
-        html_content = f.read()
-    
-    parser = GlossaryHTMLParser()
-    parser.feed(html_content)
-    glossary_data = parser.glossary_data
-    
-    # Save as JavaScript file
-    if glossary_data:
-        output_dir = Path(app.outdir) / '_static' / 'data'
-        output_dir.mkdir(parents=True, exist_ok=True)
-        output_file = output_dir / 'glossary-definitions.js'
-        
-        # Generate JavaScript content
-        js_content = "// Auto-generated glossary definitions from glossary.md\n"
-        js_content += "// DO NOT EDIT DIRECTLY - Edit docs/glossary.md instead\n\n"
-        js_content += "const glossaryDefinitions = {\n"
-        
-        for term, data in sorted(glossary_data.items()):
-            # Escape strings for JavaScript
-            title = data['title'].replace('\\', '\\\\').replace('"', '\\"')
-            aka = data['aka'].replace('\\', '\\\\').replace('"', '\\"') if data['aka'] else None
-            # For HTML, use JSON.stringify-style escaping for backticks
-            description_html = data['description_html'].replace('\\', '\\\\').replace('`', '\\`').replace('$', '\\$')
-            
-            js_content += f'    "{title}": {{\n'
-            js_content += f'        title: "{title}",\n'
-            
-            if aka:
-                js_content += f'        aka: "{aka}",\n'
-            else:
-                js_content += f'        aka: null,\n'
-            
-            # Use template literal for HTML content
-            js_content += f'        descriptionHtml: `{description_html}`,\n'
-            js_content += f'        links: [\n'
-            
-            for link in data['links']:
-                link_text = link['text'].replace('\\', '\\\\').replace('`', '\\`')
-                link_url = link['url'].replace('\\', '\\\\').replace('`', '\\`')
-                js_content += f'            {{text: `{link_text}`, url: `{link_url}`}},\n'
-            
-            js_content += '        ]\n'
-            js_content += '    },\n'
-        
-        js_content += "};\n"
-        
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(js_content)
-        
-        # Count nodes in graph structure for comparison
-        graph_structure_file = output_dir / 'glossary-graph-structure.js'
-        node_count = 0
-        if graph_structure_file.exists():
-            try:
-                with open(graph_structure_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    # Count node entries in the nodes array
-                    # Look for { id: 'Term', ... } patterns
-                    node_matches = re.findall(r'\{\s*id:\s*[\'"]([^\'"]+)[\'"]', content)
-                    node_count = len(node_matches)
-            except Exception as e:
-                print(f"Warning: Could not count nodes in graph structure: {e}")
-        
-        print(f"Glossary graph data: Extracted {len(glossary_data)} definitions from glossary.md")
-        if node_count > 0:
-            print(f"                     Graph structure has {node_count} nodes")
-            if len(glossary_data) < node_count:
-                print(f"                     ⚠️  Warning: {node_count - len(glossary_data)} nodes missing definitions!")
-            elif len(glossary_data) > node_count:
-                print(f"                     ℹ️  Note: {len(glossary_data) - node_count} definitions not shown in graph")
-        print(f"Generated {output_file}")
-    else:
-        print("Warning: No glossary data extracted from doctree")
-
 def monkey_patch_doxylink(app: Sphinx):
     print("Monkey patching doxylink entries to add details anchor to class and group entries")
     try:
@@ -578,11 +326,13 @@ def add_glossary_toc(app, pagename, templatename, context, doctree):
     context['glossary_terms'] = glossary_terms
 
 def setup(app):
+    # DEFLATE level of the exercise archives, e.g. `sphinx-build -D exercise_archives_compresslevel=9`
+    app.add_config_value('exercise_archives_compresslevel', DEFAULT_ARCHIVE_COMPRESSLEVEL, '', types=[int])
+
     # Wait for the builder to be initialized
     app.connect('builder-inited', setup_translators)
     app.connect('builder-inited', monkey_patch_doxylink)
     app.connect('html-page-context', add_glossary_toc)
-    app.connect('build-finished', extract_glossary_from_html)
     app.connect('build-finished', create_exercises_archives)
     app.connect('build-finished', copy_asset_folders)
     app.connect('build-finished', prepare_executed_notebooks)
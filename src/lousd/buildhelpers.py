@@ -0,0 +1,733 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Incremental file synchronization for the build hooks of the Learn OpenUSD documentation.
+
+Documentation builds copy the same asset folders into their output on every
+run. The helpers of this module only copy files which are new or changed since
+the previous build, and delete the outputs whose sources disappeared, based on
+a manifest recording the size, modification time and hash of every copied file.
+Downloadable ZIP archives are likewise only rebuilt when the content of the
+files they hold changes, and executed notebooks are only post-processed when
+they changed since they were last prepared. Files are materialized as reflinks
+or hard links where the filesystem supports them, rather than copied.
+
+For example, every `_assets` folder of the docs is synchronized into the HTML output with:
+
+    pairs = [(path, outdir / path.relative_to(srcdir)) for path in iter_asset_folders(srcdir)]
+    sync_trees(pairs, outdir / MANIFEST_FILE_NAME)
+"""
+
+import functools
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+import uuid
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Collection, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# Name of the manifest recording the files synchronized into a build output directory
+MANIFEST_FILE_NAME = ".lousd-sync-manifest.json"
+
+# Version of the manifest format, manifests of other versions being discarded
+MANIFEST_VERSION = 1
+
+# Directories never searched for asset folders, as they only hold build outputs
+EXCLUDED_DIR_NAMES = ("_build",)
+
+# Size of the blocks read when hashing files
+_HASH_BLOCK_SIZE = 1024 * 1024
+
+# Ways of materializing a file from its source, from the cheapest to the most expensive:
+# - "reflink" clones the file, sharing its blocks with the source until either is modified (copy-on-write)
+# - "hardlink" links the file to the source, sharing its content (writers must replace the file, not modify it)
+# - "copy" copies the content of the file
+LINK_MODES = ("reflink", "hardlink", "copy")
+
+# Link modes of trees which may be modified in place, such as synchronized outputs and the content of executed
+# Notebooks, and must therefore never share their content with their sources
+COPY_ON_WRITE_MODES = ("reflink", "copy")
+
+# Texture file types, which Notebooks only ever read and whose files may therefore be hard-linked to their sources
+TEXTURE_SUFFIXES = frozenset({".bmp", ".exr", ".hdr", ".jpeg", ".jpg", ".png", ".tga", ".tif", ".tiff"})
+
+# FICLONE ioctl request of Linux, cloning a file on filesystems with copy-on-write support (btrfs, XFS, ...)
+_FICLONE = 0x40049409
+
+# Default DEFLATE compression level of archives (from 0 to 9)
+DEFAULT_ARCHIVE_COMPRESSLEVEL = 6
+
+# Prefix of the archive comment recording the digest of the content of an archive
+_ARCHIVE_DIGEST_PREFIX = b"lousd-sha256:"
+
+# File types which are already compressed, stored as they are since deflating them again gains little
+_STORED_SUFFIXES = frozenset({".jpg", ".jpeg", ".png", ".zip", ".gz"})
+
+# Name of the manifest recording the digests of the notebooks prepared in a directory
+NOTEBOOK_MANIFEST_FILE_NAME = ".lousd-notebooks-manifest.json"
+
+# Markdown image links, capturing their alternative text and their path
+_IMAGE_LINK_PATTERN = re.compile(r'!\[([^\]]*)\]\(([^)]+)\)')
+
+
+@dataclass
+class SyncResult:
+    """
+    Number of files copied, left unchanged and deleted by a synchronization.
+    """
+
+    copied: int = 0
+    unchanged: int = 0
+    deleted: int = 0
+
+    def __iadd__(self, other: "SyncResult") -> "SyncResult":
+        self.copied += other.copied
+        self.unchanged += other.unchanged
+        self.deleted += other.deleted
+        return self
+
+
+def iter_asset_folders(
+    source_dir: Path,
+    folder_name: str = "_assets",
+    excluded_dir_names: Tuple[str, ...] = EXCLUDED_DIR_NAMES,
+) -> Iterator[Path]:
+    """
+    Find the asset folders of a source tree, without descending into build outputs.
+
+    Excluded directories are pruned from the walk rather than filtered out of its results, so that large build outputs
+    are never traversed.
+
+    Parameters:
+        source_dir (Path): Root of the source tree.
+        folder_name (str): Name of the asset folders to find.
+        excluded_dir_names (Tuple[str, ...]): Names of the directories not to descend into.
+
+    Return:
+        Iterator[Path]: The path of each asset folder, in sorted order.
+
+    """
+    for dir_path, dir_names, _ in os.walk(source_dir):
+        dir_names[:] = sorted(name for name in dir_names if name not in excluded_dir_names)
+        if folder_name in dir_names:
+            # Asset folders are synchronized as a whole, so there is no need to search them
+            dir_names.remove(folder_name)
+            yield Path(dir_path) / folder_name
+
+
+def hash_file(path: Path) -> str:
+    """
+    Compute the SHA-256 digest of a file.
+
+    Parameters:
+        path (Path): Path of the file to hash.
+
+    Return:
+        str: The hexadecimal digest of the content of the file.
+
+    """
+    hasher = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(_HASH_BLOCK_SIZE), b""):
+            hasher.update(block)
+    return hasher.hexdigest()
+
+
+def load_manifest(manifest_path: Path) -> Dict[str, Dict[str, dict]]:
+    """
+    Load the manifest of a previous synchronization.
+
+    Missing, unreadable or outdated manifests yield no entries, in which case every file is compared by hash.
+
+    Parameters:
+        manifest_path (Path): Path of the manifest file.
+
+    Return:
+        Dict[str, Dict[str, dict]]: The entries of the manifest, keyed by destination tree and then by file path
+            relative to it.
+
+    """
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+        return {}
+    return manifest.get("trees", {})
+
+
+def _create_temporary_file(path: Path) -> Tuple[int, Path]:
+    """
+    Create a uniquely named temporary file next to a file, open for writing.
+
+    The file is requested with mode 0o666, masked by the umask of the process like any file created with `open`,
+    rather than the owner-only permissions given by `tempfile.mkstemp`.
+
+    Parameters:
+        path (Path): Path of the file the temporary file is renamed to once written.
+
+    Return:
+        Tuple[int, Path]: The file descriptor and the path of the temporary file.
+
+    """
+    while True:
+        temporary_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            flags = os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, "O_BINARY", 0)
+            return os.open(temporary_path, flags, 0o666), temporary_path
+        except FileExistsError:
+            continue
+
+
+def _write_atomically(path: Path, content: bytes) -> None:
+    """
+    Write a file through a uniquely named temporary file renamed over it, so that readers never see a partial file and
+    concurrent writers (e.g. parallel Sphinx builds or test workers) never write to the same temporary file.
+
+    Parameters:
+        path (Path): Path of the file.
+        content (bytes): Content of the file.
+
+    Return:
+        None
+
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    file_descriptor, temporary_path = _create_temporary_file(path)
+    try:
+        with os.fdopen(file_descriptor, "wb") as f:
+            f.write(content)
+        os.replace(temporary_path, path)
+    except BaseException:
+        temporary_path.unlink(missing_ok=True)
+        raise
+
+
+def save_manifest(manifest_path: Path, trees: Dict[str, Dict[str, dict]]) -> None:
+    """
+    Atomically write the manifest of a synchronization.
+
+    Parameters:
+        manifest_path (Path): Path of the manifest file.
+        trees (Dict[str, Dict[str, dict]]): Entries of the manifest, keyed by destination tree and then by file path
+            relative to it.
+
+    Return:
+        None
+
+    """
+    content = json.dumps({"version": MANIFEST_VERSION, "trees": trees}, indent=1, sort_keys=True)
+    _write_atomically(manifest_path, content.encode("utf-8"))
+
+
+def write_if_changed(path: Path, content: bytes) -> bool:
+    """
+    Atomically write a generated file, unless it already holds the same content.
+
+    Leaving unchanged files untouched keeps their modification time, so that browsers and CDNs revalidating them keep
+    serving their cached copies.
+
+    Parameters:
+        path (Path): Path of the file.
+        content (bytes): Content of the file.
+
+    Return:
+        bool: `True` if the file was written.
+
+    """
+    if path.is_file() and path.stat().st_size == len(content):
+        if hash_file(path) == hashlib.sha256(content).hexdigest():
+            return False
+    _write_atomically(path, content)
+    return True
+
+
+def _remove_file(path: Path, root: Path) -> None:
+    """
+    Delete a file along with the directories it leaves empty, up to a root.
+
+    Parameters:
+        path (Path): Path of the file to delete.
+        root (Path): Directory above which empty directories are kept.
+
+    Return:
+        None
+
+    """
+    path.unlink(missing_ok=True)
+    directory = path.parent
+    while directory != root and root in directory.parents:
+        try:
+            directory.rmdir()
+        except OSError:
+            break
+        directory = directory.parent
+
+
+def _reflink(source_path: Path, destination_path: Path) -> None:
+    """
+    Clone a file, sharing its blocks with the source until either is modified.
+
+    An `OSError` is raised if the platform or the filesystem does not support cloning.
+
+    Parameters:
+        source_path (Path): Path of the file to clone.
+        destination_path (Path): Path of the clone, which must not exist.
+
+    Return:
+        None
+
+    """
+    if fcntl is None or not sys.platform.startswith("linux"):
+        raise OSError(f"Reflinks are not supported on {sys.platform}")
+    with open(source_path, "rb") as source, open(destination_path, "xb") as destination:
+        try:
+            fcntl.ioctl(destination.fileno(), _FICLONE, source.fileno())
+        except OSError:
+            destination.close()
+            destination_path.unlink(missing_ok=True)
+            raise
+    shutil.copystat(source_path, destination_path)
+
+
+def materialize_file(source_path: Path, destination_path: Path, modes: Tuple[str, ...] = LINK_MODES) -> str:
+    """
+    Materialize a file from its source, using the first supported link mode.
+
+    An existing destination is removed first rather than overwritten, so that the content it may share with another file
+    is never modified. The `OSError` of the last link mode is raised if none of them succeeded.
+
+    Parameters:
+        source_path (Path): Path of the source file.
+        destination_path (Path): Path of the file to create.
+        modes (Tuple[str, ...]): Link modes to try in order, among `LINK_MODES`.
+
+    Return:
+        str: The link mode used.
+
+    """
+    destination_path.parent.mkdir(parents=True, exist_ok=True)
+    destination_path.unlink(missing_ok=True)
+    for index, mode in enumerate(modes):
+        try:
+            if mode == "reflink":
+                _reflink(source_path, destination_path)
+            elif mode == "hardlink":
+                os.link(source_path, destination_path)
+            elif mode == "copy":
+                shutil.copy2(source_path, destination_path)
+            else:
+                raise ValueError(f"Unknown link mode {mode!r}, expected one of {LINK_MODES}")
+            return mode
+        except OSError:
+            if index == len(modes) - 1:
+                raise
+    raise ValueError("No link mode given")
+
+
+def materialize_tree(
+    source_dir: Path,
+    destination_dir: Path,
+    modes: Tuple[str, ...] = COPY_ON_WRITE_MODES,
+    read_only_suffixes: Collection[str] = (),
+) -> Dict[str, int]:
+    """
+    Materialize every file of a tree, using the first link mode supported for each file.
+
+    Files are never hard-linked by default, so that writing to the tree cannot modify its source. Files whose type is
+    only ever read, such as textures, may however be hard-linked on filesystems without reflink support, sparing their
+    copy. Link modes which fail are not tried again for the remaining files, as they generally fail for the whole
+    filesystem. A `FileNotFoundError` is raised if the source tree does not exist.
+
+    Parameters:
+        source_dir (Path): Root of the source tree.
+        destination_dir (Path): Root of the tree to create.
+        modes (Tuple[str, ...]): Link modes to try in order, among `LINK_MODES`.
+        read_only_suffixes (Collection[str]): Lowercase suffixes of the files which are never written to, materialized
+            with any of the `LINK_MODES` instead.
+
+    Return:
+        Dict[str, int]: The number of files materialized with each link mode.
+
+    """
+    if not source_dir.is_dir():
+        raise FileNotFoundError(f"Source tree not found: {source_dir}")
+    remaining_modes = {False: tuple(modes), True: LINK_MODES}
+    counts = dict.fromkeys(modes, 0)
+    for dir_path, dir_names, file_names in os.walk(source_dir):
+        rel_dir = Path(dir_path).relative_to(source_dir)
+        (destination_dir / rel_dir).mkdir(parents=True, exist_ok=True)
+        for file_name in file_names:
+            read_only = Path(file_name).suffix.lower() in read_only_suffixes
+            file_modes = remaining_modes[read_only]
+            mode = materialize_file(Path(dir_path) / file_name, destination_dir / rel_dir / file_name, file_modes)
+            counts[mode] = counts.get(mode, 0) + 1
+            remaining_modes[read_only] = file_modes[file_modes.index(mode):]
+    return counts
+
+
+def sync_tree(source_dir: Path, destination_dir: Path, entries: Dict[str, dict]) -> SyncResult:
+    """
+    Copy the new and changed files of a source tree, and delete stale outputs.
+
+    A file is left untouched when its size and modification time match its manifest entry and its copy still exists.
+    Otherwise its hash is compared with the one recorded, so that files whose modification time changed without their
+    content (e.g. after a checkout) are not copied again. Destination files recorded in the manifest whose source
+    disappeared are deleted, while files not recorded in it are never touched.
+
+    Parameters:
+        source_dir (Path): Root of the source tree.
+        destination_dir (Path): Root of the copy of the source tree.
+        entries (Dict[str, dict]): Manifest entries of the previous synchronization of the tree, keyed by file path
+            relative to the tree, updated in place.
+
+    Return:
+        SyncResult: The number of files copied, left unchanged and deleted.
+
+    """
+    result = SyncResult()
+    seen_paths = set()
+    for dir_path, dir_names, file_names in os.walk(source_dir):
+        dir_names.sort()
+        for file_name in sorted(file_names):
+            source_path = Path(dir_path) / file_name
+            rel_path = source_path.relative_to(source_dir).as_posix()
+            destination_path = destination_dir / rel_path
+            seen_paths.add(rel_path)
+
+            source_stat = source_path.stat()
+            entry = entries.get(rel_path)
+            destination_exists = destination_path.is_file()
+            if (entry is not None and destination_exists
+                    and entry["size"] == source_stat.st_size and entry["mtime_ns"] == source_stat.st_mtime_ns):
+                result.unchanged += 1
+                continue
+
+            digest = hash_file(source_path)
+            new_entry = {"size": source_stat.st_size, "mtime_ns": source_stat.st_mtime_ns, "sha256": digest}
+            if (entry is not None and destination_exists and entry["sha256"] == digest
+                    and destination_path.stat().st_size == source_stat.st_size):
+                result.unchanged += 1
+            else:
+                materialize_file(source_path, destination_path, COPY_ON_WRITE_MODES)
+                result.copied += 1
+            entries[rel_path] = new_entry
+
+    for rel_path in sorted(set(entries) - seen_paths):
+        _remove_file(destination_dir / rel_path, destination_dir)
+        del entries[rel_path]
+        result.deleted += 1
+    return result
+
+
+def sync_trees(pairs: List[Tuple[Path, Path]], manifest_path: Path) -> SyncResult:
+    """
+    Synchronize several trees, sharing a single manifest.
+
+    Destination trees recorded in the manifest but no longer synchronized (e.g. after an asset folder was removed from
+    the sources) have their files deleted. The manifest is only rewritten when it changed.
+
+    Parameters:
+        pairs (List[Tuple[Path, Path]]): Source and destination directories of each tree.
+        manifest_path (Path): Path of the manifest file.
+
+    Return:
+        SyncResult: The total number of files copied, left unchanged and deleted.
+
+    """
+    trees = load_manifest(manifest_path)
+    previous_trees = json.dumps(trees, sort_keys=True)
+
+    result = SyncResult()
+    synchronized_trees = set()
+    for source_dir, destination_dir in pairs:
+        tree_key = Path(os.path.relpath(destination_dir, manifest_path.parent)).as_posix()
+        synchronized_trees.add(tree_key)
+        result += sync_tree(source_dir, destination_dir, trees.setdefault(tree_key, {}))
+
+    for tree_key in sorted(set(trees) - synchronized_trees):
+        destination_dir = manifest_path.parent / tree_key
+        for rel_path in sorted(trees.pop(tree_key)):
+            _remove_file(destination_dir / rel_path, destination_dir)
+            result.deleted += 1
+        try:
+            destination_dir.rmdir()
+        except OSError:
+            pass
+
+    if json.dumps(trees, sort_keys=True) != previous_trees or not manifest_path.is_file():
+        save_manifest(manifest_path, trees)
+    return result
+
+
+def _list_files(source_dir: Path) -> List[Path]:
+    """
+    List the files of a tree, in a stable order.
+
+    Parameters:
+        source_dir (Path): Root of the tree.
+
+    Return:
+        List[Path]: The path of each file of the tree, sorted by path relative to the tree.
+
+    """
+    return sorted((path for path in source_dir.rglob("*") if path.is_file()), key=lambda path: path.as_posix())
+
+
+def hash_tree(source_dir: Path, base_dir: Path, salt: str = "") -> str:
+    """
+    Compute a digest of the paths and content of the files of a tree.
+
+    Parameters:
+        source_dir (Path): Root of the tree.
+        base_dir (Path): Directory relative to which the paths of the files are hashed.
+        salt (str): Additional data to hash, such as the options used to process the tree.
+
+    Return:
+        str: The hexadecimal digest of the tree.
+
+    """
+    hasher = hashlib.sha256(salt.encode("utf-8"))
+    for file_path in _list_files(source_dir):
+        hasher.update(f"\n{file_path.relative_to(base_dir).as_posix()}\n{hash_file(file_path)}".encode("utf-8"))
+    return hasher.hexdigest()
+
+
+def _read_archive_digest(zip_path: Path) -> Optional[str]:
+    """
+    Read the digest recorded in the comment of an archive.
+
+    Parameters:
+        zip_path (Path): Path of the archive.
+
+    Return:
+        Optional[str]: The digest of the content of the archive, or `None` if the archive is missing, unreadable or was
+            not built by `build_archive`.
+
+    """
+    try:
+        with zipfile.ZipFile(zip_path) as zip_file:
+            comment = zip_file.comment
+    except (OSError, zipfile.BadZipFile):
+        return None
+    if not comment.startswith(_ARCHIVE_DIGEST_PREFIX):
+        return None
+    return comment[len(_ARCHIVE_DIGEST_PREFIX):].decode("ascii", errors="replace")
+
+
+def build_archive(
+    source_dir: Path,
+    zip_path: Path,
+    base_dir: Optional[Path] = None,
+    compresslevel: int = DEFAULT_ARCHIVE_COMPRESSLEVEL,
+) -> bool:
+    """
+    Build a DEFLATE-compressed ZIP archive of a tree, unless it is up to date.
+
+    The digest of the content of the tree is recorded in the comment of the archive, which is only rebuilt when that
+    digest changes. The archive is written to a temporary file renamed over the previous one, so that an interrupted
+    build never leaves a truncated archive behind.
+
+    Parameters:
+        source_dir (Path): Root of the tree to archive.
+        zip_path (Path): Path of the archive.
+        base_dir (Optional[Path]): Directory relative to which files are named in the archive, or `None` to use the
+            parent of the tree so that it is extracted into a folder of its own.
+        compresslevel (int): DEFLATE compression level, from 0 to 9.
+
+    Return:
+        bool: `True` if the archive was built, `False` if it was already up to date.
+
+    """
+    if base_dir is None:
+        base_dir = source_dir.parent
+    digest = hash_tree(source_dir, base_dir, salt=f"compresslevel={compresslevel}")
+    if _read_archive_digest(zip_path) == digest:
+        return False
+
+    zip_path.parent.mkdir(parents=True, exist_ok=True)
+    file_descriptor, temporary_path = _create_temporary_file(zip_path)
+    try:
+        with os.fdopen(file_descriptor, "wb") as f:
+            with zipfile.ZipFile(f, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=compresslevel) as zip_file:
+                for file_path in _list_files(source_dir):
+                    compression = zipfile.ZIP_STORED if file_path.suffix.lower() in _STORED_SUFFIXES else None
+                    zip_file.write(file_path, file_path.relative_to(base_dir), compress_type=compression)
+                zip_file.comment = _ARCHIVE_DIGEST_PREFIX + digest.encode("ascii")
+        os.replace(temporary_path, zip_path)
+    except BaseException:
+        temporary_path.unlink(missing_ok=True)
+        raise
+    return True
+
+
+def build_archives(
+    jobs: List[Tuple[Path, Path]],
+    compresslevel: int = DEFAULT_ARCHIVE_COMPRESSLEVEL,
+    max_workers: Optional[int] = None,
+) -> List[bool]:
+    """
+    Build several archives in parallel, with one worker per archive.
+
+    Threads are enough to build archives concurrently, as both hashing and compressing release the GIL.
+
+    Parameters:
+        jobs (List[Tuple[Path, Path]]): Tree to archive and path of the archive, for each archive.
+        compresslevel (int): DEFLATE compression level, from 0 to 9.
+        max_workers (Optional[int]): Maximum number of archives built concurrently, or `None` for one per CPU core.
+
+    Return:
+        List[bool]: For each archive, in order, whether it was built rather than already up to date.
+
+    """
+    if not jobs:
+        return []
+    max_workers = max(1, min(max_workers or os.cpu_count() or 1, len(jobs)))
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="lousd-archive") as executor:
+        return list(executor.map(
+            lambda job: build_archive(job[0], job[1], compresslevel=compresslevel),
+            jobs,
+        ))
+
+
+def _replace_image_link(image_prefix: str, match: re.Match) -> str:
+    """
+    Point a Markdown image link to the shared images folder of the notebooks.
+
+    Parameters:
+        image_prefix (str): Relative path from the notebook to the images folder, ending with a slash.
+        match (re.Match): Match of the image link.
+
+    Return:
+        str: The rewritten image link, or the original one for remote images.
+
+    """
+    alt_text, image_path = match.groups()
+    # Only rewrite relative paths (not http/https)
+    if image_path.startswith(("http://", "https://")):
+        return match.group(0)
+    return f"![{alt_text}]({image_prefix}{Path(image_path).name})"
+
+
+def rewrite_image_links(nb_data: dict, image_prefix: str) -> bool:
+    """
+    Point the image links of the Markdown cells of a notebook to the shared images folder.
+
+    Parameters:
+        nb_data (dict): Content of the notebook, updated in place.
+        image_prefix (str): Relative path from the notebook to the images folder, ending with a slash.
+
+    Return:
+        bool: `True` if any link was rewritten.
+
+    """
+    replace_image_link = functools.partial(_replace_image_link, image_prefix)
+    modified = False
+    for cell in nb_data.get("cells", []):
+        if cell.get("cell_type") != "markdown":
+            continue
+        source = cell.get("source", [])
+        if isinstance(source, str):
+            source = [source]
+        new_source = [_IMAGE_LINK_PATTERN.sub(replace_image_link, line) for line in source]
+        if new_source != source:
+            cell["source"] = new_source
+            modified = True
+    return modified
+
+
+def prepare_notebook(nb_path: str, image_prefix: str) -> Tuple[str, bool]:
+    """
+    Post-process an executed notebook in place.
+
+    This is the unit of work of `prepare_notebooks`, run in worker processes.
+
+    Parameters:
+        nb_path (str): Path of the notebook.
+        image_prefix (str): Relative path from the notebook to the images folder, ending with a slash.
+
+    Return:
+        Tuple[str, bool]: The digest of the prepared notebook, and whether it had to be rewritten.
+
+    """
+    with open(nb_path, "rb") as f:
+        content = f.read()
+    nb_data = json.loads(content)
+    if not rewrite_image_links(nb_data, image_prefix):
+        return hashlib.sha256(content).hexdigest(), False
+
+    content = json.dumps(nb_data, indent=1, ensure_ascii=False).encode("utf-8")
+    _write_atomically(Path(nb_path), content)
+    return hashlib.sha256(content).hexdigest(), True
+
+
+def prepare_notebooks(notebooks_dir: Path, max_workers: Optional[int] = None) -> Dict[str, bool]:
+    """
+    Post-process the executed notebooks of a directory in parallel, skipping those already prepared.
+
+    Notebooks whose digest matches the one recorded after their last preparation are skipped. The others are prepared
+    in a pool of processes, as parsing and serializing JSON holds the GIL.
+
+    Parameters:
+        notebooks_dir (Path): Directory of the executed notebooks.
+        max_workers (Optional[int]): Maximum number of worker processes, or `None` for one per CPU core.
+
+    Return:
+        Dict[str, bool]: For each notebook which was not skipped, keyed by path relative to the directory, whether it
+            had to be rewritten.
+
+    """
+    manifest_path = notebooks_dir / NOTEBOOK_MANIFEST_FILE_NAME
+    trees = load_manifest(manifest_path)
+    previous_entries = trees.get(".", {})
+
+    entries = {}
+    pending = {}
+    for nb_path in sorted(notebooks_dir.rglob("*.ipynb")):
+        rel_path = nb_path.relative_to(notebooks_dir).as_posix()
+        entry = previous_entries.get(rel_path)
+        if entry is not None and entry["sha256"] == hash_file(nb_path):
+            entries[rel_path] = entry
+            continue
+        image_prefix = "../" * (len(rel_path.split("/")) - 1) + "images/"
+        pending[rel_path] = (str(nb_path), image_prefix)
+
+    results = {}
+    if pending:
+        max_workers = max(1, min(max_workers or os.cpu_count() or 1, len(pending)))
+        if max_workers == 1:
+            prepared = [prepare_notebook(*arguments) for arguments in pending.values()]
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                prepared = list(executor.map(prepare_notebook, *zip(*pending.values())))
+        for rel_path, (digest, modified) in zip(pending, prepared):
+            entries[rel_path] = {"sha256": digest}
+            results[rel_path] = modified
+
+    if entries != previous_entries or not manifest_path.is_file():
+        save_manifest(manifest_path, {".": entries})
+    return results
@@ -0,0 +1,271 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Sphinx extension writing the glossary definitions shown by the interactive glossary graph.
+
+The definition of every glossary term is collected from the doctrees of the
+glossary documents when they are read, and stored in the build environment so
+that incremental builds which do not read the glossary again still have them.
+Definitions are rendered to HTML once references are resolved, when the build
+finishes, into ``_static/data/glossary-definitions.js``.
+"""
+
+import json
+from pathlib import Path
+import re
+from typing import Any, Dict, List, Optional, Set
+
+from docutils import nodes
+from sphinx.application import Sphinx
+from sphinx.environment import BuildEnvironment
+
+from lousd.buildhelpers import write_if_changed
+
+
+# Name of the attribute of the build environment holding the definitions of the glossary terms, by document and term
+ENV_ATTRIBUTE_NAME = "lousd_glossary_definitions"
+
+# Path of the generated definitions, relative to the output directory
+DEFINITIONS_FILE_PATH = Path("_static") / "data" / "glossary-definitions.js"
+
+# Markers of the paragraphs of a definition holding its metadata rather than its description
+_ALSO_KNOWN_AS_MARKER = "Also Known As:"
+_FURTHER_READING_MARKER = "Further Reading"
+
+
+def _get_env_definitions(env: BuildEnvironment) -> Dict[str, Dict[str, nodes.definition]]:
+    """
+    Return the glossary definitions stored in the build environment, creating them when missing.
+
+    Parameters:
+        env (BuildEnvironment): Build environment of the Sphinx application.
+
+    Return:
+        Dict[str, Dict[str, nodes.definition]]: The definition node of each term, by name of the document defining it.
+
+    """
+    if not hasattr(env, ENV_ATTRIBUTE_NAME):
+        setattr(env, ENV_ATTRIBUTE_NAME, {})
+    return getattr(env, ENV_ATTRIBUTE_NAME)
+
+
+def collect_glossary_definitions(app: Sphinx, doctree: nodes.document) -> None:
+    """
+    Collect the definitions of the glossary terms of a document when it is read.
+
+    Only the documents listed in the `lousd_glossary_docnames` configuration value are collected. Definitions are
+    stored unresolved, as references are only resolved during the write phase, after the environment is saved.
+
+    Parameters:
+        app (Sphinx): The Sphinx application.
+        doctree (nodes.document): Doctree of the document being read.
+
+    Return:
+        None
+
+    """
+    docname = app.env.docname
+    if docname not in app.config.lousd_glossary_docnames:
+        return
+
+    definitions = {}
+    for deflist in doctree.findall(nodes.definition_list):
+        if 'glossary' not in deflist.get('classes', []):
+            continue
+        for deflist_item in deflist.findall(nodes.definition_list_item):
+            term_node = next(deflist_item.findall(nodes.term), None)
+            definition = next(deflist_item.findall(nodes.definition), None)
+            if term_node is not None and definition is not None:
+                definitions[term_node.astext().strip()] = definition.deepcopy()
+
+    if definitions:
+        _get_env_definitions(app.env)[docname] = definitions
+
+
+def purge_glossary_definitions(app: Sphinx, env: BuildEnvironment, docname: str) -> None:
+    """
+    Forget the glossary definitions of a document which is removed or about to be read again.
+
+    Parameters:
+        app (Sphinx): The Sphinx application.
+        env (BuildEnvironment): Build environment of the Sphinx application.
+        docname (str): Name of the document.
+
+    Return:
+        None
+
+    """
+    _get_env_definitions(env).pop(docname, None)
+
+
+def merge_glossary_definitions(app: Sphinx, env: BuildEnvironment, docnames: Set[str], other: BuildEnvironment) -> None:
+    """
+    Merge the glossary definitions collected by a parallel reader into the main build environment.
+
+    Parameters:
+        app (Sphinx): The Sphinx application.
+        env (BuildEnvironment): Main build environment.
+        docnames (Set[str]): Names of the documents read by the parallel reader.
+        other (BuildEnvironment): Build environment of the parallel reader.
+
+    Return:
+        None
+
+    """
+    definitions = _get_env_definitions(env)
+    other_definitions = _get_env_definitions(other)
+    for docname in docnames:
+        if docname in other_definitions:
+            definitions[docname] = other_definitions[docname]
+
+
+def render_glossary_definition(app: Sphinx, docname: str, title: str, definition: nodes.definition) -> Optional[dict]:
+    """
+    Render the definition of a glossary term for the interactive graph visualization.
+
+    The references of a copy of the definition are resolved as in the rendered document, before its description
+    paragraphs are rendered the way the HTML builder does. The "Also Known As" alias and "Further Reading" links are
+    read from the metadata paragraphs.
+
+    Parameters:
+        app (Sphinx): The Sphinx application, whose builder renders HTML.
+        docname (str): Name of the document defining the term.
+        title (str): Name of the term.
+        definition (nodes.definition): Unresolved definition of the term.
+
+    Return:
+        Optional[dict]: The title, alias, HTML description and links of the term, or `None` if it has no description.
+
+    """
+    container = nodes.container()
+    container += definition.deepcopy()
+    app.env.apply_post_transforms(container, docname)
+    definition = container[0]
+
+    aka = None
+    description_html = []
+    links: List[Dict[str, str]] = []
+    for paragraph in definition.children:
+        if not isinstance(paragraph, nodes.paragraph):
+            continue
+        markers = [strong.astext() for strong in paragraph.findall(nodes.strong)]
+        if not any(_ALSO_KNOWN_AS_MARKER in marker or _FURTHER_READING_MARKER in marker for marker in markers):
+            # Rendering reparents the node, so a copy is rendered to keep the definition whole while iterating it
+            description_html.append(app.builder.render_partial(paragraph.deepcopy())['fragment'].strip())
+            continue
+
+        # Metadata paragraph: the emphasis following "Also Known As:" and the links following "Further Reading"
+        section = None
+        for child in paragraph.children:
+            if isinstance(child, nodes.strong):
+                text = child.astext()
+                if _ALSO_KNOWN_AS_MARKER in text:
+                    section = 'aka'
+                elif _FURTHER_READING_MARKER in text:
+                    section = 'links'
+                else:
+                    section = None
+            elif section == 'aka' and isinstance(child, nodes.emphasis):
+                aka = child.astext().strip()
+            elif section == 'links':
+                for reference in child.findall(nodes.reference):
+                    url = reference.get('refuri') or '#' + reference.get('refid', '')
+                    links.append({'text': reference.astext(), 'url': url})
+
+    if not description_html:
+        return None
+    return {
+        'title': title,
+        'aka': aka,
+        'descriptionHtml': ''.join(description_html),
+        'links': links,
+    }
+
+
+def write_glossary_definitions(app: Sphinx, exception: Optional[Exception]) -> None:
+    """
+    Write the glossary definitions collected in the build environment for the interactive graph visualization.
+
+    The definitions are written as a single JSON payload, only when it changed so that cached copies stay valid between
+    deploys, and are then compared with the nodes of the graph structure.
+
+    Parameters:
+        app (Sphinx): The Sphinx application.
+        exception (Optional[Exception]): Exception raised by the build, if any.
+
+    Return:
+        None
+
+    """
+    if exception is not None or not hasattr(app.builder, 'render_partial'):
+        return
+
+    output_file = Path(app.outdir) / DEFINITIONS_FILE_PATH
+    glossary_data: Dict[str, Any] = {}
+    for docname, definitions in sorted(_get_env_definitions(app.env).items()):
+        for title, definition in definitions.items():
+            rendered_definition = render_glossary_definition(app, docname, title, definition)
+            if rendered_definition is not None:
+                glossary_data[title] = rendered_definition
+    if not glossary_data:
+        print("Warning: No glossary data extracted from doctree")
+        return
+
+    payload = json.dumps(glossary_data, indent=1, ensure_ascii=False, sort_keys=True)
+    js_content = (
+        "// Auto-generated glossary definitions from glossary.md\n"
+        "// DO NOT EDIT DIRECTLY - Edit docs/glossary.md instead\n\n"
+        f"const glossaryDefinitions = {payload};\n"
+    )
+    if not write_if_changed(output_file, js_content.encode('utf-8')):
+        print(f"Glossary graph data: {output_file} is up to date")
+        return
+
+    # Compare with the nodes of the graph structure
+    graph_structure_file = output_file.parent / 'glossary-graph-structure.js'
+    node_ids = set()
+    if graph_structure_file.exists():
+        content = graph_structure_file.read_text(encoding='utf-8')
+        node_ids = set(re.findall(r'\{\s*id:\s*[\'"]([^\'"]+)[\'"]', content))
+
+    print(f"Glossary graph data: Extracted {len(glossary_data)} definitions from glossary.md")
+    if node_ids:
+        print(f"                     Graph structure has {len(node_ids)} nodes")
+        missing = sorted(node_ids - glossary_data.keys())
+        if missing:
+            print(f"                     ⚠️  Warning: {len(missing)} nodes missing definitions: {', '.join(missing)}")
+        unshown_count = len(glossary_data.keys() - node_ids)
+        if unshown_count:
+            print(f"                     ℹ️  Note: {unshown_count} definitions not shown in graph")
+    print(f"Generated {output_file}")
+
+
+def setup(app: Sphinx):
+    """Sphinx extension setup function."""
+
+    # Documents whose glossary terms are written, e.g. `sphinx-build -D lousd_glossary_docnames=glossary`
+    app.add_config_value('lousd_glossary_docnames', ['glossary'], 'env', types=[list, tuple])
+
+    app.connect('doctree-read', collect_glossary_definitions)
+    app.connect('env-purge-doc', purge_glossary_definitions)
+    app.connect('env-merge-info', merge_glossary_definitions)
+    app.connect('build-finished', write_glossary_definitions)
+
+    return {
+        'version': '0.1.0',
+        'env_version': 1,
+        'parallel_read_safe': True,
+        'parallel_write_safe': True,
+    }
@@ -0,0 +1,1336 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""In-process conversion of OpenUSD Stages into binary glTF (GLB) content."""
+
+import json
+import logging
+import struct
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from pxr import Gf, Kind, Usd, UsdGeom, UsdLux, UsdShade
+
+from .simplification import simplify_triangles
+from .tessellation import tessellate_cube
+
+log = logging.getLogger(__name__)
+
+# glTF enumerations used when describing the content of binary buffers:
+_FLOAT = 5126
+_UNSIGNED_INT = 5125
+_ARRAY_BUFFER = 34962
+_ELEMENT_ARRAY_BUFFER = 34963
+
+# Meshes with fewer triangles than this are not simplified when exporting under a triangle budget, as they already
+# weigh little and would lose their shape:
+_MIN_SIMPLIFIED_TRIANGLES = 32
+
+# Sampled animation keys are dropped wherever the linear interpolation of the remaining keys reproduces them within
+# this tolerance, relative to the magnitude of the animated values:
+_ANIMATION_KEY_TOLERANCE = 1e-5
+
+# Maximum number of morph targets used to bake the animation of the points of a mesh, each one storing a full copy of
+# the positions of the mesh:
+_MAX_MORPH_TARGETS = 64
+
+# Purposes of the geometry left out of mesh exports, proxy geometry standing in for the render geometry also authored
+# next to it, which would otherwise be drawn twice:
+_SKIPPED_PURPOSES = (UsdGeom.Tokens.guide, UsdGeom.Tokens.proxy)
+
+# Identifiers of the chunks of a GLB container:
+_GLB_MAGIC = 0x46546C67
+_GLB_JSON_CHUNK = 0x4E4F534A
+_GLB_BIN_CHUNK = 0x004E4942
+
+
+class UnsupportedContentError(Exception):
+    """Raised when a USD Stage contains content which the in-process glTF exporter does not handle."""
+
+
+class _GlbDocument:
+    """
+    glTF document under construction, along with the binary buffer holding the data of its accessors.
+    """
+
+    def __init__(self) -> None:
+        self.json: Dict[str, Any] = {
+            "asset": {"version": "2.0", "generator": "lousd"},
+            "scene": 0,
+            "scenes": [{"nodes": []}],
+            "nodes": [],
+            "meshes": [],
+            "materials": [],
+            "accessors": [],
+            "bufferViews": [],
+            "buffers": [],
+        }
+        self.binary = bytearray()
+
+    def add_accessor(
+        self,
+        data: np.ndarray,
+        accessor_type: str,
+        target: Optional[int] = None,
+        with_bounds: bool = False,
+    ) -> int:
+        """
+        Append the given data to the binary buffer, and describe it with a new accessor.
+
+        Parameters:
+            data (np.ndarray): Data to store, either as `float32` or `uint32` values.
+            accessor_type (str): glTF type of the elements of the accessor (e.g. `SCALAR`, `VEC3`).
+            target (Optional[int]): Optional glTF target of the buffer view holding the data.
+            with_bounds (bool): Flag indicating whether to record the bounds of the data (required for positions).
+
+        Return:
+            int: The index of the new accessor.
+
+        """
+        # Each buffer view starts on a 4-byte boundary, as required for the component types used here:
+        self.binary.extend(b"\x00" * (-len(self.binary) % 4))
+
+        data = np.ascontiguousarray(data)
+        buffer_view: Dict[str, Any] = {
+            "buffer": 0,
+            "byteOffset": len(self.binary),
+            "byteLength": data.nbytes,
+        }
+        if target is not None:
+            buffer_view["target"] = target
+        self.binary.extend(data.tobytes())
+        self.json["bufferViews"].append(buffer_view)
+
+        accessor: Dict[str, Any] = {
+            "bufferView": len(self.json["bufferViews"]) - 1,
+            "componentType": _UNSIGNED_INT if data.dtype == np.uint32 else _FLOAT,
+            "count": len(data),
+            "type": accessor_type,
+        }
+        if with_bounds and len(data) > 0:
+            accessor["min"] = np.atleast_1d(data.min(axis=0)).tolist()
+            accessor["max"] = np.atleast_1d(data.max(axis=0)).tolist()
+        self.json["accessors"].append(accessor)
+        return len(self.json["accessors"]) - 1
+
+    def add_node(self, node: Dict[str, Any], parent_index: Optional[int]) -> int:
+        """
+        Add the given node to the document, either as a child of the given parent node or as a root of the scene.
+
+        Parameters:
+            node (Dict[str, Any]): The glTF node to add.
+            parent_index (Optional[int]): Index of the parent node, or `None` for a root node.
+
+        Return:
+            int: The index of the new node.
+
+        """
+        self.json["nodes"].append(node)
+        node_index = len(self.json["nodes"]) - 1
+        if parent_index is None:
+            self.json["scenes"][0]["nodes"].append(node_index)
+        else:
+            self.json["nodes"][parent_index].setdefault("children", []).append(node_index)
+        return node_index
+
+    def to_glb(self) -> bytes:
+        """
+        Serialize the document into a GLB container.
+
+        Parameters:
+            None
+
+        Return:
+            bytes: The GLB representation of the document.
+
+        """
+        self.binary.extend(b"\x00" * (-len(self.binary) % 4))
+        document = {key: value for key, value in self.json.items() if value != []}
+        if self.binary:
+            document["buffers"] = [{"byteLength": len(self.binary)}]
+
+        json_chunk = json.dumps(document, separators=(",", ":")).encode("utf-8")
+        json_chunk += b" " * (-len(json_chunk) % 4)
+
+        total_length = 12 + 8 + len(json_chunk)
+        if self.binary:
+            total_length += 8 + len(self.binary)
+
+        glb = bytearray(struct.pack("<III", _GLB_MAGIC, 2, total_length))
+        glb.extend(struct.pack("<II", len(json_chunk), _GLB_JSON_CHUNK))
+        glb.extend(json_chunk)
+        if self.binary:
+            glb.extend(struct.pack("<II", len(self.binary), _GLB_BIN_CHUNK))
+            glb.extend(self.binary)
+        return bytes(glb)
+
+
+def _triangulate(face_vertex_counts: np.ndarray, left_handed: bool) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Fan-triangulate the faces of a mesh.
+
+    Parameters:
+        face_vertex_counts (np.ndarray): Number of vertices of each face of the mesh.
+        left_handed (bool): Flag indicating whether the faces of the mesh are wound in left-handed order.
+
+    Return:
+        Tuple[np.ndarray, np.ndarray]: The face-vertex ("corner") indices of each triangle, as an `(N, 3)` array, along
+            with the index of the face from which each triangle was built.
+
+    """
+    face_starts = np.cumsum(face_vertex_counts) - face_vertex_counts
+    triangle_counts = np.maximum(face_vertex_counts - 2, 0)
+    face_of_triangle = np.repeat(np.arange(len(face_vertex_counts)), triangle_counts)
+    first_triangles = np.cumsum(triangle_counts) - triangle_counts
+    fan_offsets = np.arange(int(triangle_counts.sum())) - np.repeat(first_triangles, triangle_counts)
+
+    first_corners = face_starts[face_of_triangle]
+    corners = np.stack([first_corners, first_corners + fan_offsets + 1, first_corners + fan_offsets + 2], axis=1)
+    if left_handed:
+        corners = corners[:, [0, 2, 1]]
+    return corners, face_of_triangle
+
+
+def _decompose_transforms(matrices: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Decompose the given transformation matrices into translations, rotations and scales, ignoring any shear.
+
+    Parameters:
+        matrices (np.ndarray): `(N, 4, 4)` transformation matrices, following the row-vector convention of OpenUSD.
+
+    Return:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: The `(N, 3)` translations, `(N, 4)` rotations as unit quaternions
+            (in glTF `XYZW` order) and `(N, 3)` scales of the transformations.
+
+    """
+    translations = matrices[:, 3, :3]
+    basis = matrices[:, :3, :3]
+    scales = np.linalg.norm(basis, axis=2)
+
+    # Mirroring transforms are represented with a negative scale along the X axis, so that the rotation remains proper:
+    scales[np.linalg.det(basis) < 0.0, 0] *= -1.0
+    rows = np.divide(basis, scales[:, :, None], out=np.zeros_like(basis), where=scales[:, :, None] != 0.0)
+
+    # The rows of the basis are the images of the axes, which are the columns of the rotation under the column-vector
+    # convention of glTF:
+    r = rows.transpose(0, 2, 1)
+    w = np.sqrt(np.maximum(0.0, 1.0 + r[:, 0, 0] + r[:, 1, 1] + r[:, 2, 2])) / 2.0
+    x = np.copysign(np.sqrt(np.maximum(0.0, 1.0 + r[:, 0, 0] - r[:, 1, 1] - r[:, 2, 2])) / 2.0, r[:, 2, 1] - r[:, 1, 2])
+    y = np.copysign(np.sqrt(np.maximum(0.0, 1.0 - r[:, 0, 0] + r[:, 1, 1] - r[:, 2, 2])) / 2.0, r[:, 0, 2] - r[:, 2, 0])
+    z = np.copysign(np.sqrt(np.maximum(0.0, 1.0 - r[:, 0, 0] - r[:, 1, 1] + r[:, 2, 2])) / 2.0, r[:, 1, 0] - r[:, 0, 1])
+    rotations = np.stack([x, y, z, w], axis=1)
+    rotations /= np.linalg.norm(rotations, axis=1, keepdims=True)
+    return translations, rotations, scales
+
+
+def _reduce_keys(times: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """
+    Select the animation keys needed to reproduce the given samples by linear interpolation, within a tolerance.
+
+    Parameters:
+        times (np.ndarray): Increasing times of the samples.
+        values (np.ndarray): Sampled values, the first axis following the times of the samples.
+
+    Return:
+        np.ndarray: The indices of the samples to keep as animation keys, always including the first and last samples.
+
+    """
+    values = values.reshape(len(times), -1).astype(np.float64)
+    if len(times) <= 2:
+        return np.arange(len(times))
+    tolerance = _ANIMATION_KEY_TOLERANCE * max(float(np.abs(values).max()), 1.0)
+
+    # Starting from the first and last samples, the sample furthest from the interpolation of the current keys is added
+    # to each segment in which the tolerance is exceeded, all segments being refined at once:
+    samples = np.arange(len(times))
+    keys = np.array([0, len(times) - 1])
+    while True:
+        segments = np.clip(np.searchsorted(keys, samples, side="right") - 1, 0, len(keys) - 2)
+        starts, ends = keys[segments], keys[segments + 1]
+        ratios = ((times - times[starts]) / (times[ends] - times[starts]))[:, None]
+        errors = np.abs(values[starts] + (values[ends] - values[starts]) * ratios - values).max(axis=1)
+
+        by_segment_and_error = np.lexsort((-errors, segments))
+        _, first_of_segments = np.unique(segments[by_segment_and_error], return_index=True)
+        furthest_samples = by_segment_and_error[first_of_segments]
+        furthest_samples = furthest_samples[errors[furthest_samples] > tolerance]
+        if len(furthest_samples) == 0:
+            return keys
+        keys = np.union1d(keys, furthest_samples)
+
+
+def _expand_to_corners(
+    values: np.ndarray,
+    interpolation: str,
+    face_vertex_indices: np.ndarray,
+    face_of_corner: np.ndarray,
+) -> Optional[np.ndarray]:
+    """
+    Expand the values of a primvar so that there is one value for each face-vertex ("corner") of a mesh.
+
+    Parameters:
+        values (np.ndarray): Flattened values of the primvar.
+        interpolation (str): Interpolation mode of the primvar.
+        face_vertex_indices (np.ndarray): Point index of each corner of the mesh.
+        face_of_corner (np.ndarray): Face index of each corner of the mesh.
+
+    Return:
+        Optional[np.ndarray]: The value of the primvar at each corner of the mesh, or `None` if the number of values
+            does not match the interpolation mode of the primvar.
+
+    """
+    try:
+        if interpolation == UsdGeom.Tokens.constant:
+            return np.repeat(values[:1], len(face_vertex_indices), axis=0)
+        if interpolation == UsdGeom.Tokens.uniform:
+            return values[face_of_corner]
+        if interpolation in (UsdGeom.Tokens.vertex, UsdGeom.Tokens.varying):
+            return values[face_vertex_indices]
+        if interpolation == UsdGeom.Tokens.faceVarying and len(values) == len(face_vertex_indices):
+            return values
+    except IndexError:
+        pass
+    return None
+
+
+class _StageExporter:
+    """
+    Conversion of the composed content of a USD Stage into a glTF document.
+    """
+
+    def __init__(
+        self,
+        stage: Usd.Stage,
+        gpu_instancing: bool = True,
+        max_triangles: Optional[int] = None,
+        sample_rate: Optional[float] = None,
+        frame_range: Optional[Tuple[float, float]] = None,
+    ) -> None:
+        self.stage = stage
+        self.time = Usd.TimeCode.EarliestTime()
+        self.gpu_instancing = gpu_instancing
+        self.max_triangles = max_triangles
+        self.sample_rate = sample_rate
+        self.frame_range = frame_range
+        self.sample_times: Optional[np.ndarray] = None
+        self.triangle_ratio = 1.0
+        self.document = _GlbDocument()
+        self.material_indices: Dict[str, Optional[int]] = {}
+        self.double_sided_material_indices: Dict[int, int] = {}
+        self.mesh_indices: Dict[Tuple[Any, ...], Optional[int]] = {}
+        self.xform_cache = UsdGeom.XformCache(self.time)
+        self.extensions_used: List[str] = []
+        self.lights: List[Dict[str, Any]] = []
+        self.animation_channels: List[Dict[str, Any]] = []
+        self.animation_samplers: List[Dict[str, Any]] = []
+        self.time_accessors: Dict[bytes, int] = {}
+        self.morph_target_times: Dict[int, np.ndarray] = {}
+
+    def export(self) -> bytes:
+        """
+        Export the content of the USD Stage.
+
+        Parameters:
+            None
+
+        Return:
+            bytes: The GLB representation of the USD Stage.
+
+        """
+        if self.max_triangles is not None:
+            triangle_count = self._count_triangles()
+            if triangle_count > self.max_triangles:
+                self.triangle_ratio = self.max_triangles / triangle_count
+                log.debug(msg=f"Simplifying {triangle_count} triangles to fit a budget of {self.max_triangles}.")
+
+        self._export_children(prim=self.stage.GetPseudoRoot(), parent_index=None)
+
+        if self.animation_channels:
+            self.document.json["animations"] = [
+                {"name": "Animation", "channels": self.animation_channels, "samplers": self.animation_samplers}
+            ]
+        if self.lights:
+            self.extensions_used.append("KHR_lights_punctual")
+            self.document.json["extensions"] = {"KHR_lights_punctual": {"lights": self.lights}}
+        if self.extensions_used:
+            self.document.json["extensionsUsed"] = self.extensions_used
+        return self.document.to_glb()
+
+    def _count_triangles(self) -> int:
+        """
+        Count the triangles of the distinct meshes of the USD Stage, meshes sharing their topology being counted once
+        as they are exported once.
+
+        Parameters:
+            None
+
+        Return:
+            int: The number of triangles of the distinct meshes of the USD Stage.
+
+        """
+        triangle_count = 0
+        counted_sources = set()
+        for prim in Usd.PrimRange.Stage(self.stage, Usd.TraverseInstanceProxies(Usd.PrimDefaultPredicate)):
+            if not prim.IsA(UsdGeom.Mesh):
+                continue
+            face_vertex_counts_attribute = UsdGeom.Mesh(prim).GetFaceVertexCountsAttr()
+            source = self._get_value_source(face_vertex_counts_attribute)
+            if source is not None:
+                if source in counted_sources:
+                    continue
+                counted_sources.add(source)
+
+            face_vertex_counts = face_vertex_counts_attribute.Get(self.time)
+            if face_vertex_counts:
+                triangle_count += int(np.maximum(np.asarray(face_vertex_counts, dtype=np.int64) - 2, 0).sum())
+        return triangle_count
+
+    def _export_children(self, prim: Usd.Prim, parent_index: Optional[int]) -> None:
+        """
+        Export the children of the given USD Prim, including the descendants of instances.
+
+        Parameters:
+            prim (Usd.Prim): The USD Prim whose children to export.
+            parent_index (Optional[int]): Index of the glTF node under which to add the children.
+
+        Return:
+            None
+
+        """
+        for child in prim.GetFilteredChildren(Usd.TraverseInstanceProxies(Usd.PrimDefaultPredicate)):
+            self._export_prim(prim=child, parent_index=parent_index)
+
+    def _export_prim(self, prim: Usd.Prim, parent_index: Optional[int]) -> None:
+        """
+        Export the given USD Prim and its descendants, skipping invisible prims and prims with a `guide` or `proxy`
+        purpose.
+
+        Parameters:
+            prim (Usd.Prim): The USD Prim to export.
+            parent_index (Optional[int]): Index of the glTF node under which to add the USD Prim.
+
+        Return:
+            None
+
+        """
+        if prim.IsA(UsdShade.Material) or prim.IsA(UsdShade.Shader):
+            return
+        if prim.GetTypeName() in ("SkelRoot", "Skeleton"):
+            raise UnsupportedContentError(f'Unsupported prim type "{prim.GetTypeName()}" at "{prim.GetPath()}".')
+
+        if prim.IsA(UsdGeom.Imageable):
+            imageable = UsdGeom.Imageable(prim)
+            if imageable.GetVisibilityAttr().Get(self.time) == UsdGeom.Tokens.invisible:
+                return
+            if imageable.GetPurposeAttr().Get() in _SKIPPED_PURPOSES:
+                return
+
+        if not prim.IsA(UsdGeom.Xformable):
+            # Prims which do not carry a transform (e.g. `Scope`) do not need a node of their own:
+            self._export_children(prim=prim, parent_index=parent_index)
+            return
+
+        xformable = UsdGeom.Xformable(prim)
+        node: Dict[str, Any] = {"name": prim.GetName()}
+        if xformable.GetResetXformStack():
+            parent_index = None
+
+        animated_transforms = None
+        if xformable.TransformMightBeTimeVarying():
+            # Nodes targeted by animations are described by their translation, rotation and scale at the first sample:
+            animated_transforms = _decompose_transforms(np.stack([
+                np.array(xformable.GetLocalTransformation(Usd.TimeCode(time)), dtype=np.float64)
+                for time in self._get_sample_times()
+            ]))
+            for name, values in zip(("translation", "rotation", "scale"), animated_transforms):
+                node[name] = values[0].tolist()
+        else:
+            if xformable.GetResetXformStack():
+                transform = xformable.ComputeLocalToWorldTransform(self.time)
+            else:
+                transform = xformable.GetLocalTransformation(self.time)
+            matrix = np.array(transform, dtype=np.float64).ravel()
+            if not np.array_equal(matrix, np.eye(4).ravel()):
+                node["matrix"] = matrix.tolist()
+
+        if prim.IsA(UsdGeom.Mesh):
+            mesh_index = self._export_mesh(mesh=UsdGeom.Mesh(prim))
+            if mesh_index is not None:
+                node["mesh"] = mesh_index
+        elif prim.HasAPI(UsdLux.LightAPI):
+            light_index = self._export_light(prim=prim)
+            if light_index is not None:
+                node["extensions"] = {"KHR_lights_punctual": {"light": light_index}}
+
+        node_index = self.document.add_node(node=node, parent_index=parent_index)
+        if animated_transforms is not None:
+            self._add_transform_animation(node_index=node_index, transforms=animated_transforms)
+        if node.get("mesh") in self.morph_target_times:
+            self._add_morph_target_animation(node_index=node_index, mesh_index=node["mesh"])
+        if prim.IsA(UsdGeom.PointInstancer):
+            # Prims located under a point instancer are only rendered as its prototypes:
+            self._export_point_instancer(point_instancer=UsdGeom.PointInstancer(prim), parent_index=node_index)
+            return
+        self._export_children(prim=prim, parent_index=node_index)
+
+    def _get_sample_times(self) -> np.ndarray:
+        """
+        Return the time codes at which animated content is sampled, shared by all the animations of the USD Stage.
+
+        Samples are taken at the requested rate over the requested frame range, which defaults to the time code range of
+        the USD Stage or, when none is authored, to the range covered by its time samples.
+
+        Parameters:
+            None
+
+        Return:
+            np.ndarray: The increasing time codes of the samples.
+
+        """
+        if self.sample_times is not None:
+            return self.sample_times
+
+        if self.frame_range is not None:
+            start, end = self.frame_range
+        elif self.stage.HasAuthoredTimeCodeRange():
+            start, end = self.stage.GetStartTimeCode(), self.stage.GetEndTimeCode()
+        else:
+            authored_times = [
+                time
+                for prim in Usd.PrimRange.Stage(self.stage, Usd.TraverseInstanceProxies(Usd.PrimDefaultPredicate))
+                for attribute in prim.GetAttributes()
+                for time in attribute.GetTimeSamples()
+            ]
+            start, end = (min(authored_times), max(authored_times)) if authored_times else (0.0, 0.0)
+
+        # Samples are taken on every time code by default, the last sample always falling on the end of the range:
+        step = self.stage.GetTimeCodesPerSecond() / self.sample_rate if self.sample_rate else 1.0
+        sample_count = int(np.floor((end - start) / step + 1e-6)) + 1 if end > start else 1
+        sample_times = start + step * np.arange(sample_count)
+        if sample_times[-1] < end:
+            sample_times = np.append(sample_times, end)
+        self.sample_times = sample_times
+        log.debug(msg=f"Sampling animations at {len(sample_times)} time codes between {start} and {end}.")
+        return self.sample_times
+
+    def _add_animation_sampler(
+        self,
+        node_index: int,
+        path: str,
+        times: np.ndarray,
+        values: np.ndarray,
+        accessor_type: str,
+    ) -> None:
+        """
+        Animate the given property of a glTF node with the given keys, linearly interpolated.
+
+        Parameters:
+            node_index (int): Index of the animated glTF node.
+            path (str): Animated property of the node (`translation`, `rotation`, `scale` or `weights`).
+            times (np.ndarray): Time codes of the keys.
+            values (np.ndarray): Values of the animated property at each key.
+            accessor_type (str): glTF type of the values (e.g. `VEC3`).
+
+        Return:
+            None
+
+        """
+        # Animations start playing at the beginning of the sampled range, in seconds:
+        seconds = ((times - self._get_sample_times()[0]) / self.stage.GetTimeCodesPerSecond()).astype(np.float32)
+        time_key = seconds.tobytes()
+        if time_key not in self.time_accessors:
+            self.time_accessors[time_key] = self.document.add_accessor(seconds, "SCALAR", with_bounds=True)
+
+        self.animation_samplers.append({
+            "input": self.time_accessors[time_key],
+            "output": self.document.add_accessor(values.astype(np.float32), accessor_type),
+            "interpolation": "LINEAR",
+        })
+        self.animation_channels.append({
+            "sampler": len(self.animation_samplers) - 1,
+            "target": {"node": node_index, "path": path},
+        })
+
+    def _add_transform_animation(
+        self,
+        node_index: int,
+        transforms: Tuple[np.ndarray, np.ndarray, np.ndarray],
+    ) -> None:
+        """
+        Animate the transform of a glTF node with the given samples, only keeping the keys needed to reproduce them.
+
+        Parameters:
+            node_index (int): Index of the animated glTF node.
+            transforms (Tuple[np.ndarray, np.ndarray, np.ndarray]): The translations, rotations and scales of the node
+                at each sample time.
+
+        Return:
+            None
+
+        """
+        times = self._get_sample_times()
+        translations, rotations, scales = transforms
+
+        # Quaternions are interpolated along the shortest path, which requires consecutive samples to lie in the same
+        # hemisphere:
+        flips = np.concatenate([[1.0], np.sign(np.einsum("ij,ij->i", rotations[1:], rotations[:-1]) + 1e-12)])
+        rotations = rotations * np.cumprod(flips)[:, None]
+
+        for path, values, accessor_type in (
+            ("translation", translations, "VEC3"),
+            ("rotation", rotations, "VEC4"),
+            ("scale", scales, "VEC3"),
+        ):
+            keys = _reduce_keys(times, values)
+            # Channels holding a constant value are already described by the properties of the node:
+            if len(keys) == 2 and np.allclose(values[keys[0]], values[keys[1]]):
+                continue
+            self._add_animation_sampler(node_index, path, times[keys], values[keys], accessor_type)
+
+    def _add_morph_target_animation(self, node_index: int, mesh_index: int) -> None:
+        """
+        Animate the morph target weights of a glTF node, so that each morph target of its mesh is fully applied at the
+        time of the sample from which it was built.
+
+        Parameters:
+            node_index (int): Index of the animated glTF node.
+            mesh_index (int): Index of the glTF mesh of the node.
+
+        Return:
+            None
+
+        """
+        times = self.morph_target_times[mesh_index]
+        weights = np.vstack([np.zeros((1, len(times) - 1)), np.eye(len(times) - 1)])
+        self._add_animation_sampler(node_index, "weights", times, weights.ravel(), "SCALAR")
+
+    def _export_point_instancer(self, point_instancer: UsdGeom.PointInstancer, parent_index: int) -> None:
+        """
+        Export the instances of the given point instancer, each mesh of its prototypes being exported once and placed
+        at every instance of the prototype.
+
+        Instances are described using the `EXT_mesh_gpu_instancing` extension, or using one node for each instance of
+        each mesh when GPU instancing is disabled.
+
+        Parameters:
+            point_instancer (UsdGeom.PointInstancer): The point instancer to export.
+            parent_index (int): Index of the glTF node of the point instancer.
+
+        Return:
+            None
+
+        """
+        proto_indices = np.asarray(point_instancer.GetProtoIndicesAttr().Get(self.time) or [], dtype=np.int64)
+        if len(proto_indices) == 0:
+            return
+
+        instance_transforms = point_instancer.ComputeInstanceTransformsAtTime(
+            self.time,
+            self.time,
+            UsdGeom.PointInstancer.ExcludeProtoXform,
+            UsdGeom.PointInstancer.IgnoreMask,
+        )
+        if len(instance_transforms) != len(proto_indices):
+            log.warning(f'Skipping point instancer with inconsistent instance data at "{point_instancer.GetPath()}".')
+            return
+        instance_matrices = np.array(instance_transforms, dtype=np.float64).reshape(-1, 4, 4)
+
+        visible_instances = np.ones(len(proto_indices), dtype=bool)
+        mask = point_instancer.ComputeMaskAtTime(self.time)
+        if mask:
+            visible_instances &= np.asarray(mask, dtype=bool)
+
+        for prototype_index, prototype_path in enumerate(point_instancer.GetPrototypesRel().GetForwardedTargets()):
+            selected_instances = visible_instances & (proto_indices == prototype_index)
+            prototype = self.stage.GetPrimAtPath(prototype_path)
+            if not selected_instances.any() or not prototype:
+                continue
+
+            # Instances replace the transform of the parent of the prototype root, whose own transform still applies:
+            parent_to_world = np.linalg.inv(
+                np.array(self.xform_cache.GetLocalToWorldTransform(prototype.GetParent()), dtype=np.float64)
+            )
+            prim_range = iter(Usd.PrimRange(prototype, Usd.TraverseInstanceProxies(Usd.PrimDefaultPredicate)))
+            for prim in prim_range:
+                if prim.IsA(UsdGeom.PointInstancer):
+                    raise UnsupportedContentError(f'Nested point instancer at "{prim.GetPath()}".')
+                if prim.IsA(UsdGeom.Imageable):
+                    imageable = UsdGeom.Imageable(prim)
+                    if (imageable.GetVisibilityAttr().Get(self.time) == UsdGeom.Tokens.invisible
+                            or imageable.GetPurposeAttr().Get() in _SKIPPED_PURPOSES):
+                        prim_range.PruneChildren()
+                        continue
+                if not prim.IsA(UsdGeom.Mesh):
+                    continue
+
+                mesh_index = self._export_mesh(mesh=UsdGeom.Mesh(prim))
+                if mesh_index is None:
+                    continue
+                mesh_to_world = np.array(self.xform_cache.GetLocalToWorldTransform(prim), dtype=np.float64)
+                mesh_to_prototype = mesh_to_world @ parent_to_world
+                self._add_mesh_instances(
+                    name=prim.GetName(),
+                    mesh_index=mesh_index,
+                    matrices=mesh_to_prototype[None] @ instance_matrices[selected_instances],
+                    parent_index=parent_index,
+                )
+
+    def _add_mesh_instances(self, name: str, mesh_index: int, matrices: np.ndarray, parent_index: int) -> None:
+        """
+        Place the given glTF mesh at each of the given transforms, relative to the given parent node.
+
+        Parameters:
+            name (str): Name of the nodes holding the instances.
+            mesh_index (int): Index of the glTF mesh to instantiate.
+            matrices (np.ndarray): `(N, 4, 4)` transforms of the instances, relative to the parent node.
+            parent_index (int): Index of the glTF node under which to add the instances.
+
+        Return:
+            None
+
+        """
+        if not self.gpu_instancing:
+            for matrix in matrices:
+                node = {"name": name, "mesh": mesh_index, "matrix": matrix.ravel().tolist()}
+                self.document.add_node(node=node, parent_index=parent_index)
+            return
+
+        if "EXT_mesh_gpu_instancing" not in self.extensions_used:
+            self.extensions_used.append("EXT_mesh_gpu_instancing")
+        translations, rotations, scales = _decompose_transforms(matrices)
+        instancing = {
+            "attributes": {
+                "TRANSLATION": self.document.add_accessor(translations.astype(np.float32), "VEC3"),
+                "ROTATION": self.document.add_accessor(rotations.astype(np.float32), "VEC4"),
+                "SCALE": self.document.add_accessor(scales.astype(np.float32), "VEC3"),
+            },
+        }
+        self.document.add_node(
+            node={"name": name, "mesh": mesh_index, "extensions": {"EXT_mesh_gpu_instancing": instancing}},
+            parent_index=parent_index,
+        )
+
+    def _get_value_source(self, attribute: Usd.Attribute) -> Optional[Tuple[str, str]]:
+        """
+        Return the location of the strongest opinion providing the value of the given attribute.
+
+        Parameters:
+            attribute (Usd.Attribute): The attribute for which to locate the value.
+
+        Return:
+            Optional[Tuple[str, str]]: The identifier of the layer and the path of the property spec holding the value,
+                or `None` if the attribute has no authored value.
+
+        """
+        if not attribute:
+            return None
+        for property_spec in attribute.GetPropertyStack(self.time):
+            if property_spec.HasDefaultValue() or property_spec.layer.GetNumTimeSamplesForPath(property_spec.path):
+                return property_spec.layer.identifier, str(property_spec.path)
+        return None
+
+    def _get_mesh_key(self, mesh: UsdGeom.Mesh) -> Optional[Tuple[Any, ...]]:
+        """
+        Return a key identifying the content of the glTF mesh converted from the given USD Mesh.
+
+        USD Meshes whose attributes are resolved from the same opinions (e.g. instance proxies of a prototype, or
+        meshes inheriting from the same tessellated primitive) and which are bound to the same materials share the same
+        key, so that they can share a single glTF mesh.
+
+        Parameters:
+            mesh (UsdGeom.Mesh): The USD Mesh for which to compute a key.
+
+        Return:
+            Optional[Tuple[Any, ...]]: The key of the glTF mesh, or `None` if the geometry of the USD Mesh is not
+                authored.
+
+        """
+        geometry_sources = tuple(
+            self._get_value_source(attribute)
+            for attribute in (mesh.GetPointsAttr(), mesh.GetFaceVertexCountsAttr(), mesh.GetFaceVertexIndicesAttr())
+        )
+        if None in geometry_sources:
+            return None
+
+        attributes = [mesh.GetNormalsAttr(), mesh.GetOrientationAttr(), mesh.GetDoubleSidedAttr()]
+        for primvar in (UsdGeom.PrimvarsAPI(mesh).GetPrimvar("normals"), mesh.GetDisplayColorPrimvar()):
+            if primvar:
+                attributes.extend([primvar.GetAttr(), primvar.GetIndicesAttr()])
+        attribute_sources = tuple(self._get_value_source(attribute) for attribute in attributes)
+
+        material_sources = [self._get_bound_material_index(prim=mesh.GetPrim())]
+        for subset in UsdShade.MaterialBindingAPI(mesh.GetPrim()).GetMaterialBindSubsets():
+            subset_source = self._get_value_source(subset.GetIndicesAttr())
+            material_sources.append((subset_source, self._get_bound_material_index(prim=subset.GetPrim())))
+        return geometry_sources + attribute_sources + tuple(material_sources)
+
+    def _export_mesh(self, mesh: UsdGeom.Mesh) -> Optional[int]:
+        """
+        Export the given USD Mesh as a glTF mesh, reusing the glTF mesh already exported for identical USD Meshes.
+
+        Parameters:
+            mesh (UsdGeom.Mesh): The USD Mesh to export.
+
+        Return:
+            Optional[int]: The index of the glTF mesh, or `None` if the USD Mesh holds no geometry.
+
+        """
+        mesh_key = self._get_mesh_key(mesh=mesh)
+        if mesh_key is not None and mesh_key in self.mesh_indices:
+            return self.mesh_indices[mesh_key]
+
+        mesh_index = self._convert_mesh(mesh=mesh)
+        if mesh_key is not None:
+            self.mesh_indices[mesh_key] = mesh_index
+        return mesh_index
+
+    def _convert_mesh(self, mesh: UsdGeom.Mesh) -> Optional[int]:
+        """
+        Convert the given USD Mesh into a glTF mesh, with one glTF primitive for each group of faces sharing a material.
+
+        Parameters:
+            mesh (UsdGeom.Mesh): The USD Mesh to convert.
+
+        Return:
+            Optional[int]: The index of the glTF mesh, or `None` if the USD Mesh holds no geometry.
+
+        """
+        points = mesh.GetPointsAttr().Get(self.time)
+        face_vertex_counts = mesh.GetFaceVertexCountsAttr().Get(self.time)
+        face_vertex_indices = mesh.GetFaceVertexIndicesAttr().Get(self.time)
+        if not points or not face_vertex_counts or not face_vertex_indices:
+            return None
+
+        points = np.asarray(points, dtype=np.float32)
+        face_vertex_counts = np.asarray(face_vertex_counts, dtype=np.int64)
+        face_vertex_indices = np.asarray(face_vertex_indices, dtype=np.int64)
+        if face_vertex_counts.sum() != len(face_vertex_indices) or face_vertex_indices.max() >= len(points):
+            log.warning(f'Skipping mesh with inconsistent topology at "{mesh.GetPath()}".')
+            return None
+
+        left_handed = mesh.GetOrientationAttr().Get() == UsdGeom.Tokens.leftHanded
+        triangle_corners, face_of_triangle = _triangulate(face_vertex_counts, left_handed)
+        face_of_corner = np.repeat(np.arange(len(face_vertex_counts)), face_vertex_counts)
+
+        # Every attribute is emitted per face-vertex ("corner"), so that face-varying and uniform primvars map onto
+        # glTF vertex attributes without any further splitting of the vertices:
+        corner_attributes = {"POSITION": points[face_vertex_indices]}
+
+        normals = self._get_normals(mesh=mesh, face_vertex_indices=face_vertex_indices, face_of_corner=face_of_corner)
+        if normals is not None:
+            corner_attributes["NORMAL"] = normals
+
+        display_color_primvar = mesh.GetDisplayColorPrimvar()
+        if display_color_primvar and display_color_primvar.HasAuthoredValue():
+            display_colors = display_color_primvar.ComputeFlattened(self.time)
+            if display_colors:
+                colors = _expand_to_corners(
+                    values=np.asarray(display_colors, dtype=np.float32),
+                    interpolation=display_color_primvar.GetInterpolation(),
+                    face_vertex_indices=face_vertex_indices,
+                    face_of_corner=face_of_corner,
+                )
+                if colors is not None:
+                    corner_attributes["COLOR_0"] = colors
+
+        # Animated points are baked into morph targets, whose vertices must match the vertices of the mesh:
+        morph_targets = self._sample_morph_targets(mesh=mesh, face_vertex_indices=face_vertex_indices)
+        if morph_targets is not None:
+            target_times, corner_positions = morph_targets
+            corner_attributes["POSITION"] = corner_positions[0]
+        elif self.triangle_ratio < 1.0 and len(triangle_corners) > _MIN_SIMPLIFIED_TRIANGLES:
+            simplified = simplify_triangles(
+                positions=corner_attributes["POSITION"],
+                triangles=triangle_corners,
+                max_triangles=max(int(len(triangle_corners) * self.triangle_ratio), _MIN_SIMPLIFIED_TRIANGLES),
+                normals=corner_attributes.get("NORMAL"),
+            )
+            corner_attributes["POSITION"] = simplified.positions.astype(np.float32)
+            face_of_triangle = face_of_triangle[simplified.source_triangles]
+
+            # Only the corners still referenced by the remaining triangles are emitted:
+            used_corners, triangle_corners = np.unique(simplified.triangles, return_inverse=True)
+            triangle_corners = triangle_corners.reshape(-1, 3)
+            corner_attributes = {name: values[used_corners] for name, values in corner_attributes.items()}
+
+        attributes = {
+            name: self.document.add_accessor(values, "VEC3", target=_ARRAY_BUFFER, with_bounds=name == "POSITION")
+            for name, values in corner_attributes.items()
+        }
+
+        targets = []
+        if morph_targets is not None:
+            targets = [
+                {"POSITION": self.document.add_accessor(
+                    positions - corner_positions[0], "VEC3", target=_ARRAY_BUFFER, with_bounds=True
+                )}
+                for positions in corner_positions[1:]
+            ]
+
+        double_sided = bool(mesh.GetDoubleSidedAttr().Get())
+        primitives = []
+        for face_mask, material_index in self._get_face_groups(mesh=mesh, face_count=len(face_vertex_counts)):
+            indices = triangle_corners if face_mask is None else triangle_corners[face_mask[face_of_triangle]]
+            if len(indices) == 0:
+                continue
+            primitive: Dict[str, Any] = {
+                "attributes": attributes,
+                "indices": self.document.add_accessor(
+                    indices.astype(np.uint32).ravel(), "SCALAR", target=_ELEMENT_ARRAY_BUFFER
+                ),
+            }
+            if targets:
+                primitive["targets"] = targets
+            if material_index is not None:
+                primitive["material"] = (
+                    self._get_double_sided_material(material_index=material_index) if double_sided else material_index
+                )
+            primitives.append(primitive)
+
+        if not primitives:
+            return None
+        gltf_mesh: Dict[str, Any] = {"name": mesh.GetPrim().GetName(), "primitives": primitives}
+        if targets:
+            gltf_mesh["weights"] = [0.0] * len(targets)
+        self.document.json["meshes"].append(gltf_mesh)
+        mesh_index = len(self.document.json["meshes"]) - 1
+        if targets:
+            self.morph_target_times[mesh_index] = target_times
+        return mesh_index
+
+    def _sample_morph_targets(
+        self,
+        mesh: UsdGeom.Mesh,
+        face_vertex_indices: np.ndarray,
+    ) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Sample the animated points of the given USD Mesh, only keeping the samples needed to reproduce the animation.
+
+        Parameters:
+            mesh (UsdGeom.Mesh): The USD Mesh whose points to sample.
+            face_vertex_indices (np.ndarray): Point index of each corner of the mesh.
+
+        Return:
+            Optional[Tuple[np.ndarray, np.ndarray]]: The time codes of the kept samples along with the `(T, N, 3)`
+                positions of the corners of the mesh at each of them, or `None` if the points of the mesh are not
+                animated.
+
+        """
+        points_attribute = mesh.GetPointsAttr()
+        if not points_attribute.ValueMightBeTimeVarying():
+            return None
+        if (mesh.GetFaceVertexCountsAttr().ValueMightBeTimeVarying()
+                or mesh.GetFaceVertexIndicesAttr().ValueMightBeTimeVarying()):
+            raise UnsupportedContentError(f'Animated topology at "{mesh.GetPath()}".')
+
+        times = self._get_sample_times()
+        samples = [points_attribute.Get(Usd.TimeCode(time)) for time in times]
+        if any(len(points) != len(samples[0]) for points in samples):
+            raise UnsupportedContentError(f'Varying number of points at "{mesh.GetPath()}".')
+        corner_positions = np.asarray(samples, dtype=np.float32)[:, face_vertex_indices]
+
+        keys = _reduce_keys(times, corner_positions)
+        if len(keys) > _MAX_MORPH_TARGETS + 1:
+            log.debug(msg=f'Resampling animated points of "{mesh.GetPath()}" to {_MAX_MORPH_TARGETS} morph targets.')
+            keys = np.unique(np.linspace(0, len(times) - 1, _MAX_MORPH_TARGETS + 1).round().astype(np.int64))
+        if len(keys) == 2 and np.array_equal(corner_positions[keys[0]], corner_positions[keys[1]]):
+            return None
+        return times[keys], corner_positions[keys]
+
+    def _get_normals(
+        self,
+        mesh: UsdGeom.Mesh,
+        face_vertex_indices: np.ndarray,
+        face_of_corner: np.ndarray,
+    ) -> Optional[np.ndarray]:
+        """
+        Return the normalized normals of the given USD Mesh, expanded to one normal for each face-vertex.
+
+        Parameters:
+            mesh (UsdGeom.Mesh): The USD Mesh from which to read normals.
+            face_vertex_indices (np.ndarray): Point index of each corner of the mesh.
+            face_of_corner (np.ndarray): Face index of each corner of the mesh.
+
+        Return:
+            Optional[np.ndarray]: The normal of each corner of the mesh, or `None` if the mesh has no usable normals.
+
+        """
+        normals_primvar = UsdGeom.PrimvarsAPI(mesh).GetPrimvar("normals")
+        if normals_primvar and normals_primvar.HasAuthoredValue():
+            values = normals_primvar.ComputeFlattened(self.time)
+            interpolation = normals_primvar.GetInterpolation()
+        else:
+            values = mesh.GetNormalsAttr().Get(self.time)
+            interpolation = mesh.GetNormalsInterpolation()
+        if not values:
+            return None
+
+        normals = _expand_to_corners(
+            values=np.asarray(values, dtype=np.float32),
+            interpolation=interpolation,
+            face_vertex_indices=face_vertex_indices,
+            face_of_corner=face_of_corner,
+        )
+        if normals is None:
+            return None
+        lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+        return np.divide(normals, lengths, out=np.zeros_like(normals), where=lengths > 0)
+
+    def _get_face_groups(self, mesh: UsdGeom.Mesh, face_count: int) -> List[Tuple[Optional[np.ndarray], Optional[int]]]:
+        """
+        Return the groups of faces of the given mesh sharing the same bound material.
+
+        Parameters:
+            mesh (UsdGeom.Mesh): The mesh for which to group faces.
+            face_count (int): Number of faces of the mesh.
+
+        Return:
+            List[Tuple[Optional[np.ndarray], Optional[int]]]: Pairs made of a boolean mask selecting faces of the group
+                (or `None` for all faces), and of the index of the glTF material bound to them.
+
+        """
+        mesh_material_index = self._get_bound_material_index(prim=mesh.GetPrim())
+        subsets = UsdShade.MaterialBindingAPI(mesh.GetPrim()).GetMaterialBindSubsets()
+        if not subsets:
+            return [(None, mesh_material_index)]
+
+        face_groups = []
+        unassigned_faces = np.ones(face_count, dtype=bool)
+        for subset in subsets:
+            face_indices = np.asarray(subset.GetIndicesAttr().Get(self.time) or [], dtype=np.int64)
+            face_indices = face_indices[(face_indices >= 0) & (face_indices < face_count)]
+            face_mask = np.zeros(face_count, dtype=bool)
+            face_mask[face_indices] = True
+            unassigned_faces &= ~face_mask
+            material_index = self._get_bound_material_index(prim=subset.GetPrim())
+            face_groups.append((face_mask, material_index if material_index is not None else mesh_material_index))
+        if unassigned_faces.any():
+            face_groups.append((unassigned_faces, mesh_material_index))
+        return face_groups
+
+    def _get_bound_material_index(self, prim: Usd.Prim) -> Optional[int]:
+        """
+        Return the index of the glTF material converted from the USD Material bound to the given USD Prim.
+
+        Parameters:
+            prim (Usd.Prim): The USD Prim (or GeomSubset) for which to resolve the material binding.
+
+        Return:
+            Optional[int]: The index of the glTF material, or `None` if no supported material is bound.
+
+        """
+        material, _ = UsdShade.MaterialBindingAPI(prim).ComputeBoundMaterial()
+        if not material:
+            return None
+
+        material_path = str(material.GetPath())
+        if material_path not in self.material_indices:
+            self.material_indices[material_path] = self._export_material(material=material)
+        return self.material_indices[material_path]
+
+    def _get_double_sided_material(self, material_index: int) -> int:
+        """
+        Return the double-sided variant of the given glTF material, so that single-sided meshes bound to the same USD
+        Material keep culling their back faces.
+
+        Parameters:
+            material_index (int): The index of the glTF material.
+
+        Return:
+            int: The index of a copy of the glTF material which is double-sided.
+
+        """
+        if material_index not in self.double_sided_material_indices:
+            materials = self.document.json["materials"]
+            materials.append({**materials[material_index], "doubleSided": True})
+            self.double_sided_material_indices[material_index] = len(materials) - 1
+        return self.double_sided_material_indices[material_index]
+
+    def _export_material(self, material: UsdShade.Material) -> Optional[int]:
+        """
+        Export the given USD Material as a glTF metallic-roughness material, from its `UsdPreviewSurface` shader.
+
+        Parameters:
+            material (UsdShade.Material): The USD Material to export.
+
+        Return:
+            Optional[int]: The index of the glTF material, or `None` if the surface is not a `UsdPreviewSurface`.
+
+        """
+        shader = material.ComputeSurfaceSource()[0]
+        if not shader or shader.GetIdAttr().Get() != "UsdPreviewSurface":
+            return None
+
+        def _get_input_value(name: str, default: Any) -> Any:
+            shader_input = shader.GetInput(name)
+            if not shader_input:
+                return default
+            if shader_input.HasConnectedSource():
+                raise UnsupportedContentError(f'Connected shader input "{shader_input.GetAttr().GetPath()}".')
+            value = shader_input.Get()
+            return default if value is None else value
+
+        diffuse_color = _get_input_value("diffuseColor", (0.18, 0.18, 0.18))
+        opacity = float(_get_input_value("opacity", 1.0))
+        gltf_material: Dict[str, Any] = {
+            "name": material.GetPrim().GetName(),
+            "pbrMetallicRoughness": {
+                "baseColorFactor": [float(diffuse_color[0]), float(diffuse_color[1]), float(diffuse_color[2]), opacity],
+                "metallicFactor": float(_get_input_value("metallic", 0.0)),
+                "roughnessFactor": float(_get_input_value("roughness", 0.5)),
+            },
+        }
+        emissive_color = _get_input_value("emissiveColor", (0.0, 0.0, 0.0))
+        if any(emissive_color):
+            gltf_material["emissiveFactor"] = [min(float(component), 1.0) for component in emissive_color]
+        if opacity < 1.0:
+            gltf_material["alphaMode"] = "BLEND"
+
+        self.document.json["materials"].append(gltf_material)
+        return len(self.document.json["materials"]) - 1
+
+    def _export_light(self, prim: Usd.Prim) -> Optional[int]:
+        """
+        Export the given USD light as a `KHR_lights_punctual` light.
+
+        Parameters:
+            prim (Usd.Prim): The USD light Prim to export.
+
+        Return:
+            Optional[int]: The index of the glTF light, or `None` if the type of light is not supported.
+
+        """
+        light = UsdLux.LightAPI(prim)
+        if prim.IsA(UsdLux.DistantLight):
+            light_type = "directional"
+        elif prim.IsA(UsdLux.SphereLight):
+            light_type = "point"
+        else:
+            return None
+
+        # An authored intensity of zero switches the light off, and must not be mistaken for a missing value:
+        color = light.GetColorAttr().Get(self.time)
+        intensity = light.GetIntensityAttr().Get(self.time)
+        self.lights.append({
+            "name": f"{prim.GetName()}_light",
+            "type": light_type,
+            "color": [float(component) for component in (color if color is not None else (1.0, 1.0, 1.0))],
+            "intensity": float(intensity if intensity is not None else 1.0),
+        })
+        return len(self.lights) - 1
+
+
+class _BoundsExporter(_StageExporter):
+    """
+    Conversion of a USD Stage into a glTF document made of the bounding boxes of its components, as a lightweight
+    spatial overview of large scenes.
+    """
+
+    def __init__(self, stage: Usd.Stage) -> None:
+        super().__init__(stage=stage)
+        # Bounds are read from the extents hints of models where authored, which spares visiting their geometry:
+        self.bbox_cache = UsdGeom.BBoxCache(self.time, [UsdGeom.Tokens.default_, UsdGeom.Tokens.render], True)
+        self.proxy_bbox_cache = UsdGeom.BBoxCache(self.time, [UsdGeom.Tokens.proxy], True)
+        self.box_matrices: List[np.ndarray] = []
+
+    def export(self) -> bytes:
+        """
+        Export the bounding boxes of the components of the USD Stage, along with the proxy geometry authored for them.
+
+        Bounding boxes are computed for each component, as well as for each geometry primitive and point instancer
+        located outside of components. Components providing geometry with a `proxy` purpose are represented by that
+        geometry instead. All bounding boxes are instances of a single unit cube.
+
+        Parameters:
+            None
+
+        Return:
+            bytes: The GLB representation of the bounding boxes of the USD Stage.
+
+        """
+        root_index = self.document.add_node(node={"name": "Bounds"}, parent_index=None)
+
+        prim_range = iter(Usd.PrimRange.Stage(self.stage, Usd.TraverseInstanceProxies(Usd.PrimDefaultPredicate)))
+        for prim in prim_range:
+            if not prim.IsA(UsdGeom.Imageable):
+                continue
+            imageable = UsdGeom.Imageable(prim)
+            if (imageable.GetVisibilityAttr().Get(self.time) == UsdGeom.Tokens.invisible
+                    or imageable.GetPurposeAttr().Get() == UsdGeom.Tokens.guide):
+                prim_range.PruneChildren()
+                continue
+            # Authored kinds are honored even when the model hierarchy above them is incomplete:
+            is_component = Kind.Registry.IsA(Usd.ModelAPI(prim).GetKind(), Kind.Tokens.component)
+            if not (is_component or prim.IsA(UsdGeom.Gprim) or prim.IsA(UsdGeom.PointInstancer)):
+                continue
+
+            prim_range.PruneChildren()
+            if not self._export_proxies(prim=prim, parent_index=root_index):
+                self._add_box(self.bbox_cache.ComputeWorldBound(prim))
+
+        if self.box_matrices:
+            self._add_mesh_instances(
+                name="BoundingBoxes",
+                mesh_index=self._add_unit_cube(),
+                matrices=np.stack(self.box_matrices),
+                parent_index=root_index,
+            )
+        self.document.json["extensionsUsed"] = self.extensions_used
+        return self.document.to_glb()
+
+    def _export_proxies(self, prim: Usd.Prim, parent_index: int) -> bool:
+        """
+        Export the geometry with a `proxy` purpose located under the given USD Prim, meshes being exported as such and
+        other geometry primitives as bounding boxes.
+
+        Parameters:
+            prim (Usd.Prim): The USD Prim whose proxy geometry to export.
+            parent_index (int): Index of the glTF node under which to add the proxy meshes.
+
+        Return:
+            bool: `True` if the USD Prim has proxy geometry, `False` otherwise.
+
+        """
+        if self.proxy_bbox_cache.ComputeWorldBound(prim).GetRange().IsEmpty():
+            return False
+
+        for descendant in Usd.PrimRange(prim, Usd.TraverseInstanceProxies(Usd.PrimDefaultPredicate)):
+            if not descendant.IsA(UsdGeom.Gprim):
+                continue
+            if UsdGeom.Imageable(descendant).ComputePurpose() != UsdGeom.Tokens.proxy:
+                continue
+
+            mesh_index = None
+            if descendant.IsA(UsdGeom.Mesh):
+                mesh_index = self._export_mesh(mesh=UsdGeom.Mesh(descendant))
+            if mesh_index is None:
+                self._add_box(self.proxy_bbox_cache.ComputeWorldBound(descendant))
+                continue
+
+            matrix = np.array(self.xform_cache.GetLocalToWorldTransform(descendant), dtype=np.float64).ravel()
+            node = {"name": descendant.GetName(), "mesh": mesh_index, "matrix": matrix.tolist()}
+            self.document.add_node(node=node, parent_index=parent_index)
+        return True
+
+    def _add_box(self, bounds: Gf.BBox3d) -> None:
+        """
+        Record the transform placing the unit cube onto the given bounding box, unless it is empty.
+
+        Parameters:
+            bounds (Gf.BBox3d): The bounding box, in world space.
+
+        Return:
+            None
+
+        """
+        bounds_range = bounds.GetRange()
+        if bounds_range.IsEmpty():
+            return
+
+        # Flat boxes keep a minimal thickness, so that their transform remains invertible:
+        size = np.array(bounds_range.GetSize(), dtype=np.float64)
+        size = np.maximum(size, max(size.max(), 1.0) * 1e-6)
+        box_to_range = np.diag([*size, 1.0])
+        box_to_range[3, :3] = np.array(bounds_range.GetMidpoint(), dtype=np.float64)
+        self.box_matrices.append(box_to_range @ np.array(bounds.GetMatrix(), dtype=np.float64))
+
+    def _add_unit_cube(self) -> int:
+        """
+        Add a unit cube centered on the origin to the glTF document.
+
+        Parameters:
+            None
+
+        Return:
+            int: The index of the glTF mesh of the cube.
+
+        """
+        cube = tessellate_cube(size=1.0)
+        triangle_corners, _ = _triangulate(cube.face_vertex_counts.astype(np.int64), left_handed=False)
+        attributes = {
+            "POSITION": self.document.add_accessor(
+                cube.points[cube.face_vertex_indices], "VEC3", target=_ARRAY_BUFFER, with_bounds=True
+            ),
+            "NORMAL": self.document.add_accessor(cube.normals, "VEC3", target=_ARRAY_BUFFER),
+        }
+        indices = self.document.add_accessor(
+            triangle_corners.astype(np.uint32).ravel(), "SCALAR", target=_ELEMENT_ARRAY_BUFFER
+        )
+        primitive = {"attributes": attributes, "indices": indices}
+        self.document.json["meshes"].append({"name": "UnitCube", "primitives": [primitive]})
+        return len(self.document.json["meshes"]) - 1
+
+
+def export_stage_to_glb(
+    stage: Usd.Stage,
+    gpu_instancing: bool = True,
+    max_triangles: Optional[int] = None,
+    sample_rate: Optional[float] = None,
+    frame_range: Optional[Tuple[float, float]] = None,
+) -> bytes:
+    """
+    Convert the composed content of the given USD Stage into binary glTF (GLB) content.
+
+    Meshes (along with their normals, display colors and material subsets), transforms, point instancers, basic
+    `UsdPreviewSurface` materials and lights are supported. Content which is not supported (e.g. textures or skeletons)
+    raises an `UnsupportedContentError`, so that callers can fall back to the `usd2gltf` conversion process.
+
+    Animated transforms and points are resampled at the given rate, and baked into a glTF animation made of transform
+    channels and morph target weights, from which the keys reproduced by linear interpolation are dropped.
+
+    Identical meshes, such as the meshes of instances sharing a prototype, are exported once and referenced by every
+    node using them.
+
+    Parameters:
+        stage (Usd.Stage): The USD Stage to convert, with its geometry primitives already converted into meshes.
+        gpu_instancing (bool): Flag indicating whether to describe the instances of point instancers using the
+            `EXT_mesh_gpu_instancing` extension, rather than using one node for each instance.
+        max_triangles (Optional[int]): Approximate number of triangles to which the distinct meshes of the USD Stage
+            are simplified, or `None` to export them at full resolution. Meshes with animated points are not simplified.
+        sample_rate (Optional[float]): Number of animation samples per second, or `None` to sample every time code.
+        frame_range (Optional[Tuple[float, float]]): First and last time codes of the sampled animation, or `None` to
+            sample the time code range of the USD Stage.
+
+    Return:
+        bytes: The GLB representation of the given USD Stage.
+
+    """
+    log.debug(msg=f'Exporting stage "{stage.GetRootLayer().identifier}" to GLB.')
+    return _StageExporter(
+        stage=stage,
+        gpu_instancing=gpu_instancing,
+        max_triangles=max_triangles,
+        sample_rate=sample_rate,
+        frame_range=frame_range,
+    ).export()
+
+
+def export_stage_bounds_to_glb(stage: Usd.Stage) -> bytes:
+    """
+    Convert the given USD Stage into binary glTF (GLB) content made of the bounding boxes of its components.
+
+    Components are represented by their geometry with a `proxy` purpose where authored, and by their bounding box
+    otherwise. As the geometry of the USD Stage does not need to be converted, this provides an almost instant overview
+    of scenes too large to be converted in full.
+
+    Parameters:
+        stage (Usd.Stage): The USD Stage to convert.
+
+    Return:
+        bytes: The GLB representation of the bounding boxes of the given USD Stage.
+
+    """
+    log.debug(msg=f'Exporting bounds of stage "{stage.GetRootLayer().identifier}" to GLB.')
+    return _BoundsExporter(stage=stage).export()
@@ -15,19 +15,284 @@
 
 """OpenUSD Stage creation utilities."""
 
+import atexit
 import logging
 import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Set
 
 log = logging.getLogger(__name__)
 
+# Default number of Stages kept alive by the Stage registry, overridable through the `LOUSD_STAGE_CACHE_SIZE`
+# environment variable:
+_DEFAULT_STAGE_CACHE_SIZE = 32
 
-def create_new_stage(relative_file_path: str):
+# Process-wide `Usd.StageCache` holding the Stages returned by `create_new_stage`, created on first use so that
+# importing this module does not require `pxr`:
+_stage_cache: Optional[Any] = None
+
+# Cache IDs of the registered Stages, keyed by absolute root layer identifier from least to most recently used:
+_stage_cache_ids: "OrderedDict[str, Any]" = OrderedDict()
+_stage_cache_lock = threading.RLock()
+
+# Layers created in memory by `create_new_stage` which have not been written to disk yet, keyed by identifier. They are
+# held here so that their content outlives the eviction of their Stage from the Stage registry until they are flushed:
+_unsaved_in_memory_layers: Dict[str, Any] = {}
+_flush_at_exit_registered = False
+
+# Identifiers of all the layers created in memory by `create_new_stage`, the only layers ever written at exit:
+_in_memory_layer_identifiers: Set[str] = set()
+
+# Purposes of the layers written by the helpers, which select their output format: layers displayed to learners are
+# written as text, while intermediate files which are only read back by OpenUSD are written as binary crate files:
+OUTPUT_PURPOSE_TEACHING = "teaching"
+OUTPUT_PURPOSE_INTERMEDIATE = "intermediate"
+
+_SUPPORTED_OUTPUT_FORMATS = ("usda", "usdc")
+_DEFAULT_OUTPUT_FORMATS = {
+    OUTPUT_PURPOSE_TEACHING: "usda",
+    OUTPUT_PURPOSE_INTERMEDIATE: "usdc",
+}
+
+# Output formats selected through `set_output_format`, overriding the defaults and environment variables:
+_output_formats: Dict[str, str] = {}
+
+
+def _get_stage_cache_size() -> int:
+    """
+    Return the maximum number of Stages kept alive by the Stage registry.
+
+    Return:
+        int: The size of the Stage registry, `0` disabling it.
+
+    """
+    try:
+        return max(int(os.environ.get("LOUSD_STAGE_CACHE_SIZE", _DEFAULT_STAGE_CACHE_SIZE)), 0)
+    except ValueError:
+        log.warning(msg=f'Ignoring invalid "LOUSD_STAGE_CACHE_SIZE" value "{os.environ["LOUSD_STAGE_CACHE_SIZE"]}".')
+        return _DEFAULT_STAGE_CACHE_SIZE
+
+
+def _get_stage_cache():
+    """
+    Return the process-wide `Usd.StageCache` of the Stage registry, creating it on first use.
+
+    Return:
+        Usd.StageCache: The cache holding the registered Stages.
+
+    """
+    global _stage_cache
+    if _stage_cache is None:
+        from pxr import Usd
+
+        _stage_cache = Usd.StageCache()
+    return _stage_cache
+
+
+def _find_registered_stage(layer_identifier: str):
+    """
+    Return the registered Stage whose root layer has the given identifier, marking it as the most recently used one.
+
+    Parameters:
+        layer_identifier (str): Absolute identifier of the root layer of the Stage.
+
+    Return:
+        Optional[Usd.Stage]: The registered Stage, or `None` if no Stage is registered for the given identifier.
+
+    """
+    with _stage_cache_lock:
+        stage_id = _stage_cache_ids.get(layer_identifier)
+        if stage_id is None:
+            return None
+
+        stage = _get_stage_cache().Find(stage_id)
+        if not stage:
+            del _stage_cache_ids[layer_identifier]
+            return None
+
+        _stage_cache_ids.move_to_end(layer_identifier)
+        return stage
+
+
+def _register_stage(layer_identifier: str, stage) -> None:
+    """
+    Register the given Stage under the given identifier, evicting the least recently used Stages beyond the size of
+    the registry.
+
+    Evicted Stages are only released by the registry, and remain valid for as long as callers hold on to them.
+
+    Parameters:
+        layer_identifier (str): Absolute identifier of the root layer of the Stage.
+        stage (Usd.Stage): The Stage to register.
+
+    """
+    cache_size = _get_stage_cache_size()
+    with _stage_cache_lock:
+        stage_cache = _get_stage_cache()
+        if cache_size > 0:
+            _stage_cache_ids[layer_identifier] = stage_cache.Insert(stage)
+            _stage_cache_ids.move_to_end(layer_identifier)
+
+        while len(_stage_cache_ids) > cache_size:
+            evicted_identifier, evicted_id = _stage_cache_ids.popitem(last=False)
+            log.debug(msg=f'Evicting Stage "{evicted_identifier}" from the Stage registry.')
+            stage_cache.Erase(evicted_id)
+
+
+def _validate_output_format(purpose: str, file_format: Optional[str]) -> None:
+    """
+    Raise a `ValueError` if the given purpose or output format is not supported.
+
+    Parameters:
+        purpose (str): Purpose of the layers (`OUTPUT_PURPOSE_TEACHING` or `OUTPUT_PURPOSE_INTERMEDIATE`).
+        file_format (Optional[str]): Output format (`usda` or `usdc`), or `None`.
+
+    """
+    if purpose not in _DEFAULT_OUTPUT_FORMATS:
+        raise ValueError(f'Unsupported output purpose "{purpose}", expected one of {sorted(_DEFAULT_OUTPUT_FORMATS)}.')
+    if file_format is not None and file_format not in _SUPPORTED_OUTPUT_FORMATS:
+        raise ValueError(f'Unsupported output format "{file_format}", expected one of {list(_SUPPORTED_OUTPUT_FORMATS)}.')
+
+
+def set_output_format(purpose: str, file_format: Optional[str]) -> None:
+    """
+    Select the output format of the `.usd` layers written by the helpers for the given purpose.
+
+    Parameters:
+        purpose (str): Purpose of the layers (`OUTPUT_PURPOSE_TEACHING` or `OUTPUT_PURPOSE_INTERMEDIATE`).
+        file_format (Optional[str]): Output format (`usda` or `usdc`), or `None` to restore the format given by the
+            `LOUSD_TEACHING_FORMAT` or `LOUSD_INTERMEDIATE_FORMAT` environment variable, or the default format.
+
+    """
+    _validate_output_format(purpose, file_format)
+    if file_format is None:
+        _output_formats.pop(purpose, None)
+    else:
+        _output_formats[purpose] = file_format
+
+
+def get_output_format(purpose: str, file_format: Optional[str] = None) -> str:
+    """
+    Return the output format of the `.usd` layers written by the helpers for the given purpose.
+
+    The format requested for the call takes precedence over the one selected through `set_output_format`, followed by
+    the `LOUSD_TEACHING_FORMAT` or `LOUSD_INTERMEDIATE_FORMAT` environment variable, and the default format of the
+    purpose (`usda` for teaching layers, `usdc` for intermediate layers).
+
+    Parameters:
+        purpose (str): Purpose of the layers (`OUTPUT_PURPOSE_TEACHING` or `OUTPUT_PURPOSE_INTERMEDIATE`).
+        file_format (Optional[str]): Output format requested for the call (`usda` or `usdc`), or `None`.
+
+    Return:
+        str: The output format of the layers (`usda` or `usdc`).
+
+    """
+    _validate_output_format(purpose, file_format)
+    if file_format is not None:
+        return file_format
+    if purpose in _output_formats:
+        return _output_formats[purpose]
+
+    environment_variable = f"LOUSD_{purpose.upper()}_FORMAT"
+    environment_format = os.environ.get(environment_variable, "").strip().lower()
+    if environment_format in _SUPPORTED_OUTPUT_FORMATS:
+        return environment_format
+    if environment_format:
+        log.warning(msg=f'Ignoring invalid "{environment_variable}" value "{environment_format}".')
+    return _DEFAULT_OUTPUT_FORMATS[purpose]
+
+
+def get_layer_file_format_args(file_path: str, purpose: str, file_format: Optional[str] = None) -> Dict[str, str]:
+    """
+    Return the file format arguments with which to write a layer at the given location for the given purpose.
+
+    Only layers with a `.usd` extension can be written in either format, the format of `.usda` and `.usdc` layers being
+    given by their extension.
+
+    Parameters:
+        file_path (str): Location of the layer to write.
+        purpose (str): Purpose of the layer (`OUTPUT_PURPOSE_TEACHING` or `OUTPUT_PURPOSE_INTERMEDIATE`).
+        file_format (Optional[str]): Output format requested for the call (`usda` or `usdc`), or `None`.
+
+    Return:
+        Dict[str, str]: The file format arguments to pass to `Sdf.Layer.CreateNew`, `Sdf.Layer.Export` or similar.
+
+    """
+    output_format = get_output_format(purpose, file_format)
+    if os.path.splitext(file_path)[1].lower() != ".usd":
+        return {}
+    return {"format": output_format}
+
+
+def _use_in_memory_stages(in_memory: Optional[bool]) -> bool:
+    """
+    Return whether new Stages should be backed by in-memory layers.
+
+    Parameters:
+        in_memory (Optional[bool]): Requested mode, or `None` to use the mode given by the `LOUSD_IN_MEMORY_STAGES`
+            environment variable.
+
+    Return:
+        bool: `True` if new Stages should be backed by in-memory layers.
+
+    """
+    if in_memory is not None:
+        return in_memory
+    return os.environ.get("LOUSD_IN_MEMORY_STAGES", "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def _create_in_memory_stage(layer_identifier: str, file_format_args: Dict[str, str]):
+    """
+    Create a Stage backed by a new in-memory layer with the given identifier, which is only written to disk once the
+    Stage is saved or the in-memory layers are flushed.
+
+    The layer is registered under its file path, so that other layers referencing this location while it is held in
+    memory resolve to it rather than to the file on disk.
+
+    Parameters:
+        layer_identifier (str): Absolute path of the root layer of the Stage.
+        file_format_args (Dict[str, str]): File format arguments of the layer.
+
+    Return:
+        Usd.Stage: The Stage backed by the in-memory layer.
+
+    """
+    global _flush_at_exit_registered
+    from pxr import Usd, Sdf
+
+    file_format = Sdf.FileFormat.FindByExtension(os.path.splitext(layer_identifier)[1].lstrip("."))
+    layer = Sdf.Layer.New(file_format, layer_identifier, args=file_format_args)
+    with _stage_cache_lock:
+        _unsaved_in_memory_layers[layer.identifier] = layer
+        _in_memory_layer_identifiers.add(layer.identifier)
+        if not _flush_at_exit_registered:
+            atexit.register(save_in_memory_layers)
+            _flush_at_exit_registered = True
+    return Usd.Stage.Open(layer)
+
+
+def create_new_stage(relative_file_path: str, in_memory: Optional[bool] = None, file_format: Optional[str] = None):
     """
     Return the OpenUSD Stage at the given location if one already exists, otherwise create a new USD Stage at the
     given location and return its instance.
 
+    Stages are kept in a process-wide registry keyed by the absolute path of their root layer, so that re-running a
+    cell returns the same Stage instead of composing it again. The registry keeps the most recently used Stages alive,
+    up to the number given by the `LOUSD_STAGE_CACHE_SIZE` environment variable (`32` by default, `0` disabling it).
+
+    In-memory Stages are not written to disk when they are created, but when they are saved, when calling
+    `save_in_memory_layers` or `save_all_dirty_layers`, or when the Python process exits. Tools reading the file from
+    disk rather than through OpenUSD (e.g. `DisplayCode`) therefore only see the content of the Stage once it has been
+    written.
+
     Parameters:
         relative_file_path (str): Location of the OpenUSD Stage to open or to create.
+        in_memory (Optional[bool]): Flag indicating whether to back new Stages with in-memory layers instead of
+            creating their file on disk. Defaults to the mode given by the `LOUSD_IN_MEMORY_STAGES` environment
+            variable.
+        file_format (Optional[str]): Format of new `.usd` Stages (`usda` or `usdc`). Defaults to the output format of
+            teaching layers, as given by `get_output_format`.
 
     Return:
         Usd.Stage: The instance of the OpenUSD Stage at the given location.
@@ -36,6 +301,11 @@ def create_new_stage(relative_file_path: str):
     layer_identifier = os.path.join(os.getcwd(), relative_file_path)
     log.debug(msg=f'Creating new Stage at "{relative_file_path}" (absolute path: "{layer_identifier}").')
 
+    stage = _find_registered_stage(os.path.abspath(layer_identifier))
+    if stage:
+        log.debug(msg=f'Stage already registered for "{layer_identifier}".')
+        return stage
+
     # NOTE: Importing the `pxr` or other vendor modules, is done here rather than at the top-level as it is possible
     # that Users may not have installed it through PIP yet (e.g. when running Jupyter Notebooks for the first time,
     # before even running the `!pip install ...` command located in the first cell of Notebooks).
@@ -44,10 +314,143 @@ def create_new_stage(relative_file_path: str):
     layer = Sdf.Layer.Find(identifier=layer_identifier)
     if layer:
         log.debug(msg=f'Layer already exists at "{layer_identifier}".')
+        stage = Usd.Stage.Open(layer)
+    else:
+        file_format_args = get_layer_file_format_args(relative_file_path, OUTPUT_PURPOSE_TEACHING, file_format)
+        if _use_in_memory_stages(in_memory):
+            log.debug(msg=f'Creating in-memory layer for "{layer_identifier}".')
+            stage = _create_in_memory_stage(os.path.abspath(layer_identifier), file_format_args)
+        elif file_format_args:
+            stage = Usd.Stage.Open(Sdf.Layer.CreateNew(relative_file_path, args=file_format_args))
+        else:
+            stage = Usd.Stage.CreateNew(relative_file_path)
+
+    _register_stage(os.path.abspath(layer_identifier), stage)
+    return stage
+
+
+def reload_stage(relative_file_path: str):
+    """
+    Reload the OpenUSD Stage at the given location from disk, discarding any unsaved edits, and return its instance.
+
+    Parameters:
+        relative_file_path (str): Location of the OpenUSD Stage to reload.
+
+    Return:
+        Usd.Stage: The reloaded instance of the OpenUSD Stage at the given location.
+
+    """
+    layer_identifier = os.path.abspath(relative_file_path)
+    stage = _find_registered_stage(layer_identifier)
+    if not stage:
+        from pxr import Usd
+
+        stage = Usd.Stage.Open(layer_identifier)
+        _register_stage(layer_identifier, stage)
+
+    log.debug(msg=f'Reloading Stage at "{layer_identifier}".')
+    stage.Reload()
+    return stage
 
-        stage = Usd.Stage.Open(layer.identifier)
-        return stage
-        # del layer
-        # del stage
 
-    return Usd.Stage.CreateNew(relative_file_path)
+def _collect_in_memory_layers() -> Dict[str, Any]:
+    """
+    Return the layers created in memory by `create_new_stage` which were never written or were modified since.
+
+    Return:
+        Dict[str, Any]: The layers to write, keyed by identifier.
+
+    """
+    from pxr import Sdf
+
+    layers = dict(_unsaved_in_memory_layers)
+    for layer_identifier in _in_memory_layer_identifiers:
+        layer = Sdf.Layer.Find(layer_identifier)
+        if layer and layer.dirty:
+            layers.setdefault(layer_identifier, layer)
+    return layers
+
+
+def _save_layers(layers: Dict[str, Any]) -> List[str]:
+    """
+    Write the given layers to disk if they are dirty or were created in memory and never written.
+
+    Parameters:
+        layers (Dict[str, Any]): The layers to write, keyed by identifier.
+
+    Return:
+        List[str]: The identifiers of the layers written to disk.
+
+    """
+    saved_layer_identifiers = []
+    for layer_identifier, layer in layers.items():
+        # In-memory layers are written even if they were not modified, so that their file exists on disk:
+        if layer.dirty or layer_identifier in _unsaved_in_memory_layers:
+            try:
+                layer.Save()
+            except Exception as e:
+                log.error(f'Error saving layer "{layer_identifier}": {e}')
+                continue
+            saved_layer_identifiers.append(layer_identifier)
+        _unsaved_in_memory_layers.pop(layer_identifier, None)
+    return saved_layer_identifiers
+
+
+def save_in_memory_layers() -> List[str]:
+    """
+    Write to disk the layers created in memory by `create_new_stage` which were never written or were modified since.
+
+    This is called automatically when the Python process exits if in-memory Stages have been created. Layers opened
+    from existing files are never written, so that files the learner did not choose to save are left untouched.
+
+    Return:
+        List[str]: The identifiers of the layers written to disk.
+
+    """
+    with _stage_cache_lock:
+        layers = _collect_in_memory_layers()
+        saved_layer_identifiers = _save_layers(layers)
+
+    log.debug(msg=f"Saved {len(saved_layer_identifiers)} in-memory layer(s).")
+    return saved_layer_identifiers
+
+
+def save_all_dirty_layers() -> List[str]:
+    """
+    Write to disk the in-memory layers created by `create_new_stage`, along with the modified layers of the Stages held
+    by the Stage registry.
+
+    Unlike `save_in_memory_layers`, this is never called automatically, as it also writes layers opened from existing
+    files.
+
+    Return:
+        List[str]: The identifiers of the layers written to disk.
+
+    """
+    with _stage_cache_lock:
+        layers = _collect_in_memory_layers()
+        stage_cache = _get_stage_cache() if _stage_cache_ids else None
+        for stage_id in _stage_cache_ids.values():
+            stage = stage_cache.Find(stage_id)
+            if stage:
+                for layer in stage.GetUsedLayers():
+                    if layer.dirty and not layer.anonymous:
+                        layers.setdefault(layer.identifier, layer)
+        saved_layer_identifiers = _save_layers(layers)
+
+    log.debug(msg=f"Saved {len(saved_layer_identifiers)} dirty layer(s).")
+    return saved_layer_identifiers
+
+
+def reset_stage_cache() -> None:
+    """
+    Release all the Stages held by the Stage registry.
+
+    Stages remain valid for as long as callers hold on to them, but subsequent calls to `create_new_stage` no longer
+    return them. In-memory layers which have not been written to disk yet are still written by `save_all_dirty_layers`.
+
+    """
+    with _stage_cache_lock:
+        if _stage_cache is not None:
+            _stage_cache.Clear()
+        _stage_cache_ids.clear()
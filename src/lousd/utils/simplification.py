@@ -0,0 +1,144 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Simplification of triangle meshes by vertex clustering, used to produce lightweight previews of large scenes."""
+
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+# Number of bisection steps searching for the resolution of the clustering grid matching a triangle budget:
+_MAX_RESOLUTION_SEARCH_STEPS = 10
+
+
+class SimplifiedTriangles(NamedTuple):
+    """
+    Result of the simplification of a triangle mesh, expressed in terms of the vertices of the original mesh.
+    """
+
+    # `(N, 3)` vertex indices of the remaining triangles, each referencing the vertex representing its cluster:
+    triangles: np.ndarray
+    # Index in the original mesh of the triangle from which each remaining triangle was built:
+    source_triangles: np.ndarray
+    # Positions of all the vertices, the vertices representing a cluster being moved to the center of the cluster:
+    positions: np.ndarray
+
+
+def _cluster_vertices(positions: np.ndarray, normals: Optional[np.ndarray], resolution: int) -> np.ndarray:
+    """
+    Assign each vertex to a cell of a regular grid spanning the bounds of the mesh, splitting the vertices of each cell
+    by the principal direction of their normal so that hard edges are preserved.
+
+    Parameters:
+        positions (np.ndarray): `(V, 3)` positions of the vertices.
+        normals (Optional[np.ndarray]): `(V, 3)` normals of the vertices, or `None`.
+        resolution (int): Number of cells of the grid along its longest side.
+
+    Return:
+        np.ndarray: The cluster index of each vertex.
+
+    """
+    lower_bound = positions.min(axis=0)
+    size = float((positions.max(axis=0) - lower_bound).max()) or 1.0
+    cells = np.clip(((positions - lower_bound) / size * resolution).astype(np.int64), 0, resolution - 1)
+    keys = cells[:, 0] + resolution * (cells[:, 1] + resolution * cells[:, 2])
+    if normals is not None:
+        principal_axes = np.abs(normals).argmax(axis=1)
+        principal_signs = normals[np.arange(len(normals)), principal_axes] < 0.0
+        keys = keys * 6 + principal_axes * 2 + principal_signs
+    return np.unique(keys, return_inverse=True)[1].ravel()
+
+
+def _collapse_triangles(triangles: np.ndarray, cluster_of_vertex: np.ndarray) -> np.ndarray:
+    """
+    Return the triangles which remain once the vertices of each cluster are merged, dropping the triangles which
+    collapse into an edge or a point and the duplicates of triangles joining the same clusters.
+
+    Parameters:
+        triangles (np.ndarray): `(N, 3)` vertex indices of the triangles.
+        cluster_of_vertex (np.ndarray): Cluster index of each vertex.
+
+    Return:
+        np.ndarray: The indices of the remaining triangles.
+
+    """
+    clusters = cluster_of_vertex[triangles]
+    non_degenerate = np.flatnonzero(
+        (clusters[:, 0] != clusters[:, 1]) & (clusters[:, 1] != clusters[:, 2]) & (clusters[:, 0] != clusters[:, 2])
+    )
+    _, unique_indices = np.unique(np.sort(clusters[non_degenerate], axis=1), axis=0, return_index=True)
+    return non_degenerate[np.sort(unique_indices)]
+
+
+def simplify_triangles(
+    positions: np.ndarray,
+    triangles: np.ndarray,
+    max_triangles: int,
+    normals: Optional[np.ndarray] = None,
+) -> SimplifiedTriangles:
+    """
+    Simplify a triangle mesh by clustering its vertices on a regular grid, using the finest grid which brings the
+    number of triangles within the given budget.
+
+    Parameters:
+        positions (np.ndarray): `(V, 3)` positions of the vertices.
+        triangles (np.ndarray): `(N, 3)` vertex indices of the triangles.
+        max_triangles (int): Maximum number of triangles to keep.
+        normals (Optional[np.ndarray]): `(V, 3)` normals of the vertices, used to keep hard edges apart, or `None`.
+
+    Return:
+        SimplifiedTriangles: The remaining triangles, along with the updated positions of the vertices.
+
+    """
+    if len(triangles) <= max_triangles:
+        return SimplifiedTriangles(triangles, np.arange(len(triangles)), positions)
+
+    # The number of remaining triangles grows with the resolution of the grid, which is therefore searched by
+    # bisection. Each cluster covers at least a vertex, bounding the useful resolution by the number of vertices:
+    lower_resolution, upper_resolution = 1, max(int(np.cbrt(len(positions))) * 4, 2)
+    best = None
+    for _ in range(_MAX_RESOLUTION_SEARCH_STEPS):
+        if lower_resolution > upper_resolution:
+            break
+        resolution = (lower_resolution + upper_resolution) // 2
+        cluster_of_vertex = _cluster_vertices(positions, normals, resolution)
+        remaining_triangles = _collapse_triangles(triangles, cluster_of_vertex)
+        if len(remaining_triangles) <= max_triangles:
+            best = (cluster_of_vertex, remaining_triangles)
+            lower_resolution = resolution + 1
+        else:
+            upper_resolution = resolution - 1
+
+    if best is None:
+        cluster_of_vertex = _cluster_vertices(positions, normals, 1)
+        best = (cluster_of_vertex, _collapse_triangles(triangles, cluster_of_vertex)[:max_triangles])
+    cluster_of_vertex, remaining_triangles = best
+
+    # Each cluster is represented by its first vertex, moved to the average position of the vertices of the cluster:
+    cluster_count = int(cluster_of_vertex.max()) + 1
+    _, representatives = np.unique(cluster_of_vertex, return_index=True)
+    vertex_counts = np.bincount(cluster_of_vertex, minlength=cluster_count)[:, None]
+    centers = np.stack(
+        [np.bincount(cluster_of_vertex, weights=positions[:, axis], minlength=cluster_count) for axis in range(3)],
+        axis=1,
+    ) / vertex_counts
+
+    simplified_positions = positions.copy()
+    simplified_positions[representatives] = centers
+    return SimplifiedTriangles(
+        triangles=representatives[cluster_of_vertex[triangles[remaining_triangles]]],
+        source_triangles=remaining_triangles,
+        positions=simplified_positions,
+    )
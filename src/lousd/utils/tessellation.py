@@ -0,0 +1,272 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Procedural tessellation of OpenUSD geometry primitives into polygonal meshes."""
+
+import functools
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+# Default number of segments around the axis of revolution of tessellated primitives:
+DEFAULT_SEGMENTS = 64
+
+# Smallest number of segments producing a closed volume:
+_MIN_SEGMENTS = 3
+
+
+class MeshData(NamedTuple):
+    """
+    Polygonal representation of a geometry primitive, with one normal for each face-vertex.
+
+    The arrays are shared between all the callers requesting the same tessellation, and are therefore read-only.
+    """
+
+    face_vertex_counts: np.ndarray
+    face_vertex_indices: np.ndarray
+    points: np.ndarray
+    normals: np.ndarray
+    extent: np.ndarray
+
+
+def _make_mesh_data(
+    face_vertex_counts: np.ndarray,
+    face_vertex_indices: np.ndarray,
+    points: np.ndarray,
+    normals: np.ndarray,
+    axis: str = "Z",
+) -> MeshData:
+    """
+    Assemble the given arrays into read-only mesh data, reorienting the geometry built around the Z axis onto the
+    given axis.
+
+    Parameters:
+        face_vertex_counts (np.ndarray): Number of vertices of each face.
+        face_vertex_indices (np.ndarray): Point index of each face-vertex.
+        points (np.ndarray): Positions of the points, built around the Z axis.
+        normals (np.ndarray): Normal of each face-vertex, built around the Z axis.
+        axis (str): Axis of the primitive (`X`, `Y` or `Z`).
+
+    Return:
+        MeshData: The read-only mesh data.
+
+    """
+    # Cyclic permutations of the coordinates are rotations, which preserve the winding order of the faces:
+    permutation = {"X": [2, 0, 1], "Y": [1, 2, 0], "Z": [0, 1, 2]}[axis]
+    points = points[:, permutation].astype(np.float32)
+    normals = normals[:, permutation].astype(np.float32)
+    extent = np.stack([points.min(axis=0), points.max(axis=0)])
+
+    arrays = [
+        face_vertex_counts.astype(np.int32),
+        face_vertex_indices.astype(np.int32),
+        points,
+        normals,
+        extent,
+    ]
+    for array in arrays:
+        array.flags.writeable = False
+    return MeshData(*arrays)
+
+
+def _resolve_segments(segments: Optional[int]) -> int:
+    """
+    Return the number of segments to use for a tessellation, given the requested one.
+
+    Parameters:
+        segments (Optional[int]): Requested number of segments, or `None` to use the default number of segments.
+
+    Return:
+        int: The number of segments to use for the tessellation.
+
+    """
+    if segments is None:
+        return DEFAULT_SEGMENTS
+    return max(int(segments), _MIN_SEGMENTS)
+
+
+def _ring(radius: float, z: float, segments: int) -> np.ndarray:
+    """
+    Return the points of a circle of the given radius around the Z axis, in counter-clockwise order.
+
+    Parameters:
+        radius (float): Radius of the circle.
+        z (float): Height of the circle along the Z axis.
+        segments (int): Number of points of the circle.
+
+    Return:
+        np.ndarray: The `(segments, 3)` points of the circle.
+
+    """
+    angles = np.linspace(0.0, 2.0 * np.pi, segments, endpoint=False)
+    return np.stack([radius * np.cos(angles), radius * np.sin(angles), np.full(segments, z)], axis=1)
+
+
+@functools.lru_cache(maxsize=256)
+def tessellate_cube(size: float) -> MeshData:
+    """
+    Tessellate a cube centered on the origin.
+
+    Parameters:
+        size (float): Length of the edges of the cube.
+
+    Return:
+        MeshData: The polygonal representation of the cube.
+
+    """
+    p = size / 2.0
+    points = np.array([(-p, -p, p), (p, -p, p), (-p, p, p), (p, p, p), (-p, p, -p), (p, p, -p), (-p, -p, -p), (p, -p, -p)])
+    face_vertex_indices = np.array([0, 1, 3, 2, 2, 3, 5, 4, 4, 5, 7, 6, 6, 7, 1, 0, 1, 7, 5, 3, 6, 0, 2, 4])
+    face_normals = np.array([(0, 0, 1), (0, 1, 0), (0, 0, -1), (0, -1, 0), (1, 0, 0), (-1, 0, 0)], dtype=np.float64)
+    return _make_mesh_data(
+        face_vertex_counts=np.full(6, 4),
+        face_vertex_indices=face_vertex_indices,
+        points=points,
+        normals=np.repeat(face_normals, 4, axis=0),
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def tessellate_sphere(radius: float, segments: Optional[int] = None) -> MeshData:
+    """
+    Tessellate a UV sphere centered on the origin, with its poles along the Z axis.
+
+    Parameters:
+        radius (float): Radius of the sphere.
+        segments (Optional[int]): Number of segments around the poles of the sphere, half as many being used between
+            the poles. Defaults to `DEFAULT_SEGMENTS`.
+
+    Return:
+        MeshData: The polygonal representation of the sphere.
+
+    """
+    segments = _resolve_segments(segments)
+    rings = max(segments // 2, 2)
+
+    # Points are made of the north pole, followed by `rings - 1` circles of latitude and the south pole:
+    polar_angles = np.pi * np.arange(1, rings) / rings
+    azimuths = np.linspace(0.0, 2.0 * np.pi, segments, endpoint=False)
+    directions = np.stack([
+        np.outer(np.sin(polar_angles), np.cos(azimuths)).ravel(),
+        np.outer(np.sin(polar_angles), np.sin(azimuths)).ravel(),
+        np.repeat(np.cos(polar_angles), segments),
+    ], axis=1)
+    directions = np.vstack([(0.0, 0.0, 1.0), directions, (0.0, 0.0, -1.0)])
+    north_pole, south_pole = 0, len(directions) - 1
+
+    current = np.arange(segments)
+    following = (current + 1) % segments
+    ring_starts = 1 + segments * np.arange(rings - 1)
+
+    north_cap = np.stack([np.full(segments, north_pole), ring_starts[0] + current, ring_starts[0] + following], axis=1)
+    upper, lower = ring_starts[:-1, None], ring_starts[1:, None]
+    bands = np.stack([upper + current, lower + current, lower + following, upper + following], axis=2)
+    south_cap = np.stack([ring_starts[-1] + following, ring_starts[-1] + current, np.full(segments, south_pole)], axis=1)
+
+    face_vertex_indices = np.concatenate([north_cap.ravel(), bands.ravel(), south_cap.ravel()])
+    return _make_mesh_data(
+        face_vertex_counts=np.concatenate([np.full(segments, 3), np.full(segments * (rings - 2), 4), np.full(segments, 3)]),
+        face_vertex_indices=face_vertex_indices,
+        points=radius * directions,
+        normals=directions[face_vertex_indices],
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def tessellate_cylinder(radius: float, height: float, axis: str = "Z", segments: Optional[int] = None) -> MeshData:
+    """
+    Tessellate a capped cylinder centered on the origin.
+
+    Parameters:
+        radius (float): Radius of the cylinder.
+        height (float): Height of the cylinder along its axis.
+        axis (str): Axis of the cylinder (`X`, `Y` or `Z`).
+        segments (Optional[int]): Number of segments around the axis of the cylinder. Defaults to `DEFAULT_SEGMENTS`.
+
+    Return:
+        MeshData: The polygonal representation of the cylinder.
+
+    """
+    segments = _resolve_segments(segments)
+    half_height = height / 2.0
+    points = np.vstack([_ring(radius, -half_height, segments), _ring(radius, half_height, segments)])
+
+    current = np.arange(segments)
+    following = (current + 1) % segments
+    sides = np.stack([current, following, segments + following, segments + current], axis=1)
+    top_cap = segments + current
+    bottom_cap = current[::-1]
+
+    side_normals = _ring(1.0, 0.0, segments)
+    face_vertex_indices = np.concatenate([sides.ravel(), top_cap, bottom_cap])
+    normals = np.vstack([
+        side_normals[sides.ravel() % segments],
+        np.tile((0.0, 0.0, 1.0), (segments, 1)),
+        np.tile((0.0, 0.0, -1.0), (segments, 1)),
+    ])
+    return _make_mesh_data(
+        face_vertex_counts=np.concatenate([np.full(segments, 4), [segments, segments]]),
+        face_vertex_indices=face_vertex_indices,
+        points=points,
+        normals=normals,
+        axis=axis,
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def tessellate_cone(radius: float, height: float, axis: str = "Z", segments: Optional[int] = None) -> MeshData:
+    """
+    Tessellate a capped cone centered on the origin, with its apex pointing towards the positive end of its axis.
+
+    Parameters:
+        radius (float): Radius of the base of the cone.
+        height (float): Height of the cone along its axis.
+        axis (str): Axis of the cone (`X`, `Y` or `Z`).
+        segments (Optional[int]): Number of segments around the axis of the cone. Defaults to `DEFAULT_SEGMENTS`.
+
+    Return:
+        MeshData: The polygonal representation of the cone.
+
+    """
+    segments = _resolve_segments(segments)
+    half_height = height / 2.0
+    apex = segments
+    points = np.vstack([_ring(radius, -half_height, segments), (0.0, 0.0, half_height)])
+
+    current = np.arange(segments)
+    following = (current + 1) % segments
+    sides = np.stack([current, following, np.full(segments, apex)], axis=1)
+    base_cap = current[::-1]
+
+    # Normals of the slanted sides lean towards the apex, the normal at the apex of each side being computed at the
+    # middle of its base edge for smoother shading:
+    def _side_normals(azimuths: np.ndarray) -> np.ndarray:
+        normals = np.stack([height * np.cos(azimuths), height * np.sin(azimuths), np.full(len(azimuths), radius)], axis=1)
+        return normals / np.linalg.norm(normals, axis=1, keepdims=True)
+
+    azimuths = 2.0 * np.pi * current / segments
+    corner_normals = np.stack([
+        _side_normals(azimuths),
+        _side_normals(azimuths + 2.0 * np.pi / segments),
+        _side_normals(azimuths + np.pi / segments),
+    ], axis=1)
+
+    return _make_mesh_data(
+        face_vertex_counts=np.concatenate([np.full(segments, 3), [segments]]),
+        face_vertex_indices=np.concatenate([sides.ravel(), base_cap]),
+        points=points,
+        normals=np.vstack([corner_normals.reshape(-1, 3), np.tile((0.0, 0.0, -1.0), (segments, 1))]),
+        axis=axis,
+    )
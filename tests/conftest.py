@@ -17,11 +17,13 @@
 
 import json
 import os
-import shutil
 from pathlib import Path
 
 import pytest
 
+from lousd.buildhelpers import TEXTURE_SUFFIXES, materialize_tree
+from lousd.utils.helperfunctions import save_in_memory_layers
+
 # Source for exercise content (mirrors docs/exercise_content under jupyter_execute when needs_content=True).
 _EXERCISE_CONTENT_SRC = Path(__file__).resolve().parent.parent / "docs" / "_build" / "jupyter_execute" / "exercise_content"
 
@@ -61,6 +63,7 @@ def _execute_notebook(
     tags: list[str] | None,
     work_dir: Path,
     needs_content: bool = False,
+    in_memory: bool | None = None,
 ) -> Notebook:
     """Execute notebook cells and return the resulting namespace.
 
@@ -72,8 +75,14 @@ def _execute_notebook(
         tags: List of test-tags to match; only cells with any of these tags run.
             Mutually exclusive with cells.
         work_dir: Temporary directory (base for execution; see needs_content).
-        needs_content: If True, copy exercise_content/ under a jupyter_execute/
+        needs_content: If True, materialize exercise_content/ under a jupyter_execute/
             to work_dir so that ../exercise_content from the notebook cwd resolves.
+            Files are reflinked where supported and copied otherwise, except for
+            textures, which are only read and may be hard-linked instead.
+        in_memory: If True, Stages created by the notebook through create_new_stage are
+            kept in memory and only written to work_dir once the cells ran, saving the
+            disk writes of the intermediate Stages. Defaults to the mode given by the
+            LOUSD_IN_MEMORY_STAGES environment variable.
 
     Returns:
         Notebook object with the resulting namespace.
@@ -96,10 +105,12 @@ def _execute_notebook(
     exec_dir = work_dir / nb_parent if str(nb_parent) != "." else work_dir
     exec_dir.mkdir(parents=True, exist_ok=True)
 
-    # When needs_content copy the content so ../exercise_content works
+    # When needs_content clone the content so ../exercise_content works. Exercises write files in place (such as the
+    # glTF files converted next to USD files, or crate files saved by OpenUSD), so hard links would write through into
+    # the build output: only textures, which are never written, may be hard-linked.
     if needs_content:
         dest_content = work_dir / "exercise_content"
-        shutil.copytree(_EXERCISE_CONTENT_SRC, dest_content)
+        materialize_tree(_EXERCISE_CONTENT_SRC, dest_content, read_only_suffixes=TEXTURE_SUFFIXES)
 
     # Load notebook
     with open(nb_file, "r", encoding="utf-8") as f:
@@ -144,6 +155,9 @@ def _execute_notebook(
     # Execute cells in isolated namespace
     namespace = {}
     old_cwd = os.getcwd()
+    old_in_memory_stages = os.environ.get("LOUSD_IN_MEMORY_STAGES")
+    if in_memory is not None:
+        os.environ["LOUSD_IN_MEMORY_STAGES"] = "1" if in_memory else "0"
     try:
         os.chdir(exec_dir)
         for cell in cells_to_run:
@@ -153,6 +167,13 @@ def _execute_notebook(
             exec(source, namespace)
     finally:
         os.chdir(old_cwd)
+        if in_memory is not None:
+            if old_in_memory_stages is None:
+                os.environ.pop("LOUSD_IN_MEMORY_STAGES", None)
+            else:
+                os.environ["LOUSD_IN_MEMORY_STAGES"] = old_in_memory_stages
+        # Write the Stages kept in memory, so that the files of the notebook can be checked once it ran
+        save_in_memory_layers()
 
     return Notebook(namespace, exec_dir)
 
@@ -197,7 +218,8 @@ def run_notebook(tmp_path):
         cells: list[int] | None = None,
         tags: list[str] | None = None,
         needs_content: bool = False,
+        in_memory: bool | None = None,
     ) -> Notebook:
-        return _execute_notebook(path, cells, tags, tmp_path, needs_content=needs_content)
+        return _execute_notebook(path, cells, tags, tmp_path, needs_content=needs_content, in_memory=in_memory)
 
     return _run
@@ -0,0 +1,370 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the lousd.buildhelpers module."""
+
+from concurrent.futures import ThreadPoolExecutor
+import json
+import os
+from pathlib import Path
+import zipfile
+
+import pytest
+
+from lousd.buildhelpers import (
+    COPY_ON_WRITE_MODES,
+    MANIFEST_FILE_NAME,
+    NOTEBOOK_MANIFEST_FILE_NAME,
+    SyncResult,
+    TEXTURE_SUFFIXES,
+    build_archive,
+    build_archives,
+    iter_asset_folders,
+    materialize_file,
+    materialize_tree,
+    prepare_notebooks,
+    rewrite_image_links,
+    sync_trees,
+    write_if_changed,
+)
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def docs_dir(tmp_path: Path) -> Path:
+    """Create a docs tree with asset folders, including one inside a build output.
+
+    Args:
+        tmp_path: Pytest's temporary path fixture.
+
+    Returns:
+        Path to the docs directory.
+    """
+    docs_dir = tmp_path / "docs"
+    for rel_path, content in {
+        "module-a/_assets/scene.usda": "#usda 1.0\n",
+        "module-a/_assets/textures/wood.png": "png",
+        "module-b/lesson/_assets/cube.usda": "#usda 1.0\ndef Cube \"Cube\" {}\n",
+        "_build/html/module-a/_assets/scene.usda": "#usda 1.0\n",
+    }.items():
+        file_path = docs_dir / rel_path
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(content)
+    return docs_dir
+
+
+def _sync(docs_dir: Path) -> SyncResult:
+    """Synchronize the asset folders of the docs into their HTML output.
+
+    Args:
+        docs_dir: Path to the docs directory.
+
+    Returns:
+        Number of files copied, left unchanged and deleted.
+    """
+    build_dir = docs_dir / "_build" / "html"
+    pairs = [(path, build_dir / path.relative_to(docs_dir)) for path in iter_asset_folders(docs_dir)]
+    return sync_trees(pairs, build_dir / MANIFEST_FILE_NAME)
+
+
+# =============================================================================
+# Tests for the discovery of asset folders
+# =============================================================================
+
+
+class TestIterAssetFolders:
+    """Tests for the discovery of asset folders."""
+
+    def test_build_outputs_are_pruned(self, docs_dir: Path) -> None:
+        """Asset folders are found in sorted order, without descending into _build."""
+        assert [path.relative_to(docs_dir).as_posix() for path in iter_asset_folders(docs_dir)] == [
+            "module-a/_assets",
+            "module-b/lesson/_assets",
+        ]
+
+
+# =============================================================================
+# Tests for the incremental synchronization
+# =============================================================================
+
+
+class TestSyncTrees:
+    """Tests for the incremental synchronization of asset folders."""
+
+    def test_first_sync_copies_everything(self, docs_dir: Path) -> None:
+        """All files are copied by the first synchronization, along with a manifest."""
+        assert _sync(docs_dir) == SyncResult(copied=3)
+        build_dir = docs_dir / "_build" / "html"
+        assert (build_dir / "module-a/_assets/textures/wood.png").read_text() == "png"
+        assert (build_dir / MANIFEST_FILE_NAME).is_file()
+
+    def test_unchanged_files_are_not_copied(self, docs_dir: Path) -> None:
+        """Files are not copied again unless their content changed, even when their modification time did."""
+        _sync(docs_dir)
+        assert _sync(docs_dir) == SyncResult(unchanged=3)
+
+        scene_path = docs_dir / "module-a/_assets/scene.usda"
+        os.utime(scene_path, ns=(0, scene_path.stat().st_mtime_ns + 10**9))
+        assert _sync(docs_dir) == SyncResult(unchanged=3)
+
+        scene_path.write_text("#usda 1.0\ndef Xform \"World\" {}\n")
+        assert _sync(docs_dir) == SyncResult(copied=1, unchanged=2)
+        assert "World" in (docs_dir / "_build/html/module-a/_assets/scene.usda").read_text()
+
+    def test_stale_outputs_are_deleted(self, docs_dir: Path) -> None:
+        """Outputs whose sources were removed are deleted, leaving files not copied by the sync untouched."""
+        _sync(docs_dir)
+        build_dir = docs_dir / "_build" / "html"
+        (build_dir / "module-a/_assets/generated.glb").write_text("glb")
+
+        (docs_dir / "module-a/_assets/textures/wood.png").unlink()
+        assert _sync(docs_dir) == SyncResult(unchanged=2, deleted=1)
+        assert not (build_dir / "module-a/_assets/textures").exists()
+        assert (build_dir / "module-a/_assets/generated.glb").is_file()
+
+        (docs_dir / "module-b/lesson/_assets/cube.usda").unlink()
+        (docs_dir / "module-b/lesson/_assets").rmdir()
+        assert _sync(docs_dir) == SyncResult(unchanged=1, deleted=1)
+        assert not (build_dir / "module-b/lesson/_assets").exists()
+
+    def test_missing_outputs_are_restored(self, docs_dir: Path) -> None:
+        """Outputs deleted since the previous synchronization are copied again."""
+        _sync(docs_dir)
+        (docs_dir / "_build/html/module-a/_assets/scene.usda").unlink()
+        assert _sync(docs_dir) == SyncResult(copied=1, unchanged=2)
+
+
+# =============================================================================
+# Tests for the generated files
+# =============================================================================
+
+
+class TestWriteIfChanged:
+    """Tests for the writes of generated files."""
+
+    def test_unchanged_files_are_not_rewritten(self, tmp_path: Path) -> None:
+        """Files are only written when their content changes, keeping their modification time otherwise."""
+        path = tmp_path / "_static" / "data" / "glossary-definitions.js"
+        assert write_if_changed(path, b"const glossaryDefinitions = {};\n")
+        os.utime(path, ns=(0, 0))
+        assert not write_if_changed(path, b"const glossaryDefinitions = {};\n")
+        assert path.stat().st_mtime_ns == 0
+
+        assert write_if_changed(path, b"const glossaryDefinitions = {\"USD\": {}};\n")
+        assert path.read_bytes() == b"const glossaryDefinitions = {\"USD\": {}};\n"
+        assert list(path.parent.glob("*.tmp")) == []
+
+    def test_concurrent_writers(self, tmp_path: Path) -> None:
+        """Concurrent writers use temporary files of their own, leaving one complete file readable by everyone."""
+        path = tmp_path / "glossary-definitions.js"
+        contents = [f"const glossaryDefinitions = {{{index}: {{}}}};\n".encode("utf-8") * 1000 for index in range(16)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            assert all(executor.map(lambda content: write_if_changed(path, content), contents))
+        assert path.read_bytes() in contents
+        assert list(tmp_path.glob("*.tmp")) == []
+        reference_path = tmp_path / "reference.js"
+        reference_path.write_bytes(b"")
+        assert path.stat().st_mode == reference_path.stat().st_mode
+
+
+# =============================================================================
+# Tests for the materialization of trees
+# =============================================================================
+
+
+class TestMaterializeTree:
+    """Tests for the materialization of files as links or copies."""
+
+    def test_hard_links_share_the_source(self, docs_dir: Path, tmp_path: Path) -> None:
+        """Files are hard-linked when reflinks are not requested, recreating the directories of the tree."""
+        destination_dir = tmp_path / "linked"
+        assert materialize_tree(docs_dir / "module-a", destination_dir, modes=("hardlink", "copy")) == {
+            "hardlink": 2,
+            "copy": 0,
+        }
+        source_path = docs_dir / "module-a/_assets/textures/wood.png"
+        assert (destination_dir / "_assets/textures/wood.png").stat().st_ino == source_path.stat().st_ino
+
+    def test_only_read_only_files_are_hard_linked(self, docs_dir: Path, tmp_path: Path) -> None:
+        """By default files are never hard-linked, except for the read-only file types given."""
+        destination_dir = tmp_path / "cloned"
+        counts = materialize_tree(docs_dir / "module-a", destination_dir, read_only_suffixes=TEXTURE_SUFFIXES)
+        assert sum(counts.values()) == 2
+        # Without reflink support, the texture is hard-linked while the USD file is copied
+        assert counts.get("hardlink", 0) == (0 if counts["reflink"] else 1)
+        assert (destination_dir / "_assets/scene.usda").stat().st_nlink == 1
+        assert (docs_dir / "module-a/_assets/scene.usda").stat().st_nlink == 1
+
+    def test_fallback_to_copy(self, docs_dir: Path, tmp_path: Path) -> None:
+        """Unsupported link modes fall back to the next one, down to copying."""
+        source_path = docs_dir / "module-a/_assets/scene.usda"
+        mode = materialize_file(source_path, tmp_path / "scene.usda", modes=("reflink", "copy"))
+        assert mode in ("reflink", "copy")
+        assert (tmp_path / "scene.usda").read_text() == source_path.read_text()
+        assert (tmp_path / "scene.usda").stat().st_ino != source_path.stat().st_ino
+
+        with pytest.raises(FileNotFoundError):
+            materialize_tree(docs_dir / "missing", tmp_path / "missing")
+
+    def test_existing_links_are_replaced(self, docs_dir: Path, tmp_path: Path) -> None:
+        """Materializing over a hard link replaces it instead of writing through it into its source."""
+        source_path = docs_dir / "module-a/_assets/scene.usda"
+        destination_path = tmp_path / "scene.usda"
+        materialize_file(source_path, destination_path, modes=("hardlink",))
+        other_path = docs_dir / "module-b/lesson/_assets/cube.usda"
+        materialize_file(other_path, destination_path, modes=("copy",))
+        assert source_path.read_text() == "#usda 1.0\n"
+        assert destination_path.read_text() == other_path.read_text()
+
+    def test_copy_on_write_files_can_be_written_in_place(self, docs_dir: Path, tmp_path: Path) -> None:
+        """Writing through a file materialized with copy-on-write modes leaves its source unchanged."""
+        destination_dir = tmp_path / "cloned"
+        materialize_tree(docs_dir / "module-a", destination_dir, COPY_ON_WRITE_MODES)
+        source_path = docs_dir / "module-a/_assets/scene.usda"
+        with open(destination_dir / "_assets/scene.usda", "w") as f:
+            f.write("#usda 1.0\ndef Xform \"Edited\" {}\n")
+        assert source_path.read_text() == "#usda 1.0\n"
+        assert source_path.stat().st_nlink == 1
+
+    def test_synchronized_files_are_not_hard_links(self, docs_dir: Path) -> None:
+        """Synchronized outputs never share their content with the sources of the documentation."""
+        _sync(docs_dir)
+        assert (docs_dir / "_build/html/module-a/_assets/scene.usda").stat().st_nlink == 1
+
+
+# =============================================================================
+# Tests for the exercise archives
+# =============================================================================
+
+
+class TestBuildArchives:
+    """Tests for the cached builds of ZIP archives."""
+
+    @pytest.fixture
+    def exercises_dir(self, tmp_path: Path) -> Path:
+        """Create two exercise folders with text and image files.
+
+        Args:
+            tmp_path: Pytest's temporary path fixture.
+
+        Returns:
+            Path to the folder holding the exercise folders.
+        """
+        exercises_dir = tmp_path / "exercise_content"
+        for name in ("instancing", "composition"):
+            (exercises_dir / name / "textures").mkdir(parents=True)
+            (exercises_dir / name / "scene.usda").write_text("#usda 1.0\n" + "def Xform \"World\" {}\n" * 100)
+            (exercises_dir / name / "textures" / "wood.png").write_bytes(os.urandom(256))
+        return exercises_dir
+
+    def test_archives_are_compressed(self, exercises_dir: Path, tmp_path: Path) -> None:
+        """Files are deflated under the name of their exercise folder, already compressed images being stored."""
+        zip_path = tmp_path / "instancing.zip"
+        assert build_archive(exercises_dir / "instancing", zip_path)
+        with zipfile.ZipFile(zip_path) as zip_file:
+            infos = {info.filename: info for info in zip_file.infolist()}
+        assert sorted(infos) == ["instancing/scene.usda", "instancing/textures/wood.png"]
+        assert infos["instancing/scene.usda"].compress_type == zipfile.ZIP_DEFLATED
+        assert infos["instancing/scene.usda"].compress_size < infos["instancing/scene.usda"].file_size
+        assert infos["instancing/textures/wood.png"].compress_type == zipfile.ZIP_STORED
+        assert list(tmp_path.glob("*.tmp")) == []
+
+    def test_archives_are_only_rebuilt_when_changed(self, exercises_dir: Path, tmp_path: Path) -> None:
+        """Archives are rebuilt when their content or compression level changes, and only then."""
+        zip_path = tmp_path / "instancing.zip"
+        assert build_archive(exercises_dir / "instancing", zip_path)
+        assert not build_archive(exercises_dir / "instancing", zip_path)
+
+        os.utime(exercises_dir / "instancing" / "scene.usda")
+        assert not build_archive(exercises_dir / "instancing", zip_path)
+
+        (exercises_dir / "instancing" / "scene.usda").write_text("#usda 1.0\n")
+        assert build_archive(exercises_dir / "instancing", zip_path)
+        assert build_archive(exercises_dir / "instancing", zip_path, compresslevel=9)
+
+    def test_archives_are_built_in_parallel(self, exercises_dir: Path, tmp_path: Path) -> None:
+        """Several archives are built at once, reporting in order which ones were out of date."""
+        jobs = [(path, tmp_path / f"{path.name}.zip") for path in sorted(exercises_dir.iterdir())]
+        assert build_archives(jobs) == [True, True]
+        (exercises_dir / "instancing" / "extra.usda").write_text("#usda 1.0\n")
+        assert build_archives(jobs) == [False, True]
+
+
+# =============================================================================
+# Tests for the preparation of executed notebooks
+# =============================================================================
+
+
+class TestPrepareNotebooks:
+    """Tests for the post-processing of executed notebooks."""
+
+    @pytest.fixture
+    def notebooks_dir(self, tmp_path: Path) -> Path:
+        """Create executed notebooks referencing local and remote images.
+
+        Args:
+            tmp_path: Pytest's temporary path fixture.
+
+        Returns:
+            Path to the folder holding the executed notebooks.
+        """
+        notebooks_dir = tmp_path / "jupyter_execute"
+        for rel_path in ("intro.ipynb", "module-a/lesson.ipynb", "module-b/text-only.ipynb"):
+            source = ["# Title\n"]
+            if rel_path != "module-b/text-only.ipynb":
+                source += ["![Cube](../../images/cube.png) and ![Logo](https://example.com/logo.png)\n"]
+            nb_path = notebooks_dir / rel_path
+            nb_path.parent.mkdir(parents=True, exist_ok=True)
+            nb_path.write_text(json.dumps({"cells": [{"cell_type": "markdown", "source": source}]}))
+        return notebooks_dir
+
+    def test_image_links_are_rewritten(self) -> None:
+        """Relative image links point to the images folder, remote ones are left untouched."""
+        nb_data = {
+            "cells": [
+                {"cell_type": "markdown", "source": "![A](_images/a.png) ![B](http://example.com/b.png)"},
+                {"cell_type": "code", "source": ["print('![C](c.png)')"]},
+            ]
+        }
+        assert rewrite_image_links(nb_data, "../images/")
+        assert nb_data["cells"][0]["source"] == ["![A](../images/a.png) ![B](http://example.com/b.png)"]
+        assert nb_data["cells"][1]["source"] == ["print('![C](c.png)')"]
+        assert not rewrite_image_links(nb_data, "../images/")
+
+    def test_notebooks_are_prepared(self, notebooks_dir: Path) -> None:
+        """Image links are made relative to the depth of each notebook, rewriting only the notebooks which need it."""
+        assert prepare_notebooks(notebooks_dir, max_workers=2) == {
+            "intro.ipynb": True,
+            "module-a/lesson.ipynb": True,
+            "module-b/text-only.ipynb": False,
+        }
+        for rel_path, prefix in (("intro.ipynb", "images/"), ("module-a/lesson.ipynb", "../images/")):
+            source = json.loads((notebooks_dir / rel_path).read_text())["cells"][0]["source"]
+            assert source[1].startswith(f"![Cube]({prefix}cube.png)")
+        assert (notebooks_dir / NOTEBOOK_MANIFEST_FILE_NAME).is_file()
+
+    def test_prepared_notebooks_are_skipped(self, notebooks_dir: Path) -> None:
+        """Only notebooks changed since they were last prepared are processed again."""
+        prepare_notebooks(notebooks_dir, max_workers=1)
+        assert prepare_notebooks(notebooks_dir, max_workers=1) == {}
+
+        lesson_path = notebooks_dir / "module-a" / "lesson.ipynb"
+        lesson_path.write_text(json.dumps({"cells": [{"cell_type": "markdown", "source": ["![New](new.png)"]}]}))
+        assert prepare_notebooks(notebooks_dir, max_workers=1) == {"module-a/lesson.ipynb": True}
+        assert prepare_notebooks(notebooks_dir, max_workers=1) == {}
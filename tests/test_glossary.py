@@ -0,0 +1,145 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the lousd.glossary Sphinx extension."""
+
+import json
+from pathlib import Path
+import types
+
+import pytest
+
+pytest.importorskip("sphinx")
+
+from docutils.core import publish_doctree
+from sphinx.application import Sphinx
+
+from lousd import glossary
+
+
+_GLOSSARY_RST = """\
+Glossary
+========
+
+.. glossary::
+
+   Prim
+
+      A prim is the primary container object in USD, described in :doc:`index`.
+
+      **Also Known As:** *primitive*
+      **Further Reading**: `Prims <https://openusd.org/release/glossary.html#prim>`_
+
+   Stage
+
+      A stage composes layers.
+"""
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def src_dir(tmp_path: Path) -> Path:
+    """Create a Sphinx project with a glossary document and another page.
+
+    Args:
+        tmp_path: Pytest's temporary path fixture.
+
+    Returns:
+        Path to the source directory of the project.
+    """
+    src_dir = tmp_path / "src"
+    src_dir.mkdir()
+    (src_dir / "conf.py").write_text("extensions = ['lousd.glossary']\n")
+    (src_dir / "index.rst").write_text("Index\n=====\n\n.. toctree::\n\n   glossary\n   other\n")
+    (src_dir / "glossary.rst").write_text(_GLOSSARY_RST)
+    (src_dir / "other.rst").write_text("Other\n=====\n\n.. glossary::\n\n   Layer\n\n      Not collected.\n")
+    return src_dir
+
+
+def _build(src_dir: Path) -> dict:
+    """Build the HTML output of the project incrementally and return the written glossary definitions.
+
+    Args:
+        src_dir: Path to the source directory of the project.
+
+    Returns:
+        The glossary definitions, by term.
+    """
+    out_dir = src_dir.parent / "_build" / "html"
+    app = Sphinx(src_dir, src_dir, out_dir, src_dir.parent / "_build" / "doctrees", "html", status=None, warning=None)
+    app.build()
+    content = (out_dir / glossary.DEFINITIONS_FILE_PATH).read_text(encoding="utf-8")
+    return json.loads(content.split("const glossaryDefinitions = ", 1)[1].rstrip().rstrip(";"))
+
+
+# =============================================================================
+# Tests for the collection of glossary definitions
+# =============================================================================
+
+
+class TestGlossaryDefinitions:
+    """Tests for the collection and output of the glossary definitions."""
+
+    def test_collector_reads_glossary_documents(self) -> None:
+        """Definitions of glossary terms are collected by term, only from the configured glossary documents."""
+        doctree = publish_doctree(
+            ".. class:: glossary\n\nPrim\n   A prim.\n\nStage\n   A stage.\n\nPlain\n   Not a glossary term.\n"
+        )
+        env = types.SimpleNamespace(docname="glossary")
+        app = types.SimpleNamespace(env=env, config=types.SimpleNamespace(lousd_glossary_docnames=["glossary"]))
+        glossary.collect_glossary_definitions(app, doctree)
+        definitions = getattr(env, glossary.ENV_ATTRIBUTE_NAME)
+        assert list(definitions) == ["glossary"]
+        assert sorted(definitions["glossary"]) == ["Plain", "Prim", "Stage"]
+        assert definitions["glossary"]["Prim"].astext() == "A prim."
+
+        other_env = types.SimpleNamespace(docname="other")
+        glossary.collect_glossary_definitions(types.SimpleNamespace(env=other_env, config=app.config), doctree)
+        assert not hasattr(other_env, glossary.ENV_ATTRIBUTE_NAME)
+
+    def test_purge_and_merge(self) -> None:
+        """Definitions are purged per document and merged from parallel readers without overwriting other documents."""
+        env = types.SimpleNamespace(**{glossary.ENV_ATTRIBUTE_NAME: {"glossary": {"Prim": None}, "terms": {}}})
+        other = types.SimpleNamespace(**{glossary.ENV_ATTRIBUTE_NAME: {"extra": {"Stage": None}}})
+        glossary.merge_glossary_definitions(None, env, {"extra"}, other)
+        glossary.purge_glossary_definitions(None, env, "terms")
+        assert getattr(env, glossary.ENV_ATTRIBUTE_NAME) == {"glossary": {"Prim": None}, "extra": {"Stage": None}}
+
+    def test_definitions_are_rendered_with_resolved_references(self, src_dir: Path) -> None:
+        """Descriptions are rendered as HTML with resolved references, along with their alias and links."""
+        definitions = _build(src_dir)
+        assert sorted(definitions) == ["Prim", "Stage"]
+        assert 'href="index.html"' in definitions["Prim"]["descriptionHtml"]
+        assert definitions["Prim"]["aka"] == "primitive"
+        assert definitions["Prim"]["links"] == [
+            {"text": "Prims", "url": "https://openusd.org/release/glossary.html#prim"}
+        ]
+        assert definitions["Stage"] == {
+            "title": "Stage",
+            "aka": None,
+            "descriptionHtml": "<p>A stage composes layers.</p>",
+            "links": [],
+        }
+
+    def test_incremental_builds_keep_definitions(self, src_dir: Path) -> None:
+        """Definitions persist in the environment, so builds which do not read the glossary again still write them."""
+        definitions = _build(src_dir)
+        (src_dir.parent / "_build" / "html" / glossary.DEFINITIONS_FILE_PATH).unlink()
+        (src_dir / "other.rst").write_text("Other\n=====\n\nChanged.\n")
+        assert _build(src_dir) == definitions
@@ -0,0 +1,388 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the lousd.utils.gltfexport module."""
+
+import json
+import struct
+
+import numpy as np
+import pytest
+from pxr import Gf, Sdf, Usd, UsdGeom, UsdLux, UsdShade
+
+from lousd.utils import tessellation
+from lousd.utils.gltfexport import (
+    UnsupportedContentError,
+    _reduce_keys,
+    export_stage_bounds_to_glb,
+    export_stage_to_glb,
+)
+
+
+def _read_glb(glb_content: bytes) -> tuple[dict, bytes]:
+    """Split GLB content into its JSON document and binary buffer.
+
+    Args:
+        glb_content: The GLB content to read.
+
+    Returns:
+        The glTF JSON document and the content of the binary chunk.
+    """
+    magic, version, total_length = struct.unpack_from("<III", glb_content, 0)
+    assert magic == 0x46546C67
+    assert version == 2
+    assert total_length == len(glb_content)
+
+    json_length, _ = struct.unpack_from("<II", glb_content, 12)
+    document = json.loads(glb_content[20:20 + json_length])
+    binary = b""
+    if 20 + json_length < len(glb_content):
+        binary_length, _ = struct.unpack_from("<II", glb_content, 20 + json_length)
+        binary = glb_content[28 + json_length:28 + json_length + binary_length]
+    return document, binary
+
+
+def _read_accessor(document: dict, binary: bytes, accessor_index: int) -> np.ndarray:
+    """Read the content of a glTF accessor.
+
+    Args:
+        document: The glTF JSON document.
+        binary: The content of the binary chunk.
+        accessor_index: Index of the accessor to read.
+
+    Returns:
+        The content of the accessor, with one row per element.
+    """
+    accessor = document["accessors"][accessor_index]
+    buffer_view = document["bufferViews"][accessor["bufferView"]]
+    dtype = np.uint32 if accessor["componentType"] == 5125 else np.float32
+    width = {"SCALAR": 1, "VEC2": 2, "VEC3": 3, "VEC4": 4}[accessor["type"]]
+    data = np.frombuffer(binary, dtype=dtype, count=accessor["count"] * width, offset=buffer_view["byteOffset"])
+    return data.reshape(accessor["count"], width)
+
+
+def _define_quad(stage: Usd.Stage, path: str) -> UsdGeom.Mesh:
+    """Define a single-quad mesh on the given stage.
+
+    Args:
+        stage: The stage on which to define the mesh.
+        path: Path of the mesh prim.
+
+    Returns:
+        The quad mesh.
+    """
+    mesh = UsdGeom.Mesh.Define(stage, path)
+    mesh.CreatePointsAttr([(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0)])
+    mesh.CreateFaceVertexCountsAttr([4])
+    mesh.CreateFaceVertexIndicesAttr([0, 1, 2, 3])
+    return mesh
+
+
+def _define_point_instancer(stage: Usd.Stage, path: str) -> UsdGeom.PointInstancer:
+    """Define a point instancer placing three instances of a quad, the second one being invisible.
+
+    Args:
+        stage: The stage on which to define the point instancer.
+        path: Path of the point instancer prim.
+
+    Returns:
+        The point instancer.
+    """
+    point_instancer = UsdGeom.PointInstancer.Define(stage, path)
+    prototype = UsdGeom.Xform.Define(stage, f"{path}/Prototypes/Offset")
+    prototype.AddTranslateOp().Set(Gf.Vec3d(0, 0, 5))
+    _define_quad(stage, f"{path}/Prototypes/Offset/Quad")
+    point_instancer.CreatePrototypesRel().AddTarget(prototype.GetPath())
+    point_instancer.CreateProtoIndicesAttr([0, 0, 0])
+    point_instancer.CreatePositionsAttr([(1, 0, 0), (2, 0, 0), (3, 0, 0)])
+    point_instancer.CreateScalesAttr([(1, 1, 1), (1, 1, 1), (2, 2, 2)])
+    point_instancer.CreateOrientationsAttr([Gf.Quath(1, 0, 0, 0), Gf.Quath(1, 0, 0, 0), Gf.Quath(0, 0, 0, 1)])
+    point_instancer.InvisId(1, Usd.TimeCode.Default())
+    return point_instancer
+
+
+class TestExportStageToGlb:
+    """Tests for the export_stage_to_glb function."""
+
+    def test_empty_stage(self) -> None:
+        """An empty stage exports to a valid GLB without any buffer."""
+        document, binary = _read_glb(export_stage_to_glb(Usd.Stage.CreateInMemory()))
+        assert document["asset"]["version"] == "2.0"
+        assert document["scenes"] == [{"nodes": []}]
+        assert binary == b""
+
+    def test_quad_is_triangulated(self) -> None:
+        """A quad is exported as two triangles covering its four corners."""
+        stage = Usd.Stage.CreateInMemory()
+        _define_quad(stage, "/Quad")
+        document, binary = _read_glb(export_stage_to_glb(stage))
+
+        primitive = document["meshes"][0]["primitives"][0]
+        positions = _read_accessor(document, binary, primitive["attributes"]["POSITION"])
+        indices = _read_accessor(document, binary, primitive["indices"]).ravel()
+        assert positions.shape == (4, 3)
+        assert indices.tolist() == [0, 1, 2, 0, 2, 3]
+        assert document["accessors"][primitive["attributes"]["POSITION"]]["max"] == [1.0, 1.0, 0.0]
+
+    def test_hierarchy_and_transforms(self) -> None:
+        """Xformable prims become nodes carrying their local transformation."""
+        stage = Usd.Stage.CreateInMemory()
+        world = UsdGeom.Xform.Define(stage, "/World")
+        world.AddTranslateOp().Set(Gf.Vec3d(1, 2, 3))
+        UsdGeom.Scope.Define(stage, "/World/Group")
+        _define_quad(stage, "/World/Group/Quad")
+        document, _ = _read_glb(export_stage_to_glb(stage))
+
+        assert [node["name"] for node in document["nodes"]] == ["World", "Quad"]
+        assert document["nodes"][0]["matrix"][12:15] == [1.0, 2.0, 3.0]
+        assert document["nodes"][0]["children"] == [1]
+        assert document["nodes"][1]["mesh"] == 0
+
+    def test_invisible_prims_are_skipped(self) -> None:
+        """Invisible prims and their descendants are not exported."""
+        stage = Usd.Stage.CreateInMemory()
+        _define_quad(stage, "/Visible")
+        _define_quad(stage, "/Hidden").MakeInvisible()
+        document, _ = _read_glb(export_stage_to_glb(stage))
+        assert [node["name"] for node in document["nodes"]] == ["Visible"]
+
+    def test_guide_and_proxy_purposes_are_skipped(self) -> None:
+        """Guide and proxy geometry is not exported next to the render geometry."""
+        stage = Usd.Stage.CreateInMemory()
+        _define_quad(stage, "/Render").CreatePurposeAttr(UsdGeom.Tokens.render)
+        _define_quad(stage, "/Proxy").CreatePurposeAttr(UsdGeom.Tokens.proxy)
+        _define_quad(stage, "/Guide").CreatePurposeAttr(UsdGeom.Tokens.guide)
+        document, _ = _read_glb(export_stage_to_glb(stage))
+        assert [node["name"] for node in document["nodes"]] == ["Render"]
+
+    def test_switched_off_lights_keep_their_intensity(self) -> None:
+        """An authored intensity of zero is exported as such."""
+        stage = Usd.Stage.CreateInMemory()
+        UsdLux.SphereLight.Define(stage, "/Off").CreateIntensityAttr(0.0)
+        UsdLux.SphereLight.Define(stage, "/Default")
+        document, _ = _read_glb(export_stage_to_glb(stage))
+        lights = document["extensions"]["KHR_lights_punctual"]["lights"]
+        assert [light["intensity"] for light in lights] == [0.0, 1.0]
+
+    def test_preview_surface_material(self) -> None:
+        """UsdPreviewSurface inputs are mapped onto glTF metallic-roughness factors."""
+        stage = Usd.Stage.CreateInMemory()
+        mesh = _define_quad(stage, "/Quad")
+        material = UsdShade.Material.Define(stage, "/Looks/Red")
+        shader = UsdShade.Shader.Define(stage, "/Looks/Red/Surface")
+        shader.CreateIdAttr("UsdPreviewSurface")
+        shader.CreateInput("diffuseColor", Sdf.ValueTypeNames.Color3f).Set(Gf.Vec3f(1, 0, 0))
+        shader.CreateInput("roughness", Sdf.ValueTypeNames.Float).Set(0.25)
+        material.CreateSurfaceOutput().ConnectToSource(shader.ConnectableAPI(), "surface")
+        UsdShade.MaterialBindingAPI.Apply(mesh.GetPrim()).Bind(material)
+        document, _ = _read_glb(export_stage_to_glb(stage))
+
+        gltf_material = document["materials"][document["meshes"][0]["primitives"][0]["material"]]
+        assert gltf_material["name"] == "Red"
+        assert gltf_material["pbrMetallicRoughness"]["baseColorFactor"] == [1.0, 0.0, 0.0, 1.0]
+        assert gltf_material["pbrMetallicRoughness"]["roughnessFactor"] == 0.25
+
+    def test_double_sided_meshes_do_not_alter_shared_materials(self) -> None:
+        """A double-sided mesh gets a double-sided copy of its material, leaving other meshes bound to it single-sided."""
+        stage = Usd.Stage.CreateInMemory()
+        material = UsdShade.Material.Define(stage, "/Looks/Red")
+        shader = UsdShade.Shader.Define(stage, "/Looks/Red/Surface")
+        shader.CreateIdAttr("UsdPreviewSurface")
+        material.CreateSurfaceOutput().ConnectToSource(shader.ConnectableAPI(), "surface")
+        for path, double_sided in (("/SingleSided", False), ("/DoubleSided", True), ("/OtherDoubleSided", True)):
+            mesh = _define_quad(stage, path)
+            mesh.CreateDoubleSidedAttr(double_sided)
+            UsdShade.MaterialBindingAPI.Apply(mesh.GetPrim()).Bind(material)
+        document, _ = _read_glb(export_stage_to_glb(stage))
+
+        materials_by_node = {
+            node["name"]: document["materials"][document["meshes"][node["mesh"]]["primitives"][0]["material"]]
+            for node in document["nodes"]
+        }
+        assert "doubleSided" not in materials_by_node["SingleSided"]
+        assert materials_by_node["DoubleSided"]["doubleSided"] is True
+        assert materials_by_node["DoubleSided"]["name"] == "Red"
+        assert len(document["materials"]) == 2
+
+    def test_instances_share_a_mesh(self) -> None:
+        """Instances of the same prototype reference a single glTF mesh."""
+        stage = Usd.Stage.CreateInMemory()
+        stage.DefinePrim("/Prototype", "Xform").SetSpecifier(Sdf.SpecifierClass)
+        _define_quad(stage, "/Prototype/Quad")
+        for index in range(3):
+            instance = UsdGeom.Xform.Define(stage, f"/Instance{index}").GetPrim()
+            instance.GetReferences().AddInternalReference("/Prototype")
+            instance.SetInstanceable(True)
+        document, _ = _read_glb(export_stage_to_glb(stage))
+
+        assert len(document["meshes"]) == 1
+        assert [node.get("mesh") for node in document["nodes"] if node["name"] == "Quad"] == [0, 0, 0]
+
+    def test_point_instancer_uses_gpu_instancing(self) -> None:
+        """Point instancers place a single mesh at each visible instance through EXT_mesh_gpu_instancing."""
+        stage = Usd.Stage.CreateInMemory()
+        _define_point_instancer(stage, "/Points")
+        document, binary = _read_glb(export_stage_to_glb(stage))
+
+        assert document["extensionsUsed"] == ["EXT_mesh_gpu_instancing"]
+        assert len(document["meshes"]) == 1
+        instanced_node = document["nodes"][document["nodes"][0]["children"][0]]
+        attributes = instanced_node["extensions"]["EXT_mesh_gpu_instancing"]["attributes"]
+        np.testing.assert_allclose(_read_accessor(document, binary, attributes["TRANSLATION"]), [(1, 0, 5), (3, 0, 10)])
+        np.testing.assert_allclose(_read_accessor(document, binary, attributes["SCALE"]), [(1, 1, 1), (2, 2, 2)])
+        rotations = np.abs(_read_accessor(document, binary, attributes["ROTATION"]))
+        np.testing.assert_allclose(rotations, [(0, 0, 0, 1), (0, 0, 1, 0)], atol=1e-6)
+
+    def test_point_instancer_without_gpu_instancing(self) -> None:
+        """Point instances can be exported as individual nodes sharing a single mesh."""
+        stage = Usd.Stage.CreateInMemory()
+        _define_point_instancer(stage, "/Points")
+        document, _ = _read_glb(export_stage_to_glb(stage, gpu_instancing=False))
+
+        assert "extensionsUsed" not in document
+        instance_nodes = [document["nodes"][index] for index in document["nodes"][0]["children"]]
+        assert [node["mesh"] for node in instance_nodes] == [0, 0]
+        assert instance_nodes[1]["matrix"][:3] == [-2.0, 0.0, 0.0]
+        assert instance_nodes[1]["matrix"][12:15] == [3.0, 0.0, 10.0]
+
+    def test_meshes_are_simplified_to_a_budget(self) -> None:
+        """Meshes are simplified to fit a triangle budget, leaving small meshes untouched."""
+        stage = Usd.Stage.CreateInMemory()
+        mesh_data = tessellation.tessellate_sphere(radius=1.0, segments=64)
+        sphere = UsdGeom.Mesh.Define(stage, "/Sphere")
+        sphere.CreatePointsAttr(mesh_data.points)
+        sphere.CreateFaceVertexCountsAttr(mesh_data.face_vertex_counts)
+        sphere.CreateFaceVertexIndicesAttr(mesh_data.face_vertex_indices)
+        _define_quad(stage, "/Quad")
+        document, binary = _read_glb(export_stage_to_glb(stage, max_triangles=500))
+
+        sphere_primitive, quad_primitive = (mesh["primitives"][0] for mesh in document["meshes"])
+        sphere_triangles = _read_accessor(document, binary, sphere_primitive["indices"]).reshape(-1, 3)
+        assert 100 <= len(sphere_triangles) <= 500
+        assert sphere_triangles.max() < document["accessors"][sphere_primitive["attributes"]["POSITION"]]["count"]
+        assert document["accessors"][quad_primitive["indices"]]["count"] == 6
+
+    def test_animated_transform_is_sampled(self) -> None:
+        """Animated transforms become animation channels, keeping only the keys needed by linear interpolation."""
+        stage = Usd.Stage.CreateInMemory()
+        stage.SetTimeCodesPerSecond(24)
+        translate_op = UsdGeom.Xform.Define(stage, "/World").AddTranslateOp()
+        translate_op.Set(Gf.Vec3d(0, 0, 0), 1)
+        translate_op.Set(Gf.Vec3d(0, 1, 0), 25)
+        document, binary = _read_glb(export_stage_to_glb(stage))
+
+        assert "matrix" not in document["nodes"][0]
+        (animation,) = document["animations"]
+        assert [channel["target"] for channel in animation["channels"]] == [{"node": 0, "path": "translation"}]
+        sampler = animation["samplers"][0]
+        np.testing.assert_allclose(_read_accessor(document, binary, sampler["input"]).ravel(), [0.0, 1.0])
+        np.testing.assert_allclose(_read_accessor(document, binary, sampler["output"]), [(0, 0, 0), (0, 1, 0)])
+
+    def test_sample_rate_and_frame_range(self) -> None:
+        """Animations are resampled at the requested rate, over the requested frame range."""
+        stage = Usd.Stage.CreateInMemory()
+        stage.SetTimeCodesPerSecond(24)
+        rotate_op = UsdGeom.Xform.Define(stage, "/World").AddRotateZOp()
+        rotate_op.Set(0.0, 0)
+        rotate_op.Set(360.0, 48)
+        document, binary = _read_glb(export_stage_to_glb(stage, sample_rate=4, frame_range=(0, 24)))
+
+        sampler = document["animations"][0]["samplers"][0]
+        np.testing.assert_allclose(
+            _read_accessor(document, binary, sampler["input"]).ravel(), [0.0, 0.25, 0.5, 0.75, 1.0]
+        )
+        rotations = _read_accessor(document, binary, sampler["output"])
+        assert np.all(np.einsum("ij,ij->i", rotations[1:], rotations[:-1]) > 0.0)
+
+    def test_animated_points_become_morph_targets(self) -> None:
+        """Animated points are baked into morph targets, driven by an animation of the weights of the node."""
+        stage = Usd.Stage.CreateInMemory()
+        points_attribute = _define_quad(stage, "/Quad").GetPointsAttr()
+        points = points_attribute.Get()
+        points_attribute.Set(points, 0)
+        points_attribute.Set([point * 2 for point in points], 10)
+        points_attribute.Set(points, 20)
+        document, binary = _read_glb(export_stage_to_glb(stage))
+
+        (primitive,) = document["meshes"][0]["primitives"]
+        assert len(primitive["targets"]) == 2
+        np.testing.assert_allclose(_read_accessor(document, binary, primitive["targets"][0]["POSITION"])[2], (1, 1, 0))
+        sampler = document["animations"][0]["samplers"][0]
+        assert document["animations"][0]["channels"][0]["target"]["path"] == "weights"
+        np.testing.assert_allclose(_read_accessor(document, binary, sampler["output"]).ravel(), [0, 0, 1, 0, 0, 1])
+
+    def test_animated_topology_is_unsupported(self) -> None:
+        """Meshes whose topology changes over time are left to the usd2gltf fallback."""
+        stage = Usd.Stage.CreateInMemory()
+        mesh = _define_quad(stage, "/Quad")
+        mesh.GetPointsAttr().Set([(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0)], 1)
+        mesh.GetPointsAttr().Set([(0, 0, 1), (1, 0, 1), (1, 1, 1), (0, 1, 1)], 2)
+        mesh.GetFaceVertexIndicesAttr().Set([0, 1, 2, 3], 1)
+        mesh.GetFaceVertexIndicesAttr().Set([3, 2, 1, 0], 2)
+        with pytest.raises(UnsupportedContentError):
+            export_stage_to_glb(stage)
+
+
+class TestReduceKeys:
+    """Tests for the reduction of sampled animation keys."""
+
+    def test_linear_samples_reduce_to_their_ends(self) -> None:
+        """Samples lying on a line are reproduced by their first and last keys."""
+        times = np.arange(100.0)
+        assert _reduce_keys(times, np.stack([times, 2.0 * times], axis=1)).tolist() == [0, 99]
+
+    def test_reduced_keys_reproduce_the_samples(self) -> None:
+        """Slowly varying samples keep enough keys to be reproduced within tolerance."""
+        times = np.arange(1000.0)
+        values = np.sin(times / 300.0)
+        keys = _reduce_keys(times, values)
+        assert 2 < len(keys) < len(times)
+        np.testing.assert_allclose(np.interp(times, times[keys], values[keys]), values, atol=1e-4)
+
+
+class TestExportStageBoundsToGlb:
+    """Tests for the export of the bounding boxes of USD scenes to binary glTF."""
+
+    def test_components_become_boxes(self) -> None:
+        """Each component is replaced with an instance of a single unit cube, scaled to its bounds."""
+        stage = Usd.Stage.CreateInMemory()
+        for index in range(3):
+            component = UsdGeom.Xform.Define(stage, f"/Component{index}")
+            Usd.ModelAPI(component.GetPrim()).SetKind("component")
+            component.AddTranslateOp().Set(Gf.Vec3d(10 * index, 0, 0))
+            _define_quad(stage, f"/Component{index}/Quad")
+            _define_quad(stage, f"/Component{index}/OtherQuad")
+        document, binary = _read_glb(export_stage_bounds_to_glb(stage))
+
+        assert len(document["meshes"]) == 1
+        positions = _read_accessor(document, binary, document["meshes"][0]["primitives"][0]["attributes"]["POSITION"])
+        np.testing.assert_allclose(np.abs(positions), 0.5)
+        (box_node,) = [node for node in document["nodes"] if "mesh" in node]
+        attributes = box_node["extensions"]["EXT_mesh_gpu_instancing"]["attributes"]
+        translations = _read_accessor(document, binary, attributes["TRANSLATION"])
+        np.testing.assert_allclose(translations[:, 0], [0.5, 10.5, 20.5], atol=1e-3)
+
+    def test_proxy_geometry_is_honored(self) -> None:
+        """Meshes with a `proxy` purpose are exported in place of the bounding box of their component."""
+        stage = Usd.Stage.CreateInMemory()
+        component = UsdGeom.Xform.Define(stage, "/Component")
+        Usd.ModelAPI(component.GetPrim()).SetKind("component")
+        _define_quad(stage, "/Component/Render")
+        proxy = _define_quad(stage, "/Component/Proxy")
+        proxy.CreatePurposeAttr(UsdGeom.Tokens.proxy)
+        document, _ = _read_glb(export_stage_bounds_to_glb(stage))
+
+        assert [node["name"] for node in document["nodes"] if "mesh" in node] == ["Proxy"]
+        assert document["accessors"][document["meshes"][0]["primitives"][0]["indices"]]["count"] == 6
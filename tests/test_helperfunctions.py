@@ -0,0 +1,215 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the lousd.utils.helperfunctions module."""
+
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+from pxr import Sdf, UsdGeom
+
+from lousd.utils import helperfunctions
+from lousd.utils.helperfunctions import (
+    create_new_stage,
+    get_output_format,
+    OUTPUT_PURPOSE_INTERMEDIATE,
+    OUTPUT_PURPOSE_TEACHING,
+    reload_stage,
+    reset_stage_cache,
+    save_all_dirty_layers,
+    save_in_memory_layers,
+    set_output_format,
+)
+
+
+@pytest.fixture(autouse=True)
+def stage_registry(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Run each test from an empty directory, with an empty Stage registry.
+
+    Args:
+        tmp_path: Temporary directory used as the working directory.
+        monkeypatch: Pytest fixture used to change the working directory.
+
+    Yields:
+        None, resetting the Stage registry once the test completes.
+    """
+    monkeypatch.chdir(tmp_path)
+    for environment_variable in ("LOUSD_IN_MEMORY_STAGES", "LOUSD_TEACHING_FORMAT", "LOUSD_INTERMEDIATE_FORMAT"):
+        monkeypatch.delenv(environment_variable, raising=False)
+    reset_stage_cache()
+    yield
+    reset_stage_cache()
+    helperfunctions._unsaved_in_memory_layers.clear()
+    helperfunctions._in_memory_layer_identifiers.clear()
+    helperfunctions._output_formats.clear()
+
+
+def _read_file_header(file_path: Path) -> bytes:
+    """Read the first bytes of a file, identifying its format.
+
+    Args:
+        file_path: Path of the file to read.
+
+    Returns:
+        The first 8 bytes of the file.
+    """
+    with open(file_path, "rb") as f:
+        return f.read(8)
+
+
+class TestStageRegistry:
+    """Tests for the registry of Stages returned by create_new_stage."""
+
+    def test_stage_is_created_on_disk(self, tmp_path: Path) -> None:
+        """A new Stage is created at the given location, relative to the working directory."""
+        stage = create_new_stage("_assets/first.usda")
+        assert (tmp_path / "_assets" / "first.usda").is_file()
+        assert Path(stage.GetRootLayer().realPath) == tmp_path / "_assets" / "first.usda"
+
+    def test_stage_is_reused(self) -> None:
+        """Subsequent calls return the registered Stage, along with its unsaved edits."""
+        stage = create_new_stage("_assets/first.usda")
+        UsdGeom.Xform.Define(stage, "/World")
+        assert create_new_stage("_assets/first.usda") is stage
+        assert create_new_stage("_assets/first.usda").GetPrimAtPath("/World")
+
+    def test_least_recently_used_stages_are_evicted(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Only the most recently used Stages are kept alive by the registry."""
+        monkeypatch.setenv("LOUSD_STAGE_CACHE_SIZE", "2")
+        create_new_stage("first.usda")
+        create_new_stage("second.usda")
+        create_new_stage("first.usda")
+        create_new_stage("third.usda")
+        assert [Path(identifier).name for identifier in helperfunctions._stage_cache_ids] == ["first.usda", "third.usda"]
+        assert helperfunctions._get_stage_cache().Size() == 2
+        assert not Sdf.Layer.Find(str(Path("second.usda").resolve()))
+
+    def test_registry_can_be_disabled(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A registry size of zero does not keep any Stage alive."""
+        monkeypatch.setenv("LOUSD_STAGE_CACHE_SIZE", "0")
+        create_new_stage("first.usda")
+        assert not helperfunctions._stage_cache_ids
+        assert helperfunctions._get_stage_cache().Size() == 0
+
+    def test_reload_discards_unsaved_edits(self) -> None:
+        """Reloading a Stage restores the content saved on disk."""
+        stage = create_new_stage("first.usda")
+        UsdGeom.Xform.Define(stage, "/Saved")
+        stage.Save()
+        UsdGeom.Xform.Define(stage, "/Unsaved")
+
+        reloaded_stage = reload_stage("first.usda")
+        assert reloaded_stage.GetPrimAtPath("/Saved")
+        assert not reloaded_stage.GetPrimAtPath("/Unsaved")
+
+    def test_reset_releases_stages(self) -> None:
+        """Resetting the registry releases all the Stages it holds."""
+        create_new_stage("first.usda")
+        reset_stage_cache()
+        assert not helperfunctions._stage_cache_ids
+        assert helperfunctions._get_stage_cache().Size() == 0
+        assert not Sdf.Layer.Find(str(Path("first.usda").resolve()))
+
+
+class TestInMemoryStages:
+    """Tests for the Stages backed by in-memory layers."""
+
+    def test_stage_is_not_written_until_flushed(self, tmp_path: Path) -> None:
+        """In-memory Stages are only written to disk when flushing the dirty layers."""
+        stage = create_new_stage("_assets/first.usda", in_memory=True)
+        UsdGeom.Xform.Define(stage, "/World")
+        assert not (tmp_path / "_assets" / "first.usda").exists()
+
+        assert save_all_dirty_layers() == [str(tmp_path / "_assets" / "first.usda")]
+        assert Sdf.Layer.OpenAsAnonymous(str(tmp_path / "_assets" / "first.usda")).GetPrimAtPath("/World")
+        assert save_all_dirty_layers() == []
+
+    def test_mode_is_enabled_from_environment(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """The `LOUSD_IN_MEMORY_STAGES` environment variable enables the in-memory mode, unless explicitly disabled."""
+        monkeypatch.setenv("LOUSD_IN_MEMORY_STAGES", "1")
+        create_new_stage("first.usda")
+        create_new_stage("second.usda", in_memory=False)
+        assert not (tmp_path / "first.usda").exists()
+        assert (tmp_path / "second.usda").exists()
+
+    def test_references_resolve_to_in_memory_layers(self) -> None:
+        """Layers referencing the location of an in-memory Stage compose its unsaved content."""
+        shapes_stage = create_new_stage("shapes.usda", in_memory=True)
+        UsdGeom.Sphere.Define(shapes_stage, "/Sphere")
+
+        scene_stage = create_new_stage("scene.usda", in_memory=True)
+        scene_stage.DefinePrim("/Shape").GetReferences().AddReference("./shapes.usda", "/Sphere")
+        assert scene_stage.GetPrimAtPath("/Shape").GetTypeName() == "Sphere"
+
+    def test_unsaved_content_survives_eviction(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """In-memory layers are still flushed after their Stage was evicted from the Stage registry."""
+        monkeypatch.setenv("LOUSD_STAGE_CACHE_SIZE", "0")
+        UsdGeom.Xform.Define(create_new_stage("first.usda", in_memory=True), "/World")
+        assert create_new_stage("first.usda").GetPrimAtPath("/World")
+
+        save_all_dirty_layers()
+        assert (tmp_path / "first.usda").exists()
+
+    def test_exit_flush_only_writes_in_memory_layers(self, tmp_path: Path) -> None:
+        """Flushing in-memory layers leaves the unsaved edits of Stages created on disk untouched."""
+        on_disk_stage = create_new_stage("on_disk.usda", in_memory=False)
+        UsdGeom.Xform.Define(on_disk_stage, "/Unsaved")
+        in_memory_stage = create_new_stage("in_memory.usda", in_memory=True)
+
+        assert save_in_memory_layers() == [str(tmp_path / "in_memory.usda")]
+        assert not Sdf.Layer.OpenAsAnonymous(str(tmp_path / "on_disk.usda")).GetPrimAtPath("/Unsaved")
+
+        # Layers created in memory keep being flushed when they are modified after being written:
+        UsdGeom.Xform.Define(in_memory_stage, "/World")
+        assert save_in_memory_layers() == [str(tmp_path / "in_memory.usda")]
+        assert save_in_memory_layers() == []
+
+
+class TestOutputFormat:
+    """Tests for the output format policy of the layers written by the helpers."""
+
+    def test_default_formats(self) -> None:
+        """Teaching layers are written as text, and intermediate layers as crate files."""
+        assert get_output_format(OUTPUT_PURPOSE_TEACHING) == "usda"
+        assert get_output_format(OUTPUT_PURPOSE_INTERMEDIATE) == "usdc"
+
+    def test_format_precedence(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Formats requested for a call take precedence over the global selection, itself preceding the environment."""
+        monkeypatch.setenv("LOUSD_TEACHING_FORMAT", "usdc")
+        assert get_output_format(OUTPUT_PURPOSE_TEACHING) == "usdc"
+
+        set_output_format(OUTPUT_PURPOSE_TEACHING, "usda")
+        assert get_output_format(OUTPUT_PURPOSE_TEACHING) == "usda"
+        assert get_output_format(OUTPUT_PURPOSE_TEACHING, file_format="usdc") == "usdc"
+
+        set_output_format(OUTPUT_PURPOSE_TEACHING, None)
+        assert get_output_format(OUTPUT_PURPOSE_TEACHING) == "usdc"
+
+    def test_unsupported_formats_are_rejected(self) -> None:
+        """Unknown purposes and formats raise a ValueError."""
+        with pytest.raises(ValueError):
+            set_output_format("unknown", "usda")
+        with pytest.raises(ValueError):
+            get_output_format(OUTPUT_PURPOSE_TEACHING, file_format="abc")
+
+    @pytest.mark.parametrize("in_memory", [False, True])
+    def test_stage_format(self, tmp_path: Path, in_memory: bool) -> None:
+        """New `.usd` Stages are written in the requested format."""
+        create_new_stage("text.usd", in_memory=in_memory)
+        create_new_stage("crate.usd", in_memory=in_memory, file_format="usdc")
+        save_all_dirty_layers()
+        assert _read_file_header(tmp_path / "text.usd").startswith(b"#usda")
+        assert _read_file_header(tmp_path / "crate.usd") == b"PXR-USDC"
@@ -133,3 +133,25 @@ class TestNotebookHarness:
         assert nb.only_in_cell_2 is True  # set by cell 2; cell 0 ran first so namespace is shared
         assert nb.status == "finished" # final cell sets status to 'finished'
         assert "only_in_cell_1" not in nb
+
+
+class TestNotebookHarnessInMemory:
+    """Checks for the in-memory Stage mode of the notebook execution harness."""
+
+    NOTEBOOK = "tests/fixtures/harness_in_memory.ipynb"
+
+    def test_stages_are_written_once_the_cells_ran(self, run_notebook):
+        """Stages stay in memory while the cells run, and are written to work_dir afterwards."""
+        nb = run_notebook(self.NOTEBOOK, in_memory=True)
+
+        assert nb.written_during_run is False
+        stage_file = nb._work_dir / "_assets" / "in_memory_stage.usda"
+        assert stage_file.exists()
+        assert "World" in stage_file.read_text()
+
+    def test_stages_are_written_immediately_by_default(self, run_notebook, monkeypatch):
+        """Without the in-memory mode, Stages are created on disk as the cells run."""
+        monkeypatch.delenv("LOUSD_IN_MEMORY_STAGES", raising=False)
+        nb = run_notebook(self.NOTEBOOK)
+
+        assert nb.written_during_run is True
@@ -0,0 +1,74 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the lousd.utils.simplification module."""
+
+import numpy as np
+import pytest
+
+from lousd.utils import tessellation
+from lousd.utils.simplification import simplify_triangles
+
+
+def _sphere_triangles(segments: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Tessellate a unit sphere into triangles, with one vertex for each face-vertex.
+
+    Args:
+        segments: Number of segments around the poles of the sphere.
+
+    Returns:
+        The positions and normals of the vertices, and the vertex indices of the triangles.
+    """
+    mesh_data = tessellation.tessellate_sphere(radius=1.0, segments=segments)
+    triangles = []
+    corner = 0
+    for count in mesh_data.face_vertex_counts:
+        triangles.extend((corner, corner + offset, corner + offset + 1) for offset in range(1, count - 1))
+        corner += count
+    return mesh_data.points[mesh_data.face_vertex_indices], mesh_data.normals, np.array(triangles)
+
+
+class TestSimplifyTriangles:
+    """Tests for the simplification of triangle meshes by vertex clustering."""
+
+    def test_meshes_within_budget_are_unchanged(self) -> None:
+        """Meshes which already fit the budget are returned as is."""
+        positions, normals, triangles = _sphere_triangles(segments=8)
+        simplified = simplify_triangles(positions, triangles, max_triangles=len(triangles), normals=normals)
+        assert simplified.triangles is triangles
+        assert simplified.positions is positions
+
+    @pytest.mark.parametrize("max_triangles", [2000, 500, 100])
+    def test_budget_is_respected(self, max_triangles: int) -> None:
+        """Simplified meshes fit the budget, while keeping a significant part of it."""
+        positions, normals, triangles = _sphere_triangles(segments=128)
+        simplified = simplify_triangles(positions, triangles, max_triangles=max_triangles, normals=normals)
+        assert max_triangles / 4 <= len(simplified.triangles) <= max_triangles
+        assert len(simplified.source_triangles) == len(simplified.triangles)
+
+    def test_shape_is_preserved(self) -> None:
+        """Vertices of the simplified mesh remain close to the surface of the original mesh."""
+        positions, normals, triangles = _sphere_triangles(segments=128)
+        simplified = simplify_triangles(positions, triangles, max_triangles=1000, normals=normals)
+        used_positions = simplified.positions[np.unique(simplified.triangles)]
+        np.testing.assert_allclose(np.linalg.norm(used_positions, axis=1), 1.0, atol=0.05)
+
+    def test_winding_order_is_preserved(self) -> None:
+        """Remaining triangles keep facing outwards."""
+        positions, normals, triangles = _sphere_triangles(segments=64)
+        simplified = simplify_triangles(positions, triangles, max_triangles=500, normals=normals)
+        corners = simplified.positions[simplified.triangles]
+        face_normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+        assert np.mean(np.einsum("ij,ij->i", face_normals, corners.mean(axis=1)) > 0.0) > 0.95
@@ -0,0 +1,163 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the lousd.utils.tessellation module."""
+
+import numpy as np
+import pytest
+from pxr import Usd, UsdGeom
+
+from lousd.utils import tessellation, visualization
+
+
+def _face_normals(mesh_data: tessellation.MeshData) -> np.ndarray:
+    """Compute the normal of each face of a mesh from the winding order of its first three vertices.
+
+    Args:
+        mesh_data: The tessellated mesh.
+
+    Returns:
+        The unnormalized normal of each face.
+    """
+    face_starts = np.concatenate([[0], np.cumsum(mesh_data.face_vertex_counts)[:-1]])
+    corners = [mesh_data.points[mesh_data.face_vertex_indices[face_starts + offset]] for offset in range(3)]
+    return np.cross(corners[1] - corners[0], corners[2] - corners[1])
+
+
+def _face_centers(mesh_data: tessellation.MeshData) -> np.ndarray:
+    """Compute the center of each face of a mesh.
+
+    Args:
+        mesh_data: The tessellated mesh.
+
+    Returns:
+        The average position of the vertices of each face.
+    """
+    face_of_corner = np.repeat(np.arange(len(mesh_data.face_vertex_counts)), mesh_data.face_vertex_counts)
+    sums = np.zeros((len(mesh_data.face_vertex_counts), 3))
+    np.add.at(sums, face_of_corner, mesh_data.points[mesh_data.face_vertex_indices])
+    return sums / mesh_data.face_vertex_counts[:, None]
+
+
+_PRIMITIVES = [
+    pytest.param(lambda: tessellation.tessellate_cube(size=2.0), id="cube"),
+    pytest.param(lambda: tessellation.tessellate_sphere(radius=1.0, segments=16), id="sphere"),
+    pytest.param(lambda: tessellation.tessellate_cylinder(radius=1.0, height=2.0, axis="Y", segments=16), id="cylinder"),
+    pytest.param(lambda: tessellation.tessellate_cone(radius=1.0, height=2.0, axis="X", segments=16), id="cone"),
+]
+
+
+class TestTessellation:
+    """Tests for the procedural tessellation of geometry primitives."""
+
+    @pytest.mark.parametrize("tessellate", _PRIMITIVES)
+    def test_topology_is_consistent(self, tessellate) -> None:
+        """Face-vertex indices reference existing points, with one normal for each face-vertex."""
+        mesh_data = tessellate()
+        assert mesh_data.face_vertex_counts.sum() == len(mesh_data.face_vertex_indices)
+        assert mesh_data.face_vertex_indices.max() < len(mesh_data.points)
+        assert mesh_data.normals.shape == (len(mesh_data.face_vertex_indices), 3)
+        np.testing.assert_allclose(np.linalg.norm(mesh_data.normals, axis=1), 1.0, rtol=1e-5)
+
+    @pytest.mark.parametrize("tessellate", _PRIMITIVES)
+    def test_faces_point_outwards(self, tessellate) -> None:
+        """Faces of the closed, origin-centered primitives are wound counter-clockwise when seen from outside."""
+        mesh_data = tessellate()
+        assert np.all(np.einsum("ij,ij->i", _face_normals(mesh_data), _face_centers(mesh_data)) > 0.0)
+
+    def test_attributes_are_honored(self) -> None:
+        """The radius, height and axis of the primitive drive the generated points and extent."""
+        mesh_data = tessellation.tessellate_cylinder(radius=0.5, height=3.0, axis="Y", segments=32)
+        np.testing.assert_allclose(mesh_data.extent, [(-0.5, -1.5, -0.5), (0.5, 1.5, 0.5)], atol=1e-6)
+
+        mesh_data = tessellation.tessellate_sphere(radius=2.0, segments=32)
+        np.testing.assert_allclose(np.linalg.norm(mesh_data.points, axis=1), 2.0, rtol=1e-6)
+
+    def test_segment_count(self) -> None:
+        """The segment count controls the resolution of the tessellation."""
+        assert len(tessellation.tessellate_cone(radius=1.0, height=2.0, segments=12).face_vertex_counts) == 13
+        assert len(tessellation.tessellate_cylinder(radius=1.0, height=2.0, segments=12).face_vertex_counts) == 14
+        assert len(tessellation.tessellate_sphere(radius=1.0, segments=12).face_vertex_counts) == 12 * 6
+
+    def test_results_are_memoized(self) -> None:
+        """Identical requests share the same read-only result."""
+        first = tessellation.tessellate_sphere(radius=1.0, segments=24)
+        assert tessellation.tessellate_sphere(radius=1.0, segments=24) is first
+        assert not first.points.flags.writeable
+
+
+class TestConvertGeometryPrimitives:
+    """Tests for the conversion of geometry primitives into meshes."""
+
+    def test_primitives_become_meshes(self) -> None:
+        """Geometry primitives are replaced with meshes matching their authored attributes."""
+        stage = Usd.Stage.CreateInMemory()
+        cylinder = UsdGeom.Cylinder.Define(stage, "/Cylinder")
+        cylinder.CreateRadiusAttr(0.25)
+        cylinder.CreateAxisAttr(UsdGeom.Tokens.y)
+        UsdGeom.Cone.Define(stage, "/Cone")
+        layer = stage.Flatten()
+
+        visualization._convert_geometry_primitives(layer=layer, tessellation_segments=8)
+        converted_stage = Usd.Stage.Open(layer)
+        cylinder_mesh = UsdGeom.Mesh(converted_stage.GetPrimAtPath("/Cylinder"))
+        cone_mesh = UsdGeom.Mesh(converted_stage.GetPrimAtPath("/Cone"))
+        assert cylinder_mesh and cone_mesh
+        assert len(cylinder_mesh.GetFaceVertexCountsAttr().Get()) == 10
+        assert cylinder_mesh.GetExtentAttr().Get()[1][1] == pytest.approx(1.0)
+        assert cylinder_mesh.GetExtentAttr().Get()[1][0] == pytest.approx(0.25)
+        assert cylinder_mesh.GetNormalsInterpolation() == UsdGeom.Tokens.faceVarying
+        assert cone_mesh.GetExtentAttr().Get()[1][2] == pytest.approx(1.0)
+
+    def test_identical_primitives_share_a_mesh(self) -> None:
+        """Primitives with identical attributes inherit from the same tessellated mesh."""
+        stage = Usd.Stage.CreateInMemory()
+        for index in range(3):
+            UsdGeom.Sphere.Define(stage, f"/Sphere{index}")
+        UsdGeom.Sphere.Define(stage, "/LargeSphere").CreateRadiusAttr(2.0)
+        layer = stage.Flatten()
+
+        visualization._convert_geometry_primitives(layer=layer)
+        prototype_paths = {
+            tuple(layer.GetPrimAtPath(path).inheritPathList.prependedItems)
+            for path in ("/Sphere0", "/Sphere1", "/Sphere2", "/LargeSphere")
+        }
+        assert len(prototype_paths) == 2
+        assert len(layer.GetPrimAtPath(visualization._MESH_PROTOTYPES_ROOT_PATH).nameChildren) == 2
+
+        converted_stage = Usd.Stage.Open(layer)
+        assert [prim.GetName() for prim in converted_stage.Traverse()] == ["Sphere0", "Sphere1", "Sphere2", "LargeSphere"]
+        large_sphere_points = UsdGeom.Mesh(converted_stage.GetPrimAtPath("/LargeSphere")).GetPointsAttr().Get()
+        assert max(point[2] for point in large_sphere_points) == pytest.approx(2.0)
+
+    def test_time_sampled_primitives_are_animated(self) -> None:
+        """Time-sampled dimensions are baked into animated points, interpolated between the authored time samples."""
+        stage = Usd.Stage.CreateInMemory()
+        cylinder = UsdGeom.Cylinder.Define(stage, "/Cylinder")
+        cylinder.CreateRadiusAttr(0.5)
+        cylinder.CreateHeightAttr().Set(2.0, 0.0)
+        cylinder.GetHeightAttr().Set(4.0, 10.0)
+        layer = stage.Flatten()
+
+        visualization._convert_geometry_primitives(layer=layer, tessellation_segments=8)
+        converted_stage = Usd.Stage.Open(layer)
+        mesh = UsdGeom.Mesh(converted_stage.GetPrimAtPath("/Cylinder"))
+        assert mesh.GetPointsAttr().GetTimeSamples() == [0.0, 10.0]
+        for time_code, half_height in ((0.0, 1.0), (5.0, 1.5), (10.0, 2.0)):
+            points = np.array(mesh.GetPointsAttr().Get(time_code))
+            assert points[:, 2].max() == pytest.approx(half_height)
+            assert np.abs(points[:, 0]).max() == pytest.approx(0.5)
+            assert mesh.GetExtentAttr().Get(time_code)[1][2] == pytest.approx(half_height)
+        assert len(mesh.GetFaceVertexCountsAttr().Get()) == 10
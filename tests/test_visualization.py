@@ -0,0 +1,792 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the lousd.utils.visualization module."""
+
+import base64
+import io
+import json
+import os
+from pathlib import Path
+import subprocess
+import sys
+import threading
+import time
+from typing import Iterator
+import urllib.request
+
+import pytest
+from pxr import Sdf, Usd, UsdGeom, UsdLux
+
+from lousd.utils import gltfexport, visualization
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def conversion_cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Redirect the glTF conversion cache to a temporary directory.
+
+    Args:
+        tmp_path: Pytest's temporary path fixture.
+        monkeypatch: Pytest's monkeypatch fixture.
+
+    Returns:
+        Path to the temporary conversion cache directory.
+    """
+    cache_dir = tmp_path / "glb-cache"
+    monkeypatch.setenv("LOUSD_CONVERSION_CACHE_DIR", str(cache_dir))
+    return cache_dir
+
+
+@pytest.fixture
+def shapes_file(tmp_path: Path) -> Path:
+    """Create a USD file containing a few geometry primitives.
+
+    Args:
+        tmp_path: Pytest's temporary path fixture.
+
+    Returns:
+        Path to the USD file.
+    """
+    file_path = tmp_path / "shapes.usda"
+    stage = Usd.Stage.CreateNew(str(file_path))
+    UsdGeom.Xform.Define(stage, "/World")
+    UsdGeom.Cube.Define(stage, "/World/Cube")
+    UsdGeom.Sphere.Define(stage, "/World/Sphere")
+    stage.Save()
+    return file_path
+
+
+# =============================================================================
+# Tests for the import of the module
+# =============================================================================
+
+
+# Maximum duration allowed for importing the visualization module from a fresh interpreter, in seconds:
+_IMPORT_TIME_BUDGET = 0.25
+
+
+class TestModuleImport:
+    """Tests for the cost of importing the visualization module."""
+
+    def test_import_is_lazy_and_within_budget(self) -> None:
+        """Importing the module loads no vendor module and completes within the import-time budget."""
+        script = (
+            "import json, sys, time\n"
+            "start = time.perf_counter()\n"
+            "import lousd.utils.visualization\n"
+            "elapsed = time.perf_counter() - start\n"
+            "vendor_modules = sorted({name.split('.')[0] for name in sys.modules} & {'IPython', 'numpy', 'pxr'})\n"
+            "print(json.dumps({'elapsed': elapsed, 'vendor_modules': vendor_modules}))\n"
+        )
+        result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+        report = json.loads(result.stdout)
+        assert report["vendor_modules"] == []
+        assert report["elapsed"] < _IMPORT_TIME_BUDGET
+
+
+# =============================================================================
+# Tests for the conversion cache
+# =============================================================================
+
+
+class TestConversionCache:
+    """Tests for the content-addressed glTF conversion cache."""
+
+    def test_cache_key_is_stable(self, shapes_file: Path) -> None:
+        """The same file and options produce the same key."""
+        first_key = visualization._compute_conversion_cache_key(str(shapes_file), show_usd_lights=False)
+        second_key = visualization._compute_conversion_cache_key(str(shapes_file), show_usd_lights=False)
+        assert first_key == second_key
+
+    def test_cache_key_depends_on_options(self, shapes_file: Path) -> None:
+        """Changing a conversion option changes the key."""
+        without_lights = visualization._compute_conversion_cache_key(str(shapes_file), show_usd_lights=False)
+        with_lights = visualization._compute_conversion_cache_key(str(shapes_file), show_usd_lights=True)
+        assert without_lights != with_lights
+
+    def test_cache_key_depends_on_unsaved_edits(self, shapes_file: Path) -> None:
+        """Unsaved edits to a layer of the stage change the key."""
+        stage = Usd.Stage.Open(str(shapes_file))
+        original_key = visualization._compute_conversion_cache_key(str(shapes_file))
+        UsdGeom.Cone.Define(stage, "/World/Cone")
+        assert visualization._compute_conversion_cache_key(str(shapes_file)) != original_key
+
+    def test_cache_key_depends_on_referenced_layers(self, tmp_path: Path, shapes_file: Path) -> None:
+        """Editing a referenced layer changes the key of the referencing file."""
+        scene_path = tmp_path / "scene.usda"
+        scene_stage = Usd.Stage.CreateNew(str(scene_path))
+        scene_stage.DefinePrim("/Shapes").GetReferences().AddReference("./shapes.usda", "/World")
+        scene_stage.Save()
+        original_key = visualization._compute_conversion_cache_key(str(scene_path))
+
+        shapes_stage = Usd.Stage.Open(str(shapes_file))
+        UsdGeom.Cone.Define(shapes_stage, "/World/Cone")
+        shapes_stage.Save()
+        assert visualization._compute_conversion_cache_key(str(scene_path)) != original_key
+
+    def test_cached_conversion_is_reused(
+        self, shapes_file: Path, conversion_cache_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A second conversion of an unchanged file is served from the cache."""
+        output_file_path = visualization.CovertFile(str(shapes_file))
+        assert Path(output_file_path).is_file()
+        assert len(list(conversion_cache_dir.glob("*.glb"))) == 1
+
+        def _fail_flatten(*args, **kwargs):
+            raise AssertionError("The USD file should not be flattened for a cached conversion")
+
+        monkeypatch.setattr(visualization, "_flatten_and_convert_layer", _fail_flatten)
+        Path(output_file_path).unlink()
+        assert visualization.CovertFile(str(shapes_file)) == output_file_path
+        assert Path(output_file_path).is_file()
+
+    def test_failed_fallback_is_not_cached(
+        self, shapes_file: Path, conversion_cache_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A failed `usd2gltf` conversion raises, removing the stale glTF file and caching nothing."""
+        stale_file_path = shapes_file.with_suffix(".glb")
+        stale_file_path.write_bytes(b"stale")
+
+        def _unsupported(*args, **kwargs):
+            raise gltfexport.UnsupportedContentError("unsupported")
+
+        def _fail_usd2gltf(args, **kwargs):
+            return subprocess.CompletedProcess(args=args, returncode=1, stdout=b"", stderr=b"conversion failed")
+
+        monkeypatch.setattr(gltfexport, "export_stage_to_glb", _unsupported)
+        monkeypatch.setattr(subprocess, "run", _fail_usd2gltf)
+        with pytest.raises(RuntimeError, match="conversion failed"):
+            visualization.CovertFile(str(shapes_file))
+        assert not stale_file_path.exists()
+        assert list(conversion_cache_dir.glob("*.glb")) == []
+
+    def test_fallback_input_holds_no_mesh_prototype(
+        self, shapes_file: Path, conversion_cache_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The scene given to `usd2gltf` has no abstract prototype nor inherit arc, which it would export as nodes."""
+        fallback_inputs = []
+
+        def _unsupported(*args, **kwargs):
+            raise gltfexport.UnsupportedContentError("unsupported")
+
+        def _usd2gltf(args, **kwargs):
+            input_file_path, output_file_path = args[args.index("--input") + 1], args[args.index("--output") + 1]
+            fallback_inputs.append(Usd.Stage.Open(Sdf.Layer.OpenAsAnonymous(input_file_path)))
+            Path(output_file_path).write_bytes(b"glTF")
+            return subprocess.CompletedProcess(args=args, returncode=0, stdout=b"", stderr=b"")
+
+        monkeypatch.setattr(gltfexport, "export_stage_to_glb", _unsupported)
+        monkeypatch.setattr(subprocess, "run", _usd2gltf)
+        visualization.CovertFile(str(shapes_file))
+
+        stage = fallback_inputs[0]
+        assert [str(prim.GetPath()) for prim in stage.GetPseudoRoot().GetAllChildren()] == ["/World"]
+        for path in ("/World/Cube", "/World/Sphere"):
+            prim = stage.GetPrimAtPath(path)
+            assert prim.GetTypeName() == "Mesh" and prim.IsActive()
+            assert not prim.HasAuthoredInherits()
+            assert len(UsdGeom.Mesh(prim).GetPointsAttr().Get()) > 0
+
+    def test_converted_files_are_readable_by_everyone(self, shapes_file: Path, conversion_cache_dir: Path) -> None:
+        """Converted and cached glTF files get the permissions of files created with `open`, not owner-only ones."""
+        visualization.CovertFile(str(shapes_file))
+        reference_file_path = shapes_file.with_name("reference.txt")
+        reference_file_path.write_bytes(b"")
+        for glb_file_path in [shapes_file.with_suffix(".glb"), *conversion_cache_dir.glob("*.glb")]:
+            assert glb_file_path.stat().st_mode == reference_file_path.stat().st_mode
+
+
+# =============================================================================
+# Tests for the flattening process
+# =============================================================================
+
+
+class TestFlattenAndConvert:
+    """Tests for the in-memory flattening and conversion of USD scenes."""
+
+    def test_conversion_writes_no_intermediate_file(self, shapes_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Converting a USD file only writes the resulting glTF file next to it."""
+        monkeypatch.delenv("LOUSD_KEEP_INTERMEDIATE_FILES", raising=False)
+        visualization.CovertFile(str(shapes_file), use_cache=False)
+        assert sorted(path.name for path in shapes_file.parent.iterdir()) == ["shapes.glb", "shapes.usda"]
+
+    def test_intermediate_files_can_be_kept(self, shapes_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """The converted USD scene is written next to the USD file when debugging the conversion."""
+        monkeypatch.setenv("LOUSD_KEEP_INTERMEDIATE_FILES", "1")
+        visualization.CovertFile(str(shapes_file), use_cache=False)
+        flattened_stage = Usd.Stage.Open(str(shapes_file.parent / "shapes_flattened.usda"))
+        assert flattened_stage.GetPrimAtPath("/World/Sphere").GetTypeName() == "Mesh"
+
+    def test_lights_are_hidden_unless_requested(self, tmp_path: Path) -> None:
+        """USD Lights are converted into Xforms unless they are requested to be shown."""
+        file_path = tmp_path / "lights.usda"
+        stage = Usd.Stage.CreateNew(str(file_path))
+        UsdLux.SphereLight.Define(stage, "/SphereLight")
+        UsdLux.MeshLightAPI.Apply(UsdGeom.Mesh.Define(stage, "/MeshLight").GetPrim())
+        stage.Save()
+
+        hidden_lights = Usd.Stage.Open(visualization._flatten_and_convert_layer(str(file_path)))
+        assert hidden_lights.GetPrimAtPath("/SphereLight").GetTypeName() == "Xform"
+        assert hidden_lights.GetPrimAtPath("/MeshLight").GetTypeName() == "Xform"
+
+        shown_lights = Usd.Stage.Open(visualization._flatten_and_convert_layer(str(file_path), show_usd_lights=True))
+        assert shown_lights.GetPrimAtPath("/SphereLight").GetTypeName() == "SphereLight"
+
+    def test_flattened_file_format(self, shapes_file: Path) -> None:
+        """Flattened files are written as crate files by default, unless another format is requested."""
+        flattened_file_path = visualization.FlattenFile(str(shapes_file))
+        assert flattened_file_path == str(shapes_file.parent / "shapes_flattened.usd")
+        with open(flattened_file_path, "rb") as f:
+            assert f.read(8) == b"PXR-USDC"
+
+        visualization.FlattenFile(str(shapes_file), file_format="usda")
+        with open(flattened_file_path, "rb") as f:
+            assert f.read(5) == b"#usda"
+
+
+class TestPreviewQuality:
+    """Tests for the simplified previews of USD scenes."""
+
+    def test_preview_is_converted_separately(self, shapes_file: Path, conversion_cache_dir: Path) -> None:
+        """Previews are written next to the full resolution glTF file, and cached separately."""
+        preview_file_path = visualization.CovertFile(str(shapes_file), max_triangles=100)
+        full_file_path = visualization.CovertFile(str(shapes_file))
+        assert preview_file_path == str(shapes_file.parent / "shapes_preview.glb")
+        assert Path(preview_file_path).stat().st_size < Path(full_file_path).stat().st_size
+        assert len(list(conversion_cache_dir.glob("*.glb"))) == 2
+
+    @staticmethod
+    def _render_full_resolution_source(
+        display_function, shapes_file: Path, monkeypatch: pytest.MonkeyPatch, **kwargs
+    ) -> str:
+        """Render a preview offering its full resolution model, and return the source of the full resolution model.
+
+        Args:
+            display_function: `DisplaySingleUSD` or `DisplayUSD`.
+            shapes_file: Path to the USD file to display.
+            monkeypatch: Pytest's monkeypatch fixture.
+            **kwargs: Additional arguments of the display function.
+
+        Returns:
+            The `data-src` attribute of the button loading the full resolution model.
+        """
+        monkeypatch.setattr(visualization, "_display_html", lambda render_html, **_: render_html())
+        rendered_html = display_function(str(shapes_file), preview_quality=100, load_full_on_demand=True, **kwargs)
+        return rendered_html.split('data-src="', 1)[1].split('"', 1)[0]
+
+    @pytest.mark.parametrize("display_function", [visualization.DisplaySingleUSD, visualization.DisplayUSD])
+    def test_full_resolution_is_never_inlined(
+        self,
+        display_function,
+        shapes_file: Path,
+        tmp_path: Path,
+        conversion_cache_dir: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """In embed mode, full resolution models are shared from the `_static` directory rather than inlined."""
+        static_directory = tmp_path / "docs" / "_static"
+        page_directory = tmp_path / "docs" / "lesson"
+        static_directory.mkdir(parents=True)
+        page_directory.mkdir()
+        monkeypatch.delenv("LOUSD_STATIC_DIR", raising=False)
+        monkeypatch.chdir(page_directory)
+
+        full_resolution_source = self._render_full_resolution_source(
+            display_function, shapes_file, monkeypatch, embed_glb=True, embed_max_bytes=1024 * 1024
+        )
+        assert not full_resolution_source.startswith("data:")
+        assert full_resolution_source.startswith("../_static/glb/")
+        assert (page_directory / full_resolution_source).read_bytes()[:4] == b"glTF"
+
+    def test_full_resolution_is_converted_in_background(
+        self, shapes_file: Path, conversion_cache_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """In live Notebooks, full resolution models are converted in the background, next to the USD file."""
+        monkeypatch.delenv("LOUSD_EMBED_GLB", raising=False)
+        full_resolution_source = self._render_full_resolution_source(
+            visualization.DisplaySingleUSD, shapes_file, monkeypatch
+        )
+        assert full_resolution_source == str(shapes_file.parent / "shapes.glb")
+
+        for thread in threading.enumerate():
+            if thread.name == "lousd-full-resolution":
+                thread.join(timeout=60)
+        assert Path(full_resolution_source).read_bytes()[:4] == b"glTF"
+
+    def test_preview_qualities(self) -> None:
+        """Preview qualities map onto triangle budgets, unknown qualities being rejected."""
+        assert visualization._get_preview_max_triangles(None) is None
+        assert visualization._get_preview_max_triangles("full") is None
+        assert visualization._get_preview_max_triangles(1234) == 1234
+        assert visualization._get_preview_max_triangles("low") < visualization._get_preview_max_triangles("high")
+        with pytest.raises(ValueError):
+            visualization._get_preview_max_triangles("ultra")
+
+
+class TestBoundsMode:
+    """Tests for the display of USD scenes as the bounding boxes of their components."""
+
+    def test_bounds_are_converted_separately(self, shapes_file: Path, conversion_cache_dir: Path) -> None:
+        """Bounds are written next to the USD file, and cached separately from its meshes."""
+        bounds_file_path = visualization._convert_file_to_bounds(str(shapes_file))
+        assert bounds_file_path == str(shapes_file.parent / "shapes_bounds.glb")
+        assert Path(bounds_file_path).read_bytes()[:4] == b"glTF"
+        assert len(list(conversion_cache_dir.glob("*.glb"))) == 1
+        assert visualization._convert_file_to_bounds(str(shapes_file)) == bounds_file_path
+
+    def test_unknown_mode_is_rejected(self, shapes_file: Path) -> None:
+        """Unknown display modes are rejected before any conversion."""
+        with pytest.raises(ValueError):
+            visualization.DisplayUSD(str(shapes_file), mode="wireframe")
+
+
+# =============================================================================
+# Tests for the conversion of multiple files
+# =============================================================================
+
+
+def _save_scenes(directory: Path, names: list[str], prim_count: int) -> list[str]:
+    """Save USD scenes made of spheres of various sizes, each under its own transform.
+
+    Args:
+        directory: Directory in which to save the scenes.
+        names: Names of the scenes.
+        prim_count: Number of spheres in each scene.
+
+    Returns:
+        The paths of the saved USD files.
+    """
+    usd_filenames = []
+    for name in names:
+        file_path = directory / f"{name}.usda"
+        stage = Usd.Stage.CreateNew(str(file_path))
+        for index in range(prim_count):
+            xform = UsdGeom.Xform.Define(stage, f"/{name}/Xform{index}")
+            xform.AddTranslateOp().Set((float(index), 0.0, 0.0))
+            UsdGeom.Sphere.Define(stage, f"/{name}/Xform{index}/Sphere").CreateRadiusAttr(0.1 + index * 0.001)
+        stage.Save()
+        usd_filenames.append(str(file_path))
+    return usd_filenames
+
+
+class TestConvertFiles:
+    """Tests for the concurrent conversion of multiple USD files."""
+
+    def test_results_follow_input_order(self, tmp_path: Path, conversion_cache_dir: Path) -> None:
+        """Results are returned in input order, with failures reported in place of their glTF file."""
+        usd_filenames = []
+        for name in ("first", "second", "third"):
+            file_path = tmp_path / f"{name}.usda"
+            stage = Usd.Stage.CreateNew(str(file_path))
+            UsdGeom.Cube.Define(stage, f"/{name}")
+            stage.Save()
+            usd_filenames.append(str(file_path))
+        usd_filenames.insert(1, str(tmp_path / "missing.usda"))
+        usd_filenames.append(usd_filenames[0])
+
+        results = visualization._convert_files(usd_filenames, max_workers=4)
+        assert isinstance(results[1], Exception)
+        assert [Path(result).name for result in results if isinstance(result, str)] == [
+            "first.glb", "second.glb", "third.glb", "first.glb"
+        ]
+
+    def test_saved_files_are_converted_by_workers(
+        self, tmp_path: Path, conversion_cache_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Files saved on disk are converted by worker processes rather than by the current process."""
+        usd_filenames = _save_scenes(tmp_path, ["first", "second"], prim_count=1)
+
+        def _fail_convert(*args, **kwargs):
+            raise AssertionError("Saved files should be converted by worker processes")
+
+        monkeypatch.setattr(visualization, "CovertFile", _fail_convert)
+        results = visualization._convert_files(usd_filenames, max_workers=2)
+        assert [Path(result).name for result in results] == ["first.glb", "second.glb"]
+
+    def test_unsaved_edits_are_converted_in_process(
+        self, tmp_path: Path, conversion_cache_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Files with unsaved edits, which worker processes would not see, are converted by the current process."""
+        usd_filenames = _save_scenes(tmp_path, ["first", "second"], prim_count=1)
+        stages = [Usd.Stage.Open(usd_filename) for usd_filename in usd_filenames]
+        for stage in stages:
+            UsdGeom.Sphere.Define(stage, "/Unsaved")
+        assert visualization._has_unsaved_edits(usd_filenames[0])
+
+        def _fail_pool(*args, **kwargs):
+            raise AssertionError("Files with unsaved edits should not be converted by worker processes")
+
+        monkeypatch.setattr(visualization, "ProcessPoolExecutor", _fail_pool)
+        results = visualization._convert_files(usd_filenames, max_workers=2)
+        assert [Path(result).name for result in results] == ["first.glb", "second.glb"]
+
+    @pytest.mark.skipif((os.cpu_count() or 1) < 4, reason="Measuring the concurrency gain requires 4 CPU cores")
+    def test_workers_convert_files_concurrently(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Benchmark: converting scenes on worker processes is faster than converting them one after the other."""
+        usd_filenames = _save_scenes(tmp_path, ["first", "second", "third", "fourth"], prim_count=600)
+
+        durations = []
+        for max_workers in (1, 4):
+            monkeypatch.setenv("LOUSD_CONVERSION_CACHE_DIR", str(tmp_path / f"glb-cache-{max_workers}"))
+            start_time = time.perf_counter()
+            results = visualization._convert_files(usd_filenames, max_workers=max_workers)
+            durations.append(time.perf_counter() - start_time)
+            assert all(isinstance(result, str) for result in results)
+        serial_duration, concurrent_duration = durations
+        assert concurrent_duration < serial_duration * 0.75, (
+            f"Concurrent conversion took {concurrent_duration:.2f}s, against {serial_duration:.2f}s serially"
+        )
+
+
+# =============================================================================
+# Tests for the display of visualizations
+# =============================================================================
+
+
+class TestDisplayHtml:
+    """Tests for the immediate and background display of rendered HTML content."""
+
+    def test_background_rendering_updates_placeholder(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A placeholder is displayed immediately, then replaced with the rendered content."""
+        from IPython.display import DisplayHandle
+
+        updates = []
+        monkeypatch.setattr(DisplayHandle, "update", lambda self, obj, **kwargs: updates.append(obj.data))
+        rendering_allowed = threading.Event()
+
+        def _render_html() -> str:
+            rendering_allowed.wait(timeout=10)
+            return "<p>Rendered</p>"
+
+        display_handle = visualization._display_html(
+            render_html=_render_html,
+            background=True,
+            placeholder_html="<p>Placeholder</p>",
+        )
+        assert isinstance(display_handle, DisplayHandle)
+        assert updates == []
+
+        rendering_allowed.set()
+        for thread in threading.enumerate():
+            if thread.name == "lousd-display":
+                thread.join(timeout=10)
+        assert updates == ["<p>Rendered</p>"]
+
+    def test_background_rendering_reports_errors(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Errors raised while rendering in the background replace the placeholder."""
+        from IPython.display import DisplayHandle
+
+        updates = []
+        monkeypatch.setattr(DisplayHandle, "update", lambda self, obj, **kwargs: updates.append(obj.data))
+
+        def _render_html() -> str:
+            raise RuntimeError("Conversion <failed>")
+
+        visualization._display_html(render_html=_render_html, background=True, placeholder_html="")
+        for thread in threading.enumerate():
+            if thread.name == "lousd-display":
+                thread.join(timeout=10)
+        assert len(updates) == 1 and "Conversion &lt;failed&gt;" in updates[0]
+
+
+# =============================================================================
+# Tests for the embedding of glTF files
+# =============================================================================
+
+
+class TestModelSource:
+    """Tests for the source of the glTF files displayed by `<model-viewer>` elements."""
+
+    @pytest.fixture
+    def glb_file(self, tmp_path: Path) -> Path:
+        """Create a placeholder glTF file.
+
+        Args:
+            tmp_path: Pytest's temporary path fixture.
+
+        Returns:
+            Path to the glTF file.
+        """
+        file_path = tmp_path / "model.glb"
+        file_path.write_bytes(b"glTF" + bytes(60))
+        return file_path
+
+    def test_files_are_linked_by_default(self, glb_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Without embed mode, the glTF file is linked from its location."""
+        monkeypatch.delenv("LOUSD_EMBED_GLB", raising=False)
+        assert visualization._get_model_source(str(glb_file)) == str(glb_file)
+
+    def test_small_files_are_inlined(self, glb_file: Path) -> None:
+        """glTF files under the size threshold are inlined as data URIs."""
+        model_source = visualization._get_model_source(str(glb_file), embed_glb=True, embed_max_bytes=1024)
+        assert model_source.startswith("data:model/gltf-binary;base64,Z2xURg")
+
+    def test_large_files_are_shared(
+        self, glb_file: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """glTF files over the size threshold are shared from the `_static` directory under a content-hashed name."""
+        static_directory = tmp_path / "docs" / "_static"
+        page_directory = tmp_path / "docs" / "lesson"
+        static_directory.mkdir(parents=True)
+        page_directory.mkdir()
+        monkeypatch.delenv("LOUSD_STATIC_DIR", raising=False)
+        monkeypatch.chdir(page_directory)
+
+        model_source = visualization._get_model_source(str(glb_file), embed_glb=True, embed_max_bytes=16)
+        assert model_source.startswith("../_static/glb/") and model_source.endswith(".glb")
+        assert (page_directory / model_source).read_bytes() == glb_file.read_bytes()
+
+        copied_glb_file = tmp_path / "copy.glb"
+        copied_glb_file.write_bytes(glb_file.read_bytes())
+        assert visualization._get_model_source(str(copied_glb_file), embed_glb=True, embed_max_bytes=16) == model_source
+
+
+# =============================================================================
+# Tests for the code visualizer
+# =============================================================================
+
+
+class TestCodeVisualizer:
+    """Tests for the paged display of USDA code."""
+
+    @pytest.fixture
+    def large_usda_file(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+        """Create a USDA file made of many root prims, with chunks written to a temporary static directory as when
+        building the documentation.
+
+        Args:
+            tmp_path: Pytest's temporary path fixture.
+            monkeypatch: Pytest's monkeypatch fixture.
+
+        Returns:
+            Path to the USDA file.
+        """
+        monkeypatch.setenv("LOUSD_DOCS_BUILD", "1")
+        monkeypatch.setenv("LOUSD_STATIC_DIR", str(tmp_path / "_static"))
+        monkeypatch.chdir(tmp_path)
+        stage = Usd.Stage.CreateInMemory()
+        for index in range(50):
+            UsdGeom.Cube.Define(stage, f"/Cube{index}").CreateSizeAttr(2.0)
+        file_path = tmp_path / "large.usda"
+        stage.GetRootLayer().Export(str(file_path))
+        return file_path
+
+    def test_small_files_are_inlined(self, shapes_file: Path) -> None:
+        """Files shorter than a page are inlined in full, without any outline or chunk."""
+        rendered_html = visualization._render_html_code_visualizer(str(shapes_file), viewer_id="viewer")
+        assert "Sphere" in rendered_html
+        assert "code-outline" not in rendered_html
+        assert "const chunkSources = [];" in rendered_html
+
+    def test_large_files_are_paged(self, large_usda_file: Path) -> None:
+        """Only the first lines are inlined, followed by an outline of root prims and chunks loaded on demand."""
+        line_count = len(large_usda_file.read_text().splitlines())
+        rendered_html = visualization._render_html_code_visualizer(
+            str(large_usda_file), viewer_id="viewer", max_lines=40
+        )
+        assert "Cube0" in rendered_html and "Cube49&quot;</code>" not in rendered_html
+        assert f"Outline: 50 root prims, {line_count} lines" in rendered_html
+        assert 'def Cube &quot;Cube49&quot;' in rendered_html
+
+        chunk_sources = json.loads(rendered_html.split("const chunkSources = ")[1].split(";\n")[0])
+        assert len(chunk_sources) == -(-(line_count - 40) // 40)
+        chunks = "".join((large_usda_file.parent / source).read_text() for source in chunk_sources)
+        assert "".join(large_usda_file.read_text().splitlines(keepends=True)[40:]) == chunks
+        assert all(source.startswith("_static/code/") for source in chunk_sources)
+
+    def test_chunks_are_inlined_in_live_notebooks(self, large_usda_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Outside of documentation builds, chunks are inlined as data URIs rather than written next to the assets."""
+        monkeypatch.delenv("LOUSD_DOCS_BUILD")
+        rendered_html = visualization._render_html_code_visualizer(
+            str(large_usda_file), viewer_id="viewer", max_lines=40
+        )
+        chunk_sources = json.loads(rendered_html.split("const chunkSources = ")[1].split(";\n")[0])
+        prefix = "data:text/plain;charset=utf-8;base64,"
+        assert chunk_sources and all(source.startswith(prefix) for source in chunk_sources)
+        chunks = "".join(base64.b64decode(source[len(prefix):]).decode("utf-8") for source in chunk_sources)
+        assert "".join(large_usda_file.read_text().splitlines(keepends=True)[40:]) == chunks
+        assert sorted(path.name for path in large_usda_file.parent.iterdir()) == ["large.usda"]
+
+    def test_highlighting_is_skipped_for_large_files(
+        self, large_usda_file: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Syntax highlighting is skipped for files larger than the configured threshold."""
+        assert "const highlight = true;" in visualization._render_html_code_visualizer(str(large_usda_file), "viewer")
+        monkeypatch.setenv("LOUSD_CODE_HIGHLIGHT_MAX_BYTES", "1024")
+        assert "const highlight = false;" in visualization._render_html_code_visualizer(str(large_usda_file), "viewer")
+
+    def test_crate_files_are_exported_to_text(self, tmp_path: Path, shapes_file: Path) -> None:
+        """Binary crate files are displayed as USDA text rather than as an error."""
+        crate_file_path = tmp_path / "shapes.usdc"
+        Sdf.Layer.FindOrOpen(str(shapes_file)).Export(str(crate_file_path))
+        lines = visualization._read_code_lines(str(crate_file_path))
+        assert lines[0].startswith("#usda")
+        assert any('def Sphere "Sphere"' in line for line in lines)
+
+    def test_views_of_stages_and_layers(self) -> None:
+        """In-memory Stages and Layers can be displayed as their root Layer, flattened, or as a prim subtree."""
+        stage = Usd.Stage.CreateInMemory()
+        UsdGeom.Cube.Define(stage, "/World/Cube")
+        UsdGeom.Sphere.Define(stage, "/Other")
+        Sdf.CreatePrimInLayer(stage.GetSessionLayer(), "/Session").specifier = Sdf.SpecifierDef
+
+        assert "Other" in "".join(visualization._read_code_lines(stage.GetRootLayer()))
+        assert "Session" in "".join(visualization._read_code_lines(stage, view="flattened"))
+        subtree = "".join(visualization._read_code_lines(stage, view="subtree", prim_path="/World/Cube"))
+        assert 'def Cube "Cube"' in subtree and "Other" not in subtree
+        assert "No prim" in "".join(visualization._read_code_lines(stage, view="subtree", prim_path="/Missing"))
+        with pytest.raises(ValueError):
+            visualization._read_code_lines(stage, view="subtree")
+        with pytest.raises(ValueError):
+            visualization._read_code_lines(stage, view="composed")
+
+    def test_text_is_capped(self, large_usda_file: Path) -> None:
+        """Text larger than the size cap is truncated at a line boundary."""
+        lines = visualization._read_code_lines(str(large_usda_file), max_bytes=1000)
+        assert sum(len(line) for line in lines[:-1]) <= 1000
+        assert lines[-1].startswith("# ... truncated")
+
+    def test_text_is_capped_in_bytes(self, tmp_path: Path) -> None:
+        """The size cap counts encoded bytes rather than characters, so multi-byte text never exceeds it."""
+        file_path = tmp_path / "unicode.usda"
+        file_path.write_text("#usda 1.0\n" + "".join(f'# {"é" * 40} {index}\n' for index in range(100)), "utf-8")
+        lines = visualization._read_code_lines(str(file_path), max_bytes=1000)
+        assert len("".join(lines[:-1]).encode("utf-8")) <= 1000
+        assert "".join(lines[:-1]).endswith("\n") and "\ufffd" not in "".join(lines)
+        assert lines[-1].startswith("# ... truncated")
+
+# =============================================================================
+# Tests for the injection of shared assets
+# =============================================================================
+
+
+class TestSharedAssets:
+    """Tests for the one-time injection of the stylesheets and scripts shared by visualizations."""
+
+    @pytest.fixture(autouse=True)
+    def reset_shared_assets(self, monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+        """Start each test without any shared asset injected nor vendored.
+
+        Args:
+            monkeypatch: Pytest's monkeypatch fixture.
+        """
+        monkeypatch.delenv("LOUSD_VENDORED_ASSETS_DIR", raising=False)
+        monkeypatch.setattr(visualization, "_vendored_assets_directory", None)
+        visualization.ResetSharedAssets()
+        yield
+        visualization.ResetSharedAssets()
+
+    def test_assets_are_injected_once(self) -> None:
+        """Shared assets are only emitted by the first visualization requiring them."""
+        first_assets = visualization._render_html_shared_assets(visualization._VIEWER_ASSETS)
+        assert "model-viewer.min.js" in first_assets
+        assert visualization._render_html_shared_assets(visualization._VIEWER_ASSETS) == ""
+
+        grid_assets = visualization._render_html_shared_assets(visualization._GRID_ASSETS)
+        assert "bootstrap.min.css" in grid_assets
+        assert "model-viewer.min.js" not in grid_assets
+
+    def test_reset_injects_assets_again(self) -> None:
+        """Resetting the registry makes the next visualization emit the shared assets again."""
+        visualization._render_html_shared_assets(visualization._CODE_ASSETS)
+        visualization.ResetSharedAssets()
+        assert "highlight.min.js" in visualization._render_html_shared_assets(visualization._CODE_ASSETS)
+
+    def test_vendored_assets_are_inlined(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Vendored copies of the shared assets are inlined rather than loaded from their CDN."""
+        (tmp_path / "model-viewer.min.js").write_text("const marker = '</script>';")
+        monkeypatch.setenv("LOUSD_VENDORED_ASSETS_DIR", str(tmp_path))
+
+        shared_assets = visualization._render_html_shared_assets(["model-viewer"])
+        assert "unpkg.com" not in shared_assets
+        assert "const marker = '<\\/script>';" in shared_assets
+
+    def test_assets_are_vendored_readable_by_everyone(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Downloaded assets get the permissions of files created with `open`, so that they can be served."""
+        monkeypatch.setattr(urllib.request, "urlopen", lambda url: io.BytesIO(f"/* {url} */".encode("utf-8")))
+        directory = Path(visualization.VendorSharedAssets(str(tmp_path / "assets")))
+        reference_file_path = tmp_path / "reference.txt"
+        reference_file_path.write_bytes(b"")
+        asset_paths = list(directory.iterdir())
+        assert len(asset_paths) == len(visualization._SHARED_ASSET_SOURCES)
+        for asset_path in asset_paths:
+            assert asset_path.stat().st_mode == reference_file_path.stat().st_mode
+
+
+# =============================================================================
+# Tests for the scene statistics
+# =============================================================================
+
+
+class TestStageStats:
+    """Tests for the statistics reported about the content of USD Stages."""
+
+    @pytest.fixture
+    def instanced_file(self, tmp_path: Path) -> Path:
+        """Create a USD file with instanced spheres and a point instancer.
+
+        Args:
+            tmp_path: Pytest's temporary directory fixture.
+
+        Returns:
+            Path to the created USD file.
+        """
+        file_path = tmp_path / "instanced.usda"
+        stage = Usd.Stage.CreateNew(str(file_path))
+        stage.DefinePrim("/Prototype", "Xform").SetSpecifier(Sdf.SpecifierClass)
+        UsdGeom.Sphere.Define(stage, "/Prototype/Sphere")
+        for index in range(4):
+            instance = UsdGeom.Xform.Define(stage, f"/World/Instance{index}").GetPrim()
+            instance.GetReferences().AddInternalReference("/Prototype")
+            instance.SetInstanceable(True)
+        UsdGeom.PointInstancer.Define(stage, "/World/Points").CreateProtoIndicesAttr([0] * 10)
+        stage.Save()
+        return file_path
+
+    def test_instancing_is_quantified(self, instanced_file: Path) -> None:
+        """Instances share the Prims of their prototype, which are counted once."""
+        stats = visualization._compute_stage_stats(str(instanced_file))
+        assert stats["instances"] == 4
+        assert stats["prototypes"] == 1
+        assert stats["prim_types"]["Sphere"] == 1
+        assert stats["expanded_prims"] - stats["populated_prims"] == 4 - 2
+        assert stats["point_instancers"] == 1
+        assert stats["point_instances"] == 10
+        assert set(stats["timings"]) == {"open", "traverse", "flatten"}
+
+    def test_opening_is_only_measured_for_files(self, instanced_file: Path) -> None:
+        """Opening is not measured for Stages which are already open, and flattening can be skipped."""
+        stats = visualization._compute_stage_stats(Usd.Stage.Open(str(instanced_file)), flatten=False)
+        assert set(stats["timings"]) == {"traverse"}
+
+    def test_memory_is_unknown_without_psutil(self, instanced_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Without `psutil`, memory is reported as unknown rather than approximated by peak figures."""
+        assert visualization._get_process_memory() > 0
+        monkeypatch.setitem(sys.modules, "psutil", None)
+        stats = visualization._compute_stage_stats(str(instanced_file))
+        assert set(stats["memory"].values()) == {None}
+        assert "<td class=\"text-end\">n/a</td>" in visualization._render_html_stage_stats(stats)
+
+    def test_table_is_rendered(self, instanced_file: Path) -> None:
+        """Statistics are rendered as an HTML table."""
+        table_html = visualization._render_html_stage_stats(visualization._compute_stage_stats(str(instanced_file)))
+        assert "<table" in table_html
+        assert "Point instances" in table_html
+        assert "Sphere" in table_html